@@ -1,11 +1,20 @@
 # API/GptAPI.py
-from openai import OpenAI
+from typing import AsyncIterator
+
+from openai import AsyncOpenAI, OpenAI
 from .config import load_openai_key, load_openai_model
 
 class GptAPI:
-    def __init__(self, model: str | None = None, temperature: float = 0.0, max_tokens: int = 2000):
+    def __init__(
+        self,
+        model: str | None = None,
+        temperature: float = 0.0,
+        max_tokens: int = 2000,
+        timeout: float | None = None,
+    ):
         key = load_openai_key()
-        self.client = OpenAI(api_key=key)
+        # timeout=None이면 openai 기본값(10분)을 따른다
+        self.client = OpenAI(api_key=key) if timeout is None else OpenAI(api_key=key, timeout=timeout)
         self.model = model or load_openai_model()
         self.temperature = temperature
         self.max_tokens = max_tokens
@@ -34,4 +43,59 @@ class GptAPI:
         )
 
     def call_gpt(self, prompt: str) -> str | None:
-        return self.generate_response(prompt)
\ No newline at end of file
+        return self.generate_response(prompt)
+
+
+class AsyncGptAPI:
+    """asyncio 버전. 이벤트 루프를 막지 않고 호출하며, 재시도 없이 timeout(초)에서 끊는다."""
+
+    def __init__(
+        self,
+        model: str | None = None,
+        temperature: float = 0.0,
+        max_tokens: int = 2000,
+        timeout: float = 10.0,
+    ):
+        key = load_openai_key()
+        self.client = AsyncOpenAI(api_key=key, timeout=timeout, max_retries=0)
+        self.model = model or load_openai_model()
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+
+    async def chat(self, system: str, user: str) -> str | None:
+        try:
+            resp = await self.client.chat.completions.create(
+                model=self.model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": user},
+                ],
+            )
+            return resp.choices[0].message.content
+        except Exception as e:
+            print(f"[AsyncGptAPI] chat failed: {e}")
+            return None
+
+    async def chat_stream(self, system: str, user: str) -> AsyncIterator[str]:
+        """응답 텍스트 조각을 도착 순서대로 내보낸다. chat()과 달리 실패는 예외로 전달된다."""
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user},
+            ],
+            stream=True,
+        )
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            await stream.close()
+
+    async def aclose(self) -> None:
+        await self.client.close()
@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+
+from .scoring import RuleJudge
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .strategy_judge import StrategyJudge
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+
+
+def _normal_cdf(z: np.ndarray) -> np.ndarray:
+    # scipy 없이 표준정규 CDF (입력이 수십 개라 파이썬 erf로 충분하다)
+    return 0.5 * (1.0 + _erf(np.asarray(z) / math.sqrt(2.0)).astype(float))
+
+
+@dataclass
+class AdaptiveState:
+    """Answers of one respondent, kept as per-subscale running sums.
+
+    ``answer`` is O(1): it only touches the answered item's subscale slot, so
+    the posterior is never rebuilt from the full response dict.
+    """
+
+    responses: Dict[str, float]
+    count: np.ndarray
+    raw_sum: np.ndarray
+    resid_sum: np.ndarray
+    mean_sum: np.ndarray
+    answered: set = field(default_factory=set)
+
+
+class AdaptiveSurvey:
+    """Computerized-adaptive version of the short form with early stopping.
+
+    The item pool is the ItemBuilder short form, so the final result is the same
+    ``StrategyJudge.recommend`` rule applied to the answered items. Per subscale
+    the training sheets give item means ``b_j``, the spread of respondents'
+    offsets from them and the within-person item noise (``sigma^2``); the
+    offsets of all subscales share one prior covariance, so an answer also moves
+    the estimates of correlated subscales. After each answer the posterior of the
+    offsets predicts the full-form subscale means; fixed normal draws turn that into a distribution of
+    (top EQ, top FLA) pairs and so of the recommended strategy. The survey stops
+    once one strategy holds at least ``confidence`` of the draws and the
+    answered-items result agrees with it. The next item comes from the subscale
+    whose one-item look-ahead raises that confidence the most.
+    """
+
+    def __init__(
+        self,
+        judge: StrategyJudge,
+        confidence: float,
+        min_items: int,
+        draws: int = 256,
+        seed: int = 0,
+    ):
+        self._bind(judge, confidence, min_items)
+        self.item_mean = np.full(len(self.qids), 3.0)
+        self.item_rank = np.zeros(len(self.qids))
+        self.sigma2 = np.ones(self.n_subscales)
+        self.prior_cov = np.eye(self.n_subscales) * 0.25
+        self._fit(judge.train, judge.selected)
+        rng = np.random.default_rng(seed)
+        # 고정 난수: 같은 응답이면 항상 같은 다음 문항/확신도가 나온다.
+        self._z_offset = rng.standard_normal((draws, self.n_subscales))
+        self._z_rest = rng.standard_normal((draws, self.n_subscales))
+        self._finish()
+
+    _STATE_ARRAYS = ("item_mean", "item_rank", "sigma2", "prior_cov", "prior_precision", "_z_offset", "_z_rest")
+
+    def state(self) -> Dict[str, np.ndarray]:
+        """Fitted arrays, for the serving artifact."""
+        return {name.lstrip("_"): getattr(self, name) for name in self._STATE_ARRAYS}
+
+    @classmethod
+    def from_state(
+        cls, judge: RuleJudge, confidence: float, min_items: int, arrays: Dict[str, np.ndarray]
+    ) -> "AdaptiveSurvey":
+        """Survey over fitted arrays (may be read-only memory maps); no training data needed."""
+        survey = cls.__new__(cls)
+        survey._bind(judge, confidence, min_items)
+        for name in cls._STATE_ARRAYS:
+            setattr(survey, name, arrays[name.lstrip("_")])
+        survey._finish()
+        return survey
+
+    def _bind(self, judge: RuleJudge, confidence: float, min_items: int) -> None:
+        self.judge = judge
+        self.confidence = confidence
+        self.min_items = min_items
+        kernel = judge.kernel
+        self.kernel = kernel
+        self.qids: List[str] = list(kernel.column)
+        self.item_subscale = kernel.subscale
+        self.reverse = kernel.reverse
+        self.n_subscales = len(kernel.subscale_name)
+        self.scale_of = np.array([scale == "EQ" for scale in kernel.subscale_scale])
+
+    def _finish(self) -> None:
+        self.n_total = np.bincount(self.item_subscale, minlength=self.n_subscales).astype(float)
+        self.mean_total = np.bincount(
+            self.item_subscale, weights=self.item_mean, minlength=self.n_subscales
+        )
+        # 하위영역별 문항을 변별력(문항-나머지 상관) 높은 순으로 둔다.
+        self.order: List[List[int]] = [[] for _ in range(self.n_subscales)]
+        for idx in sorted(range(len(self.qids)), key=lambda i: -self.item_rank[i]):
+            self.order[self.item_subscale[idx]].append(idx)
+        self._strategy, self.strategy_names = self._strategy_lookup()
+        # 다음 응답(1~5)의 예측 분포를 이산화할 때 쓰는 경계
+        self._edges = np.array([1.5, 2.5, 3.5, 4.5])
+
+    # ------------------------------------------------------------------ 학습
+    def _fit(self, train: Dict[str, pd.DataFrame], selected: Dict[str, List[Dict]]) -> None:
+        import pandas as pd
+
+        number = {q["question_id"]: int(q["item_number"]) for s in ("EQ", "FLA") for q in selected[s]}
+        offsets: Dict[int, pd.Series] = {}
+        noise: Dict[int, float] = {}
+        for sid in range(self.n_subscales):
+            source = train.get(self.kernel.subscale_scale[sid])
+            if source is None:
+                continue
+            if "참여자" in source.columns:
+                source = source.set_index("참여자")
+            present = [
+                i for i in range(len(self.qids))
+                if self.item_subscale[i] == sid and number.get(self.qids[i]) in source.columns
+            ]
+            if not present:
+                continue
+            x = source[[number[self.qids[i]] for i in present]].to_numpy(dtype=float)
+            x = np.where(self.reverse[present], 6 - x, x)
+            b = np.nanmean(x, axis=0)
+            self.item_mean[present] = b
+            resid = x - b
+            k = np.sum(~np.isnan(x), axis=1)
+            with np.errstate(invalid="ignore"):
+                offset = np.nanmean(resid, axis=1)
+            # 자유도 보정된 개인 내(문항 간) 분산
+            dof = np.sum(np.maximum(k - 1, 0))
+            if dof > 0:
+                within = np.nansum((resid - offset[:, None]) ** 2)
+                self.sigma2[sid] = max(float(within / dof), 1e-3)
+            valid = k > 0
+            offsets[sid] = pd.Series(offset[valid], index=source.index[valid])
+            noise[sid] = float(np.mean(self.sigma2[sid] / k[valid])) if valid.any() else 0.0
+            if len(present) > 1:
+                total = np.nansum(x, axis=1)
+                for col, i in enumerate(present):
+                    ok = ~np.isnan(x[:, col])
+                    if ok.sum() > 2:
+                        r = np.corrcoef(x[ok, col], (total - np.nan_to_num(x[:, col]))[ok])[0, 1]
+                        self.item_rank[i] = 0.0 if np.isnan(r) else r
+
+        # 하위영역 오프셋의 사전 공분산: 참여자 단위로 맞춘 뒤 측정오차를 대각에서 뺀다.
+        if len(offsets) == self.n_subscales:
+            frame = pd.concat([offsets[sid] for sid in range(self.n_subscales)], axis=1)
+            cov = frame.cov().to_numpy(dtype=float, copy=True)
+            if np.isfinite(cov).all():
+                cov[np.diag_indices_from(cov)] -= [noise[sid] for sid in range(self.n_subscales)]
+                self.prior_cov = cov
+        # 양의 정부호가 되도록 고유값을 아래에서 자른다.
+        values, vectors = np.linalg.eigh(self.prior_cov)
+        values = np.maximum(values, 1e-3)
+        self.prior_cov = (vectors * values) @ vectors.T
+        self.prior_precision = np.linalg.inv(self.prior_cov)
+
+    def _strategy_lookup(self) -> Tuple[np.ndarray, List[str]]:
+        """(EQ subscale id, FLA subscale id) -> strategy index, as the judge decides it."""
+        names: List[str] = []
+        table = np.full((self.n_subscales, self.n_subscales), -1, dtype=np.intp)
+        corr = self.judge.corr_table
+        for e in np.flatnonzero(self.scale_of):
+            for f in np.flatnonzero(~self.scale_of):
+                eq = corr["EQ"].get(self.kernel.subscale_name[e])
+                fla = corr["FLA"].get(self.kernel.subscale_name[f])
+                if eq is None or fla is None:
+                    continue
+                winner = eq if eq.correlation >= fla.correlation else fla
+                if winner.strategy_subscale not in names:
+                    names.append(winner.strategy_subscale)
+                table[e, f] = names.index(winner.strategy_subscale)
+        return table, names
+
+    # ------------------------------------------------------------------ 상태
+    def new_state(self) -> AdaptiveState:
+        zeros = np.zeros(self.n_subscales)
+        return AdaptiveState({}, zeros.copy(), zeros.copy(), zeros.copy(), zeros.copy())
+
+    def answer(self, state: AdaptiveState, question_id: str, value: float) -> None:
+        idx = self.kernel.column.get(question_id)
+        if idx is None:
+            raise ValueError(f"{question_id} is not a short-form item.")
+        value = float(value)
+        if question_id in state.answered:
+            # 응답 수정: 이전 값을 빼고 새 값을 더한다.
+            self._apply(state, idx, state.responses[question_id], -1.0)
+        self._apply(state, idx, value, 1.0)
+        state.responses[question_id] = value
+        state.answered.add(question_id)
+
+    def _apply(self, state: AdaptiveState, idx: int, value: float, sign: float) -> None:
+        sid = self.item_subscale[idx]
+        scored = 6 - value if self.reverse[idx] else value
+        state.count[sid] += sign
+        state.raw_sum[sid] += sign * scored
+        state.resid_sum[sid] += sign * (scored - self.item_mean[idx])
+        state.mean_sum[sid] += sign * self.item_mean[idx]
+
+    def from_responses(self, responses: Dict[str, float]) -> AdaptiveState:
+        state = self.new_state()
+        for qid, value in responses.items():
+            if qid in self.kernel.column:
+                self.answer(state, qid, value)
+        return state
+
+    # ------------------------------------------------------------------ 예측
+    def _posterior(self, count: np.ndarray, resid_sum: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and covariance of the subscale offsets (any leading batch dims)."""
+        size = self.n_subscales
+        precision = self.prior_precision + (count / self.sigma2)[..., None] * np.eye(size)
+        cov = np.linalg.inv(precision)
+        mean = (cov @ (resid_sum / self.sigma2)[..., None])[..., 0]
+        return mean, cov
+
+    def _full_means(self, count, raw_sum, resid_sum, mean_sum) -> np.ndarray:
+        """Draws x subscales of the predicted full-form subscale mean (any leading batch dims)."""
+        mean, cov = self._posterior(count, resid_sum)
+        rest = self.n_total - count
+        offset = mean[..., None, :] + self._z_offset @ np.swapaxes(np.linalg.cholesky(cov), -1, -2)
+        total = (
+            raw_sum[..., None, :]
+            + (self.mean_total - mean_sum)[..., None, :]
+            + rest[..., None, :] * offset
+            + np.sqrt(rest * self.sigma2)[..., None, :] * self._z_rest
+        )
+        return total / self.n_total
+
+    def _strategy_shares(self, full: np.ndarray) -> np.ndarray:
+        eq_ids, fla_ids = np.flatnonzero(self.scale_of), np.flatnonzero(~self.scale_of)
+        top_eq = eq_ids[np.argmax(full[..., eq_ids], axis=-1)]
+        top_fla = fla_ids[np.argmax(full[..., fla_ids], axis=-1)]
+        picks = self._strategy[top_eq, top_fla]
+        n = len(self.strategy_names)
+        onehot = picks[..., None] == np.arange(n)
+        return onehot.mean(axis=-2)
+
+    def predict(self, state: AdaptiveState) -> Tuple[str | None, float]:
+        """Most likely full-form strategy and the share of draws that agree."""
+        if not self.strategy_names:
+            return None, 0.0
+        shares = self._strategy_shares(
+            self._full_means(state.count, state.raw_sum, state.resid_sum, state.mean_sum)
+        )
+        best = int(np.argmax(shares))
+        return self.strategy_names[best], float(shares[best])
+
+    def _next_item(self, state: AdaptiveState) -> int | None:
+        """Item maximising the expected confidence after one more answer."""
+        candidates = []
+        for sid in range(self.n_subscales):
+            for idx in self.order[sid]:
+                if self.qids[idx] not in state.answered:
+                    candidates.append(idx)
+                    break
+        if not candidates:
+            return None
+        if not self.strategy_names:
+            return candidates[0]
+
+        subs = self.item_subscale[candidates]
+        c = len(candidates)
+        mean, cov = self._posterior(state.count, state.resid_sum)
+        # 다음 응답의 예측 분포: N(b_j + 평균 오프셋, 오프셋 분산 + 문항 잡음)을 1~5로 이산화
+        loc = self.item_mean[candidates] + mean[subs]
+        scale = np.sqrt(np.diagonal(cov)[subs] + self.sigma2[subs])
+        cdf = _normal_cdf((self._edges[None, :] - loc[:, None]) / scale[:, None])
+        probs = np.diff(np.concatenate([np.zeros((c, 1)), cdf, np.ones((c, 1))], axis=1), axis=1)
+
+        # 후보 c개 x 응답 5가지의 가상 상태를 한 번에 만든다.
+        values = np.arange(1.0, 6.0)
+        onehot = np.zeros((c, self.n_subscales))
+        onehot[np.arange(c), subs] = 1.0
+        raw = state.raw_sum + onehot[:, None, :] * values[None, :, None]
+        count = np.broadcast_to(state.count + onehot[:, None, :], raw.shape)
+        resid = state.resid_sum + onehot[:, None, :] * (
+            values[None, :, None] - self.item_mean[candidates][:, None, None]
+        )
+        means = np.broadcast_to(
+            state.mean_sum + onehot[:, None, :] * self.item_mean[candidates][:, None, None], raw.shape
+        )
+        shares = self._strategy_shares(self._full_means(count, raw, resid, means))
+        expected = (probs * shares.max(axis=-1)).sum(axis=1)
+        # 동률이면 변별력이 높은 문항을 먼저 묻는다.
+        best = max(range(c), key=lambda k: (round(float(expected[k]), 9), self.item_rank[candidates[k]]))
+        return candidates[best]
+
+    # ------------------------------------------------------------------ 진행
+    def step(self, state: AdaptiveState) -> Dict:
+        """Either the next question id or the final rule-based result."""
+        predicted, confidence = self.predict(state)
+        answered = len(state.answered)
+        done = False
+        result = None
+        if answered >= min(self.min_items, len(self.qids)) and confidence >= self.confidence:
+            result = self._try_recommend(state.responses)
+            done = result is not None and result["recommended_strategy"] == predicted
+        next_idx = None if done else self._next_item(state)
+        if next_idx is None and not done:
+            # 더 물을 문항이 없으면 응답한 문항만으로 판정한다.
+            done = True
+            result = self.judge.recommend(state.responses)
+        return {
+            "done": done,
+            "next_question_id": None if done else self.qids[next_idx],
+            "answered": answered,
+            "max_items": len(self.qids),
+            "predicted_strategy": predicted,
+            "confidence": confidence,
+            "result": result if done else None,
+        }
+
+    def _try_recommend(self, responses: Dict[str, float]) -> Dict | None:
+        try:
+            return self.judge.recommend(responses)
+        except (ValueError, KeyError):
+            return None
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .data_loader import ItemMeta
+
+_VAR_EPS = 1e-12
+
+
+class AlphaEngine:
+    """Cronbach's alpha for any item subset of one scale, from precomputed moments.
+
+    The response matrix is reverse-coded and centred once. Rows without missing
+    values are folded into a cross-product matrix; the few rows with gaps are kept
+    aside so each subset still uses listwise deletion over its own columns, exactly
+    like ``cronbach_alpha(data[cols].dropna())``.
+    """
+
+    def __init__(self, data: pd.DataFrame, items: Sequence[ItemMeta]):
+        numbers: List[int] = []
+        reverse: List[bool] = []
+        for item in items:
+            if item.item_number in data.columns and item.item_number not in numbers:
+                numbers.append(item.item_number)
+                reverse.append(item.reverse_coded)
+        self.item_numbers = numbers
+        self.index: Dict[int, int] = {num: i for i, num in enumerate(numbers)}
+
+        values = data[numbers].to_numpy(dtype=float, copy=True) if numbers else np.empty((len(data), 0))
+        rev = np.array(reverse, dtype=bool)
+        values[:, rev] = 6 - values[:, rev]
+
+        missing = np.isnan(values)
+        complete = ~missing.any(axis=1)
+        with np.errstate(all="ignore"):
+            center = np.nan_to_num(np.nanmean(values, axis=0)) if len(values) else 0.0
+        centered = values - center
+
+        block = centered[complete]
+        self.n_complete = int(block.shape[0])
+        self.cross = block.T @ block
+        self.diag = np.diag(self.cross).copy()
+        self.sums = block.sum(axis=0)
+        self.partial = np.nan_to_num(centered[~complete])
+        self.partial_missing = missing[~complete]
+
+    @property
+    def size(self) -> int:
+        return len(self.item_numbers)
+
+    def mask_for(self, item_numbers: Iterable[int]) -> np.ndarray:
+        mask = np.zeros(self.size, dtype=bool)
+        for num in item_numbers:
+            idx = self.index.get(num)
+            if idx is not None:
+                mask[idx] = True
+        return mask
+
+    def alpha(self, item_numbers: Iterable[int]) -> float:
+        mask = self.mask_for(item_numbers)
+        complete_total = float(self.cross[np.ix_(mask, mask)].sum())
+        return self._alpha(mask, complete_total)
+
+    def state(self, item_numbers: Iterable[int]) -> "AlphaState":
+        return AlphaState(self, self.mask_for(item_numbers))
+
+    def _alpha(self, mask: np.ndarray, complete_total: float) -> float:
+        k = int(mask.sum())
+        if k < 2:
+            return 0.0
+        usable = ~self.partial_missing[:, mask].any(axis=1)
+        rows = self.partial[usable][:, mask]
+        n = self.n_complete + rows.shape[0]
+        if n < 2:
+            return 0.0
+
+        col_sums = self.sums[mask] + rows.sum(axis=0)
+        squares = self.diag[mask] + (rows**2).sum(axis=0)
+        item_var_sum = float((squares - col_sums**2 / n).sum()) / (n - 1)
+        total = complete_total + float((rows.sum(axis=1) ** 2).sum())
+        total_var = (total - float(col_sums.sum()) ** 2 / n) / (n - 1)
+        if total_var <= _VAR_EPS or np.isnan(total_var):
+            return 0.0
+        return float((k / (k - 1)) * (1 - item_var_sum / total_var))
+
+
+class AlphaState:
+    """A mutable item subset whose alpha can be re-evaluated after add/remove/swap.
+
+    ``row_cross[i]`` holds the cross-product of item ``i`` with the current subset,
+    so the complete-row part of any single move is O(1) and applying it is one
+    vector update.
+    """
+
+    def __init__(self, engine: AlphaEngine, mask: np.ndarray):
+        self.engine = engine
+        self.mask = mask
+        self.row_cross = engine.cross[:, mask].sum(axis=1)
+        self.complete_total = float(self.row_cross[mask].sum())
+
+    @property
+    def alpha(self) -> float:
+        return self.engine._alpha(self.mask, self.complete_total)
+
+    def alpha_if(self, add: int | None = None, remove: int | None = None) -> float:
+        mask, total, _, _ = self._moved(add, remove)
+        return self.engine._alpha(mask, total)
+
+    def apply(self, add: int | None = None, remove: int | None = None) -> None:
+        mask, total, a, r = self._moved(add, remove)
+        if a is not None:
+            self.row_cross = self.row_cross + self.engine.cross[:, a]
+        if r is not None:
+            self.row_cross = self.row_cross - self.engine.cross[:, r]
+        self.mask = mask
+        self.complete_total = total
+
+    def _moved(
+        self, add: int | None, remove: int | None
+    ) -> Tuple[np.ndarray, float, int | None, int | None]:
+        cross = self.engine.cross
+        a = None if add is None else self.engine.index.get(add)
+        r = None if remove is None else self.engine.index.get(remove)
+        if a is not None and self.mask[a]:
+            a = None
+        if r is not None and not self.mask[r]:
+            r = None
+
+        mask = self.mask.copy()
+        total = self.complete_total
+        if r is not None:
+            total += -2 * self.row_cross[r] + cross[r, r]
+            mask[r] = False
+        if a is not None:
+            row = self.row_cross[a] - (cross[a, r] if r is not None else 0.0)
+            total += 2 * row + cross[a, a]
+            mask[a] = True
+        return mask, float(total), a, r
+
+    def copy(self) -> "AlphaState":
+        clone = AlphaState.__new__(AlphaState)
+        clone.engine = self.engine
+        clone.mask = self.mask.copy()
+        clone.row_cross = self.row_cross.copy()
+        clone.complete_total = self.complete_total
+        return clone
+
+    def swap_alphas(self, out_idx: np.ndarray, in_idx: np.ndarray) -> np.ndarray:
+        """Alpha after swapping ``out_idx[i]`` (selected) for ``in_idx[j]`` (unselected).
+
+        Returns a ``len(out_idx) x len(in_idx)`` matrix computed in one batch. Rows
+        with missing values count only for the pairs they are complete under, so
+        each entry equals ``alpha_if(add=..., remove=...)`` for the corresponding engine indices.
+        """
+        e = self.engine
+        k = int(self.mask.sum())
+        shape = (len(out_idx), len(in_idx))
+        if k < 2 or 0 in shape:
+            return np.zeros(shape)
+
+        r = np.asarray(out_idx)[:, None]
+        a = np.asarray(in_idx)[None, :]
+        cross = e.cross
+
+        total = (
+            self.complete_total
+            - 2 * self.row_cross[r] + cross[r, r]
+            + 2 * (self.row_cross[a] - cross[a, r]) + cross[a, a]
+        )
+        sums_s = float(e.sums[self.mask].sum())
+        total_sum = sums_s - e.sums[r] + e.sums[a]
+        squares = float(e.diag[self.mask].sum()) - e.diag[r] + e.diag[a]
+        sumsq_sq = float((e.sums[self.mask] ** 2).sum()) - e.sums[r] ** 2 + e.sums[a] ** 2
+        n = np.full(shape, float(e.n_complete))
+
+        p = e.partial
+        miss = e.partial_missing
+        if len(p):
+            # 결측 행 j가 (r, a) 교체에 쓰이는 조건은 c_j(r) * d_j(a)로 나뉜다:
+            # 선택 문항이 모두 있거나 유일한 결측이 r이고, a가 결측이 아니어야 한다.
+            # 그래서 P개 행의 합은 (P, 빼는 문항, 넣는 문항) 3차원 배열 없이 행렬곱으로 계산된다.
+            p_s = p[:, self.mask]
+            blocked = miss[:, self.mask].sum(axis=1)
+            x, y = p[:, out_idx], p[:, in_idx]
+            c = ((blocked == 0)[:, None] | ((blocked == 1)[:, None] & miss[:, out_idx])).astype(float)
+            d = (~miss[:, in_idx]).astype(float)
+            row_s = p_s.sum(axis=1)[:, None]
+            g = (p_s @ e.sums[self.mask])[:, None]
+            dy = d * y
+            dy2 = d * y**2
+
+            n += c.T @ d
+            # row_y = row_s - x + y
+            total += (c * (row_s - x) ** 2).T @ d + 2 * (c * (row_s - x)).T @ dy + c.T @ dy2
+            total_sum += (c * (row_s - x)).T @ d + c.T @ dy
+            squares += (c * ((p_s**2).sum(axis=1)[:, None] - x**2)).T @ d + c.T @ dy2
+            sumsq_sq += 2 * ((c * (g - e.sums[out_idx][None] * x)).T @ d + (c.T @ dy) * e.sums[in_idx][None])
+            # sum_jl u_j u_l (p_j . p_l) = |sum_j u_j p_j|^2, 결측 없는 행은 모든 r에 공통이다.
+            v = np.repeat((d[blocked == 0].T @ p_s[blocked == 0])[None], len(out_idx), axis=0)
+            for i in range(len(out_idx)):
+                rows = (blocked == 1) & miss[:, out_idx[i]]
+                if rows.any():
+                    v[i] += d[rows].T @ p_s[rows]
+            sumsq_sq += (v**2).sum(axis=2) - ((c * x).T @ d) ** 2 + (c.T @ dy) ** 2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            item_var = (squares - sumsq_sq / n) / (n - 1)
+            total_var = (total - total_sum**2 / n) / (n - 1)
+            alpha = (k / (k - 1)) * (1 - item_var / total_var)
+        invalid = (n < 2) | ~(total_var > _VAR_EPS)
+        return np.where(invalid, 0.0, alpha)
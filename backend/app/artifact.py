@@ -0,0 +1,166 @@
+"""Single-file, memory-mapped serving artifact.
+
+Layout: 8-byte magic, little-endian uint64 header length, UTF-8 JSON header,
+then 64-byte aligned raw array blobs. The header carries the JSON serving
+state (short form, pools, correlation table, item texts, rankings) and, per
+array, its dtype, shape and offset. Arrays are exposed as read-only NumPy views
+on one ``mmap``, so every worker that attaches shares the same page-cache
+copy. Reading needs only the standard library and NumPy.
+
+Export from a built service (needs the full training stack):
+
+    python -m app.artifact --train ../Data/Train_train_balanced.xlsx -o .cache/serving.artifact
+
+``ArtifactCache`` keeps artifacts keyed by the model fingerprint (see
+``app.model_inputs``), so the API worker attaches to a matching one at start-up
+and only builds (and writes one) when the inputs or settings changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+ARTIFACT_MAGIC = b"ERSART\x00\x01"
+ARTIFACT_FORMAT_VERSION = 1
+# 직렬화된 상태를 만드는 코드(StrategyJudge 상관 표, RequestionSelector 순위,
+# AdaptiveSurvey._fit, ServingModel.export)가 바뀌면 올린다. 입력 파일이 그대로여도
+# 이전 코드로 만든 아티팩트에 붙지 않고 새로 구축하게 된다.
+SERVING_STATE_VERSION = 1
+_ALIGN = 64
+_PREFIX = struct.Struct("<8sQ")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def write_artifact(path: Path, state: Dict, arrays: Dict[str, np.ndarray]) -> None:
+    """Write ``state`` (JSON-serialisable) and ``arrays`` atomically to ``path``."""
+    from .snapshot import atomic_write_bytes
+
+    blobs = {name: np.ascontiguousarray(arr) for name, arr in arrays.items()}
+    layout: Dict[str, Dict] = {}
+    offset = 0
+    for name, arr in blobs.items():
+        layout[name] = {"dtype": arr.dtype.str, "shape": list(arr.shape), "offset": offset}
+        offset = _aligned(offset + arr.nbytes)
+    header = json.dumps(
+        {
+            "format": ARTIFACT_FORMAT_VERSION,
+            "state_version": SERVING_STATE_VERSION,
+            "state": state,
+            "arrays": layout,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    data_start = _aligned(_PREFIX.size + len(header))
+
+    out = bytearray(data_start + offset)
+    _PREFIX.pack_into(out, 0, ARTIFACT_MAGIC, len(header))
+    out[_PREFIX.size : _PREFIX.size + len(header)] = header
+    for name, arr in blobs.items():
+        start = data_start + layout[name]["offset"]
+        out[start : start + arr.nbytes] = arr.tobytes()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, bytes(out))
+
+
+class ServingArtifact:
+    """Read-only view of an artifact file; ``arrays`` are zero-copy views on the map."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with path.open("rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, header_len = _PREFIX.unpack_from(self._map, 0)
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError(f"{path} is not a serving artifact.")
+        header = json.loads(self._map[_PREFIX.size : _PREFIX.size + header_len].decode("utf-8"))
+        if header.get("format") != ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format: {header.get('format')}")
+        if header.get("state_version") != SERVING_STATE_VERSION:
+            raise ValueError(
+                f"{path} was exported by another serving-state version "
+                f"({header.get('state_version')}, expected {SERVING_STATE_VERSION}); export it again."
+            )
+        self.state: Dict = header["state"]
+        data_start = _aligned(_PREFIX.size + header_len)
+        self.arrays: Dict[str, np.ndarray] = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            self.arrays[name] = np.frombuffer(
+                self._map, dtype=dtype, count=count, offset=data_start + spec["offset"]
+            ).reshape(spec["shape"])
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._map)
+
+
+class ArtifactCache:
+    """Prebuilt artifacts keyed by model fingerprint plus serving settings.
+
+    Like ``ItemBuilderCache``, each key gets its own file and only the ``keep``
+    most recently written files are retained.
+    """
+
+    def __init__(self, cache_dir: Path, keep: int, serving_config: Dict):
+        self.cache_dir = cache_dir
+        self.keep = keep
+        self.serving_config = serving_config
+
+    def path_for(self, fingerprint: str) -> Path:
+        key = json.dumps(
+            {"model": fingerprint, "format": ARTIFACT_FORMAT_VERSION, **self.serving_config}, sort_keys=True
+        )
+        return self.cache_dir / f"serving_{hashlib.sha256(key.encode('utf-8')).hexdigest()[:24]}.artifact"
+
+    def prune(self) -> None:
+        entries = sorted(
+            self.cache_dir.glob("serving_*.artifact"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[self.keep :]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+def main() -> None:
+    import argparse
+
+    from .config import SERVING_ARTIFACT_PATH, SURVEY_FILE, TRAIN_FILE
+    from .serving_model import ServingModel
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", type=Path, default=SURVEY_FILE)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("-o", "--output", type=Path, default=SERVING_ARTIFACT_PATH)
+    parser.add_argument("--nice", type=int, default=0, help="lower the build's CPU priority (POSIX)")
+    args = parser.parse_args()
+    if args.output is None:
+        parser.error("--output is required when SERVING_ARTIFACT_PATH is not set.")
+    if args.nice and hasattr(os, "nice"):
+        os.nice(args.nice)
+
+    ServingModel.build(args.survey, args.train).export(args.output)
+    artifact = ServingArtifact(args.output)
+    print(
+        f"wrote {args.output} ({artifact.nbytes / 1024:.1f} KiB, model {artifact.state['model_version']}, "
+        f"{len(artifact.state['items'])} items, {len(artifact.arrays)} arrays)"
+    )
+
+
+if __name__ == "__main__":
+    main()
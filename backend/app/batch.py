@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Mapping, Optional
+
+from pydantic import ValidationError
+
+from .models import RecommendRequest
+
+# 일괄 채점 입력에서 문항 응답 외에 인식하는 열
+ID_COLUMN = "id"
+TIE_BREAKER_COLUMNS = {"EQ": "tie_breaker_EQ", "FLA": "tie_breaker_FLA"}
+# 따옴표 안에서 줄바꿈이 이어지는 CSV 레코드 하나의 최대 길이 (닫히지 않은 따옴표가 본문 전체를 삼키지 않게)
+MAX_CSV_RECORD_CHARS = 1 << 20
+# 업로드 본문 한 줄의 최대 바이트 수 (줄바꿈 없는 본문이 메모리를 끝없이 쓰지 않게)
+MAX_LINE_BYTES = 1 << 20
+
+
+@dataclass
+class BatchRow:
+    index: int
+    respondent_id: Optional[str] = None
+    responses: Optional[Dict[str, float]] = None
+    tie_breaker_answers: Optional[Dict[str, List[float]]] = None
+    error: Optional[str] = None
+
+
+def _is_blank(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and value != value:
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+def record_to_row(index: int, record: Mapping[str, Any]) -> BatchRow:
+    """Flat record (CSV/Excel/Parquet row) -> BatchRow.
+
+    Question-id columns hold 1~5 answers and blanks are treated as unanswered.
+    ``tie_breaker_EQ``/``tie_breaker_FLA`` hold ``;``-separated re-question answers.
+    """
+    respondent_id = record.get(ID_COLUMN)
+    row = BatchRow(index=index, respondent_id=None if _is_blank(respondent_id) else str(respondent_id))
+    tie_columns = set(TIE_BREAKER_COLUMNS.values())
+    responses: Dict[str, float] = {}
+    try:
+        for key, value in record.items():
+            if key == ID_COLUMN or key in tie_columns or _is_blank(value):
+                continue
+            responses[str(key)] = float(value)
+        tie: Dict[str, List[float]] = {}
+        for scale, column in TIE_BREAKER_COLUMNS.items():
+            value = record.get(column)
+            if not _is_blank(value):
+                tie[scale] = [float(v) for v in str(value).split(";") if v.strip()]
+    except (TypeError, ValueError) as exc:
+        row.error = f"Invalid value: {exc}"
+        return row
+    row.responses = responses
+    row.tie_breaker_answers = tie or None
+    return row
+
+
+def ndjson_to_row(index: int, line: str) -> BatchRow:
+    """One ``RecommendRequest`` JSON object (plus optional ``id``) -> BatchRow."""
+    try:
+        raw = json.loads(line)
+        respondent_id = raw.get(ID_COLUMN) if isinstance(raw, dict) else None
+        payload = RecommendRequest.model_validate(raw)
+    except (ValueError, ValidationError) as exc:
+        return BatchRow(index=index, error=f"Invalid request: {exc}".splitlines()[0])
+    return BatchRow(
+        index=index,
+        respondent_id=None if respondent_id is None else str(respondent_id),
+        responses=payload.responses,
+        tie_breaker_answers=payload.tie_breaker_answers,
+    )
+
+
+@dataclass(frozen=True)
+class LineError:
+    """A body line that could not be read; reported as an error row."""
+
+    message: str
+
+
+_INVALID_UTF8 = LineError("Invalid UTF-8 in input line")
+_LINE_TOO_LONG = LineError(f"Line exceeds {MAX_LINE_BYTES} bytes")
+
+
+async def iter_body_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str | LineError]:
+    """Split a streamed request body into text lines without buffering the whole body.
+
+    Only the incoming chunk is searched for newlines, so cost stays linear in the
+    body size. A line longer than ``MAX_LINE_BYTES`` is reported once and dropped
+    up to its newline; a line that is not valid UTF-8 is reported too. Either way
+    the caller can emit an error row instead of aborting the stream.
+    """
+    buffer = bytearray()
+    first = True
+    skipping = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                if not skipping:
+                    buffer += chunk[start:]
+                    if len(buffer) > MAX_LINE_BYTES:
+                        # 줄이 끝나기 전에 상한을 넘으면 다음 줄바꿈까지 버린다.
+                        buffer.clear()
+                        skipping, first = True, False
+                        yield _LINE_TOO_LONG
+                break
+            if skipping:
+                skipping = False
+            else:
+                buffer += chunk[start:end]
+                yield _LINE_TOO_LONG if len(buffer) > MAX_LINE_BYTES else _decode_line(buffer, first)
+                first = False
+                buffer.clear()
+            start = end + 1
+    if buffer:
+        yield _decode_line(buffer, first)
+
+
+def _decode_line(line: bytes | bytearray, first: bool) -> str | LineError:
+    try:
+        text = line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        return _INVALID_UTF8
+    return text.lstrip("\ufeff") if first else text
+
+
+async def iter_csv_records(lines: AsyncIterable[str | LineError]) -> AsyncIterator[List[str] | str]:
+    """Group physical lines into CSV records; quoted fields may span lines.
+
+    A record is complete when its quotes are balanced (``""`` escapes count as
+    two). Yields the parsed fields, or an error message for a record that could
+    not be read (unreadable line, unterminated quote, oversized record).
+    """
+    pending: List[str] = []
+    quotes = size = 0
+    async for line in lines:
+        if isinstance(line, LineError):
+            pending, quotes, size = [], 0, 0
+            yield line.message
+            continue
+        if not pending and not line.strip():
+            continue
+        pending.append(line)
+        quotes += line.count('"')
+        size += len(line) + 1
+        if quotes % 2 == 0:
+            yield next(csv.reader(["\n".join(pending)]))
+            pending, quotes, size = [], 0, 0
+        elif size > MAX_CSV_RECORD_CHARS:
+            pending, quotes, size = [], 0, 0
+            yield f"CSV record exceeds {MAX_CSV_RECORD_CHARS} characters (unterminated quote?)"
+    if pending:
+        yield "Unterminated quoted field at end of input"
+
+
+async def iter_upload_rows(lines: AsyncIterable[str | LineError], fmt: str) -> AsyncIterator[BatchRow]:
+    index = 0
+    if fmt == "csv":
+        header: List[str] | None = None
+        async for record in iter_csv_records(lines):
+            if isinstance(record, str):
+                yield BatchRow(index=index, error=record)
+            elif header is None:
+                header = [h.strip() for h in record]
+                continue
+            else:
+                yield record_to_row(index, dict(zip(header, record)))
+            index += 1
+        return
+    async for line in lines:
+        if isinstance(line, LineError):
+            yield BatchRow(index=index, error=line.message)
+        elif not line.strip():
+            continue
+        else:
+            yield ndjson_to_row(index, line)
+        index += 1
+
+
+def score_rows(judge, rows: List[BatchRow]) -> List[Dict | None]:
+    """Score parsed rows with ``StrategyJudge.recommend_batch``; rows that failed parsing get None."""
+    valid = [row for row in rows if row.error is None]
+    scored = judge.recommend_batch([(row.responses or {}, row.tie_breaker_answers) for row in valid])
+    by_index = {row.index: result for row, result in zip(valid, scored)}
+    return [by_index.get(row.index) for row in rows]
+
+
+def encode_line(row: BatchRow, result: Dict | None) -> bytes:
+    line: Dict[str, Any] = {"index": row.index}
+    if row.respondent_id is not None:
+        line["id"] = row.respondent_id
+    if row.error is not None:
+        line["error"] = row.error
+    elif result is not None and "error" in result:
+        line["error"] = result["error"]
+    else:
+        line["result"] = result
+    return (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8")
@@ -0,0 +1,174 @@
+"""Score respondent exports offline, without the FastAPI app.
+
+    python -m app.bulk_score responses.csv -o results.ndjson --workers 4
+
+Input is CSV, Excel or Parquet with question-id columns (``EQ-7`` ...), plus the
+optional ``id`` and ``tie_breaker_EQ``/``tie_breaker_FLA`` columns understood by
+``/api/recommend/batch/upload``. Output is NDJSON (same lines as the batch
+endpoint) or CSV, chosen by the output file extension, and is written chunk by
+chunk in input order whatever the worker count.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import multiprocessing as mp
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import pandas as pd
+
+from .batch import encode_line, record_to_row, score_rows
+from .config import BATCH_CHUNK_SIZE, SURVEY_FILE, TRAIN_FILE
+from .strategy_judge import StrategyJudge
+
+CSV_COLUMNS = [
+    "index",
+    "id",
+    "recommended_strategy",
+    "tie_triggered",
+    "score_gap",
+    "top_eq_subscale",
+    "top_fla_subscale",
+    "error",
+]
+
+# 워커 프로세스가 공유하는 읽기 전용 모델 (fork 시 복사 없이 상속된다)
+_JUDGE: StrategyJudge | None = None
+
+# (첫 행 번호, 원본 DataFrame 조각) - 레코드 변환은 워커에서 해 부모의 직렬화 비용을 줄인다
+Chunk = Tuple[int, pd.DataFrame]
+
+
+def _init_worker(judge: StrategyJudge | None) -> None:
+    global _JUDGE
+    if judge is not None:
+        _JUDGE = judge
+
+
+def _score_chunk(chunk: Chunk) -> List[bytes]:
+    offset, frame = chunk
+    rows = [record_to_row(offset + i, record) for i, record in enumerate(frame.to_dict("records"))]
+    return [encode_line(row, result) for row, result in zip(rows, score_rows(_JUDGE, rows))]
+
+
+def iter_chunks(path: Path, chunk_size: int) -> Iterator[Chunk]:
+    suffix = path.suffix.lower()
+    if suffix in (".csv", ".txt"):
+        frames = pd.read_csv(path, chunksize=chunk_size, dtype={"id": str})
+    elif suffix in (".xlsx", ".xls"):
+        sheet = pd.read_excel(path, dtype={"id": str})
+        frames = (sheet.iloc[i : i + chunk_size] for i in range(0, len(sheet), chunk_size))
+    elif suffix == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise SystemExit("Reading Parquet requires pyarrow (pip install pyarrow).") from exc
+        frames = (
+            batch.to_pandas() for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size)
+        )
+    else:
+        raise SystemExit(f"Unsupported input format: {path.suffix}")
+
+    offset = 0
+    for frame in frames:
+        frame.columns = [str(c) for c in frame.columns]
+        yield offset, frame
+        offset += len(frame)
+
+
+class _Writer:
+    def __init__(self, path: Path | None):
+        self.path = path
+        self._csv = None
+        if path is not None and path.suffix.lower() == ".csv":
+            self.handle = path.open("w", encoding="utf-8", newline="")
+            self._csv = csv.DictWriter(self.handle, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+            self._csv.writeheader()
+        else:
+            self.handle = path.open("wb") if path is not None else sys.stdout.buffer
+
+    def write(self, lines: List[bytes]) -> None:
+        if self._csv is None:
+            self.handle.writelines(lines)
+        else:
+            for line in lines:
+                item = json.loads(line)
+                self._csv.writerow(
+                    {
+                        **(item.get("result") or {}),
+                        "index": item["index"],
+                        "id": item.get("id"),
+                        "error": item.get("error"),
+                    }
+                )
+        self.handle.flush()
+
+    def close(self) -> None:
+        if self.path is not None:
+            self.handle.close()
+
+
+def _peak_rss_mib(who: int) -> float:
+    # Linux reports ru_maxrss in KiB, macOS in bytes.
+    rss = resource.getrusage(who).ru_maxrss
+    return rss / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", type=Path)
+    parser.add_argument("-o", "--output", type=Path, help="*.ndjson / *.jsonl / *.csv (default: stdout NDJSON)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE)
+    parser.add_argument("--survey", type=Path, default=SURVEY_FILE)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    args = parser.parse_args(argv)
+
+    from .service import RecommendationService
+
+    global _JUDGE
+    start = time.perf_counter()
+    _JUDGE = RecommendationService(survey_path=args.survey, train_path=args.train).judge
+    build_time = time.perf_counter() - start
+
+    writer = _Writer(args.output)
+    rows = 0
+    start = time.perf_counter()
+    try:
+        chunks = iter_chunks(args.input, args.chunk_size)
+        if args.workers <= 1:
+            for chunk in chunks:
+                lines = _score_chunk(chunk)
+                writer.write(lines)
+                rows += len(lines)
+        else:
+            methods = mp.get_all_start_methods()
+            ctx = mp.get_context("fork" if "fork" in methods else "spawn")
+            # fork는 _JUDGE를 그대로 상속하고, spawn이면 워커마다 한 번 전달한다.
+            init_judge = None if ctx.get_start_method() == "fork" else _JUDGE
+            with ctx.Pool(args.workers, initializer=_init_worker, initargs=(init_judge,)) as pool:
+                # imap은 제출 순서대로 결과를 돌려주므로 워커 수와 무관하게 출력 순서가 같다.
+                for lines in pool.imap(_score_chunk, chunks):
+                    writer.write(lines)
+                    rows += len(lines)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"[bulk_score] model build {build_time:.2f}s, scored {rows} rows in {elapsed:.2f}s "
+        f"({rows / elapsed if elapsed else 0:.0f} rows/s) with {max(1, args.workers)} worker(s); "
+        f"peak RSS parent {_peak_rss_mib(resource.RUSAGE_SELF):.0f} MiB, "
+        f"largest worker {_peak_rss_mib(resource.RUSAGE_CHILDREN):.0f} MiB",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
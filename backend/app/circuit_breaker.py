@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling upstream while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker; calls slower than ``slow_call_seconds`` count as failures.
+
+    closed -> open after ``failure_threshold`` failures in a row. After
+    ``open_seconds`` the next ``allow()`` moves to half-open and lets up to
+    ``half_open_probes`` calls through; one success closes the breaker, one
+    failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        slow_call_seconds: float,
+        open_seconds: float,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def rejects(self) -> bool:
+        """Cheap pre-check: True (and counted) while open and still cooling down."""
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at < self.open_seconds:
+                self.rejected += 1
+                return True
+            return False
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+                self._state = HALF_OPEN
+                self._probes = 0
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+
+    def record(self, ok: bool, duration: float) -> None:
+        """Report one allowed call; a slow success still counts as a failure."""
+        with self._lock:
+            if ok and duration <= self.slow_call_seconds:
+                self._failures = 0
+                self._state = CLOSED
+                return
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self.times_opened += 1
+                self._state = OPEN
+                self._opened_at = self._clock()
+
+    def abandon(self) -> None:
+        """Forget one allowed call that ended without an outcome (e.g. the client left)."""
+        with self._lock:
+            # 반개방 탐침이 결과 없이 끝나면 다음 호출이 탐침을 다시 쓸 수 있게 돌려준다.
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def snapshot(self) -> Dict[str, float | int | str]:
+        with self._lock:
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "times_opened": self.times_opened,
+                "rejected_calls": self.rejected,
+                "retry_in_seconds": retry_in,
+            }
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 
@@ -5,6 +6,8 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DATA_DIR = PROJECT_ROOT / "Data"
 CACHE_DIR = PROJECT_ROOT / "backend" / ".cache"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
+SNAPSHOT_DIR = CACHE_DIR / "snapshots"
+EMBEDDING_STORE_DIR = CACHE_DIR / "embeddings"
 
 SURVEY_FILE = DATA_DIR / "Survey.xlsx"
 SUBSCALE_FILE_CANDIDATES = [
@@ -20,3 +23,63 @@ LIKERT_MIN = 1
 LIKERT_MAX = 5
 TIE_GAP_THRESHOLD = 0.10
 MAX_REQUESTION_ROUNDS = 3
+# 재질문 문항 선택: "info_gain"(학습 데이터 기반 변별력 순) 또는 "random"(기존 무작위)
+REQUESTION_SELECTOR = "info_gain"
+# 적응형 설문: 멈추기 위한 추천 전략 확신도, 최소 문항 수, 예측에 쓰는 고정 표본 수
+ADAPTIVE_CONFIDENCE = 0.90
+ADAPTIVE_MIN_ITEMS = 8
+ADAPTIVE_DRAWS = 256
+# 설문 세션: 최대 보관 개수(LRU), 마지막 사용 후 유효 시간(초),
+# SQLite 경로(None이면 프로세스 메모리, 여러 워커가 공유하려면 경로 지정)
+SESSION_STORE_SIZE = 10000
+SESSION_TTL = 2 * 3600
+SESSION_DB_PATH = None
+# 서빙 아티팩트 경로: 지정하면 워커가 엑셀/학습 데이터 대신 이 파일을 메모리 매핑해 붙는다
+# (python -m app.artifact 로 생성). None이면 기존처럼 프로세스마다 직접 구축한다.
+SERVING_ARTIFACT_PATH = None
+# API 워커의 자동 아티팩트 캐시: 입력 파일/설정 지문이 같은 아티팩트가 있으면 구축 없이 붙고
+# (pandas/scikit-learn 미로딩), 없으면 구축 후 저장한다. None이면 끔, 보관 개수
+SERVING_ARTIFACT_DIR = CACHE_DIR / "serving"
+SERVING_ARTIFACT_KEEP = 3
+# 입력 파일(또는 SERVING_ARTIFACT_PATH) 변경 감시 주기(초): 바뀌면 백그라운드에서 재구축해
+# 새 모델로 교체한다. None이면 끄고 POST /api/admin/reload 로만 다시 읽는다.
+MODEL_WATCH_INTERVAL = None
+# 관리 API(POST /api/admin/reload)용 공유 비밀: 요청의 X-Admin-Token 헤더와 같아야 한다.
+# 설정하지 않으면 관리 API는 꺼진다 (403).
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN") or None
+
+# Excel 입력을 .npz 스냅샷으로 변환해 재시작 시 openpyxl 파싱을 건너뛴다.
+USE_DATA_SNAPSHOT = True
+# 입력 파일/설정 지문별로 보관할 ItemBuilder 결과 캐시 개수
+ITEM_BUILDER_CACHE_KEEP = 5
+# 알파 보정 방식: "swap"(교환 탐색) 또는 "greedy"(기존 순차 교체)
+SHORT_FORM_OPTIMIZER = "swap"
+# 교환 탐색의 빔 폭(1이면 단순 지역 탐색), 반복 횟수/시간(초) 예산
+SWAP_SEARCH_BEAM_WIDTH = 4
+SWAP_SEARCH_MAX_ITERATIONS = 200
+SWAP_SEARCH_TIME_BUDGET = 2.0
+# 문항 임베딩 방식: "tfidf"(단어 1-2gram) 또는 "hashing"(문자 n-gram, 디스크 저장소 재사용)
+EMBEDDING_BACKEND = "tfidf"
+HASHING_N_FEATURES = 1024
+# /api/recommend/batch 에서 한 번에 행렬로 채점하는 행 수
+BATCH_CHUNK_SIZE = 1000
+# /api/recommend 결과 LRU 캐시 크기 (0이면 끔), 데이터 재구축 시 비워진다
+RECOMMEND_CACHE_SIZE = 4096
+# LLM 재판정: 동시에 진행할 최대 호출 수와 호출당 마감 시간(초, 대기 시간 포함)
+LLM_MAX_CONCURRENCY = 8
+LLM_CALL_TIMEOUT = 8.0
+# LLM 판정 캐시: 메모리 LRU 크기, SQLite 영속 계층 경로(None이면 메모리만), 유효 기간(초)
+LLM_DECISION_CACHE_SIZE = 1024
+LLM_DECISION_CACHE_PATH = CACHE_DIR / "llm_decisions.sqlite3"
+LLM_DECISION_CACHE_TTL = 7 * 24 * 3600
+# 캐시 키를 만들 때 하위영역/최종 점수를 묶는 구간 폭
+LLM_CACHE_SCORE_BUCKET = 0.25
+# 요청 하나의 LLM 재판정 전체(대기+호출)에 허용하는 시간(초)
+LLM_REQUEST_BUDGET = 8.0
+# 회로 차단기: 연속 실패(또는 느린 호출) 횟수, 느린 호출 기준(초), 차단 유지 시간(초)
+LLM_BREAKER_FAILURES = 5
+LLM_BREAKER_SLOW_CALL = 5.0
+LLM_BREAKER_OPEN_SECONDS = 30.0
+# LLM 재판정 프롬프트(시스템+사용자) 토큰 예산과 응답 최대 토큰 수
+LLM_PROMPT_TOKEN_BUDGET = 160
+LLM_MAX_OUTPUT_TOKENS = 60
@@ -1,62 +1,46 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
 import pandas as pd
 
-from .config import SUBSCALE_FILE_CANDIDATES
-
-
-@dataclass
-class ItemMeta:
-    scale: str
-    item_number: int
-    subscale: str
-    text: str
-    reverse_coded: bool = False
-
-    @property
-    def question_id(self) -> str:
-        return f"{self.scale}-{self.item_number}"
+from .config import SNAPSHOT_DIR, USE_DATA_SNAPSHOT
+from .item_meta import ItemMeta
+from .model_inputs import resolve_subscale_path
+from .snapshot import SheetSnapshot
 
 
 class DataLoader:
-    def __init__(self, survey_path: Path, train_path: Path):
+    def __init__(self, survey_path: Path, train_path: Path, use_snapshot: bool = USE_DATA_SNAPSHOT):
         self.survey_path = survey_path
         self.train_path = train_path
+        self.use_snapshot = use_snapshot
         self.subscale_path = self._resolve_subscale_path()
 
     def _resolve_subscale_path(self) -> Path:
-        for candidate in SUBSCALE_FILE_CANDIDATES:
-            if candidate.exists():
-                return candidate
-        names = ", ".join(p.name for p in SUBSCALE_FILE_CANDIDATES)
-        raise FileNotFoundError(f"Could not find subscale file among: {names}")
+        return resolve_subscale_path()
 
     def load_survey_sheets(self) -> Dict[str, pd.DataFrame]:
-        survey_raw = pd.read_excel(self.survey_path, sheet_name=None)
-        return {
-            "EQ": survey_raw.get("EQ", pd.DataFrame()),
-            "FLA": survey_raw.get("Anxiety", survey_raw.get("FLA", pd.DataFrame())),
-            "Strategy": survey_raw.get("Strategy", pd.DataFrame()),
-        }
+        return self._load_sheets(self.survey_path)
 
     def load_subscale_sheets(self) -> Dict[str, pd.DataFrame]:
-        subscale_raw = pd.read_excel(self.subscale_path, sheet_name=None)
-        return {
-            "EQ": subscale_raw.get("EQ", pd.DataFrame()),
-            "FLA": subscale_raw.get("Anxiety", subscale_raw.get("FLA", pd.DataFrame())),
-            "Strategy": subscale_raw.get("Strategy", pd.DataFrame()),
-        }
+        return self._load_sheets(self.subscale_path)
 
     def load_train_sheets(self) -> Dict[str, pd.DataFrame]:
-        train_raw = pd.read_excel(self.train_path, sheet_name=None)
+        return self._load_sheets(self.train_path)
+
+    def _load_sheets(self, path: Path) -> Dict[str, pd.DataFrame]:
+        if not self.use_snapshot:
+            return self._read_excel_sheets(path)
+        return SheetSnapshot(path, SNAPSHOT_DIR).load(lambda: self._read_excel_sheets(path))
+
+    def _read_excel_sheets(self, path: Path) -> Dict[str, pd.DataFrame]:
+        raw = pd.read_excel(path, sheet_name=None)
         return {
-            "EQ": train_raw.get("EQ", pd.DataFrame()),
-            "FLA": train_raw.get("Anxiety", train_raw.get("FLA", pd.DataFrame())),
-            "Strategy": train_raw.get("Strategy", pd.DataFrame()),
+            "EQ": raw.get("EQ", pd.DataFrame()),
+            "FLA": raw.get("Anxiety", raw.get("FLA", pd.DataFrame())),
+            "Strategy": raw.get("Strategy", pd.DataFrame()),
         }
 
     def build_item_bank(
@@ -76,28 +60,30 @@ class DataLoader:
 
         for scale in ("EQ", "FLA"):
             mapping_rows = self._extract_subscale_rows(subscale[scale], scale)
-            survey_df = survey[scale]
+            text_by_number = self._index_item_texts(survey[scale])
             for sub_name, item_numbers, local_reverse in mapping_rows:
                 if "역코딩" in str(sub_name):
                     continue
-                subscale_map[scale].setdefault(sub_name, [])
+                sub_items = subscale_map[scale].setdefault(sub_name, [])
+                seen = set(sub_items)
                 for item_num in item_numbers:
-                    text = self._get_item_text(survey_df, item_num)
+                    text = text_by_number.get(item_num, "")
                     if not text:
                         continue
-                    is_reverse = item_num in reverse_coded[scale] or item_num in local_reverse
-                    meta = ItemMeta(
-                        scale=scale,
-                        item_number=item_num,
-                        subscale=sub_name,
-                        text=text,
-                        reverse_coded=is_reverse,
-                    )
-                    if meta.question_id not in all_items:
-                        all_items[meta.question_id] = meta
+                    question_id = f"{scale}-{item_num}"
+                    if question_id not in all_items:
+                        meta = ItemMeta(
+                            scale=scale,
+                            item_number=item_num,
+                            subscale=sub_name,
+                            text=text,
+                            reverse_coded=item_num in reverse_coded[scale] or item_num in local_reverse,
+                        )
+                        all_items[question_id] = meta
                         grouped[scale].append(meta)
-                    if item_num not in subscale_map[scale][sub_name]:
-                        subscale_map[scale][sub_name].append(item_num)
+                    if item_num not in seen:
+                        seen.add(item_num)
+                        sub_items.append(item_num)
 
         strategy_rows = self._extract_subscale_rows(subscale["Strategy"], "Strategy")
         for sub_name, item_numbers, _ in strategy_rows:
@@ -108,17 +94,19 @@ class DataLoader:
         return all_items, grouped, subscale_map
 
     def _parse_reverse_rows(self, subscale_df: pd.DataFrame) -> Set[int]:
-        reverse_items: Set[int] = set()
         if subscale_df.empty:
-            return reverse_items
+            return set()
 
-        for _, row in subscale_df.iterrows():
-            row_text = " ".join(str(x) for x in row.values if pd.notna(x))
-            if "역코딩" not in row_text:
-                continue
-            reverse_items.update(num for num, _ in self._parse_item_numbers(str(row.get("해당문항", ""))))
+        has_marker = pd.Series(False, index=subscale_df.index)
+        for col in subscale_df.columns:
+            values = subscale_df[col]
+            text = values.astype(object).where(values.notna(), "").astype(str)
+            has_marker |= text.str.contains("역코딩", regex=False).to_numpy()
+        if not has_marker.any():
+            return set()
 
-        return reverse_items
+        parsed = self._parse_item_column(self._item_column(subscale_df[has_marker.to_numpy()]))
+        return set(parsed["item"].tolist())
 
     def _extract_subscale_rows(
         self, subscale_df: pd.DataFrame, scale: str
@@ -134,32 +122,44 @@ class DataLoader:
             if sub_col not in subscale_df.columns:
                 sub_col = subscale_df.columns[0]
 
-        for _, row in subscale_df.iterrows():
-            sub_name = str(row.get(sub_col, "")).strip()
+        if sub_col in subscale_df.columns:
+            sub_names = subscale_df[sub_col].astype(object).map(str).str.strip().tolist()
+        else:
+            sub_names = [""] * len(subscale_df)
+
+        parsed = self._parse_item_column(self._item_column(subscale_df))
+        items_by_row = parsed.groupby("row", sort=False)["item"].agg(list).to_dict()
+        reverse_by_row = parsed[parsed["reverse"]].groupby("row", sort=False)["item"].agg(set).to_dict()
+
+        for pos, sub_name in enumerate(sub_names):
             if not sub_name:
                 continue
-            parsed = self._parse_item_numbers(str(row.get("해당문항", "")))
-            item_numbers = [num for num, _ in parsed]
-            reverse = {num for num, flag in parsed if flag}
-            rows.append((sub_name, item_numbers, reverse))
+            rows.append((sub_name, items_by_row.get(pos, []), reverse_by_row.get(pos, set())))
         return rows
 
-    def _get_item_text(self, survey_df: pd.DataFrame, item_number: int) -> str:
+    def _index_item_texts(self, survey_df: pd.DataFrame) -> Dict[int, str]:
+        """item number -> first matching survey text, built once per sheet."""
         if survey_df.empty:
-            return ""
-        candidates = survey_df[survey_df["문항"] == item_number]
-        if candidates.empty:
-            return ""
-        return str(candidates.iloc[0]["내용"]).strip()
-
-    def _parse_item_numbers(self, raw: str) -> List[Tuple[int, bool]]:
-        results: List[Tuple[int, bool]] = []
-        for token in raw.replace("/", ",").split(","):
-            t = token.strip()
-            if not t:
-                continue
-            is_reverse = "*" in t
-            cleaned = t.replace("*", "").strip()
-            if cleaned.isdigit():
-                results.append((int(cleaned), is_reverse))
-        return results
+            return {}
+        first = survey_df.drop_duplicates(subset="문항", keep="first")
+        texts = first["내용"].astype(object).map(str).str.strip()
+        return dict(zip(first["문항"].tolist(), texts.tolist()))
+
+    def _item_column(self, subscale_df: pd.DataFrame) -> pd.Series:
+        if "해당문항" not in subscale_df.columns:
+            return pd.Series([""] * len(subscale_df), dtype=object)
+        return subscale_df["해당문항"].astype(object).map(str).reset_index(drop=True)
+
+    def _parse_item_column(self, raw: pd.Series) -> pd.DataFrame:
+        """Split "1, 2*, 3/4" cells into (row, item, reverse) records, preserving order."""
+        tokens = raw.str.replace("/", ",", regex=False).str.split(",").explode().str.strip()
+        tokens = tokens[tokens.notna() & (tokens != "")]
+        cleaned = tokens.str.replace("*", "", regex=False).str.strip()
+        valid = cleaned.str.isdigit().fillna(False).astype(bool)
+        return pd.DataFrame(
+            {
+                "row": tokens.index[valid],
+                "item": cleaned[valid].astype(int).to_numpy(),
+                "reverse": tokens[valid].str.contains("*", regex=False).to_numpy(dtype=bool),
+            }
+        )
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from .config import EMBEDDING_BACKEND, EMBEDDING_STORE_DIR, HASHING_N_FEATURES
+from .data_loader import ItemMeta
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+
+class EmbeddingBackend(ABC):
+    """Turns item texts into L2-normalised row vectors for ItemBuilder.
+
+    ``prepare`` is called once per scale with every item of that scale before any
+    ``encode`` call, so corpus-level backends can fit there (the default does
+    nothing). ``encode`` must be implemented and may return a dense array or a
+    sparse CSR matrix.
+    """
+
+    name = "base"
+
+    def prepare(self, scale: str, items: List[ItemMeta]) -> None:
+        return None
+
+    @abstractmethod
+    def encode(self, items: List[ItemMeta]) -> np.ndarray | sparse.csr_matrix:
+        """Vectors for ``items``, one row per item in order."""
+
+
+class TfidfBackend(EmbeddingBackend):
+    """Word 1-2 gram TF-IDF with IDF taken over the encoded items only.
+
+    Token counts are fitted once per scale; each ``encode`` call derives the IDF
+    from its own rows, so the result equals a TfidfVectorizer fitted on those
+    texts alone. IDF depends on the corpus, so these vectors are not stored.
+    """
+
+    name = "tfidf-word-1-2"
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, Tuple[sparse.csr_matrix, Dict[str, int]]] = {}
+
+    def prepare(self, scale: str, items: List[ItemMeta]) -> None:
+        vectorizer = CountVectorizer(ngram_range=(1, 2))
+        counts = vectorizer.fit_transform([item.text for item in items]).astype(np.float64)
+        self._counts[scale] = (
+            counts.tocsr(),
+            {item.question_id: i for i, item in enumerate(items)},
+        )
+
+    def encode(self, items: List[ItemMeta]) -> sparse.csr_matrix:
+        counts, row_of = self._counts.get(items[0].scale, (None, {}))
+        if counts is None or any(item.question_id not in row_of for item in items):
+            vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+            return vectorizer.fit_transform([item.text for item in items]).tocsr()
+
+        sub = counts[[row_of[item.question_id] for item in items]]
+        n_docs = sub.shape[0]
+        doc_freq = np.bincount(sub.indices, minlength=sub.shape[1])
+        idf = np.log((n_docs + 1) / (doc_freq + 1)) + 1
+        return normalize(sparse.csr_matrix(sub.multiply(idf)), norm="l2")
+
+
+class HashingCharBackend(EmbeddingBackend):
+    """Hashed character 2-3 grams (within word boundaries), no fitting.
+
+    Character n-grams match Korean stems across particles and endings (e.g.
+    "수업에서"/"수업이"), and the vector depends only on the text, so results are
+    kept in an ``EmbeddingStore`` and only new or edited texts are encoded.
+    """
+
+    def __init__(
+        self,
+        n_features: int = HASHING_N_FEATURES,
+        ngram_range: Tuple[int, int] = (2, 3),
+        store_dir: Path | None = EMBEDDING_STORE_DIR,
+    ):
+        self.vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=ngram_range,
+            n_features=n_features,
+            alternate_sign=False,
+            norm="l2",
+        )
+        self.name = f"hashing-char_wb-{ngram_range[0]}-{ngram_range[1]}-{n_features}"
+        self.store = (
+            EmbeddingStore(store_dir / self.name, dim=n_features) if store_dir is not None else None
+        )
+
+    def encode(self, items: List[ItemMeta]) -> np.ndarray:
+        texts = [item.text for item in items]
+        if self.store is None:
+            return self._encode_texts(texts)
+        return self.store.lookup(texts, self._encode_texts)
+
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        return self.vectorizer.transform(texts).toarray().astype(np.float32)
+
+
+class EmbeddingStore:
+    """Append-only, memory-mapped vector file keyed by a hash of the text.
+
+    ``vectors.f32`` holds fixed-width float32 rows and ``keys.txt`` holds one
+    sha256(text) per line, line ``i`` naming row ``i``. Rows are flushed before
+    their keys are appended, so readers never see a key for a missing row; a
+    torn tail left by a crashed writer is trimmed by the next writer. Each backend
+    configuration gets its own directory, which keys the store by model as well.
+    """
+
+    _KEY_LINE = 65  # 64 hex chars + newline
+
+    def __init__(self, directory: Path, dim: int):
+        self.directory = directory
+        self.dim = dim
+        self.vectors_path = directory / "vectors.f32"
+        self.keys_path = directory / "keys.txt"
+        self.lock_path = directory / ".lock"
+        self._index: Dict[str, int] = {}
+        self._matrix: np.ndarray = np.zeros((0, dim), dtype=np.float32)
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def lookup(self, texts: List[str], encode: Callable[[List[str]], np.ndarray]) -> np.ndarray:
+        keys = [self.key(t) for t in texts]
+        if any(k not in self._index for k in keys):
+            self._refresh()
+        missing = list(dict.fromkeys(k for k in keys if k not in self._index))
+        if missing:
+            text_of = dict(zip(keys, texts))
+            self._append(missing, encode([text_of[k] for k in missing]))
+        return np.asarray(self._matrix[[self._index[k] for k in keys]], dtype=np.float32)
+
+    def _refresh(self) -> None:
+        """Pick up rows appended (by this or another process) since the last read."""
+        if not self.keys_path.exists() or not self.vectors_path.exists():
+            return
+        vector_rows = self.vectors_path.stat().st_size // (self.dim * 4)
+        with self.keys_path.open("rb") as f:
+            f.seek(len(self._index) * self._KEY_LINE)
+            tail = f.read()
+        for line in tail.split(b"\n"):
+            row = len(self._index)
+            if len(line) != self._KEY_LINE - 1 or row >= vector_rows:
+                break
+            self._index[line.decode("ascii")] = row
+        if len(self._index) > len(self._matrix):
+            self._matrix = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(len(self._index), self.dim)
+            )
+
+    def _append(self, keys: List[str], vectors: np.ndarray) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with self.lock_path.open("a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self._refresh()
+            pending = [(k, v) for k, v in zip(keys, vectors) if k not in self._index]
+            if not pending:
+                return
+            start = len(self._index)
+            with self.vectors_path.open("ab") as f:
+                f.truncate(start * self.dim * 4)
+                f.write(np.stack([v for _, v in pending]).astype(np.float32).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+            with self.keys_path.open("ab") as f:
+                f.truncate(start * self._KEY_LINE)
+                f.write("".join(f"{k}\n" for k, _ in pending).encode("ascii"))
+                f.flush()
+                os.fsync(f.fileno())
+            self._refresh()
+
+
+def build_embedding_backend(name: str = EMBEDDING_BACKEND) -> EmbeddingBackend:
+    if name == "tfidf":
+        return TfidfBackend()
+    if name == "hashing":
+        return HashingCharBackend()
+    raise ValueError(f"Unknown embedding backend: {name}")
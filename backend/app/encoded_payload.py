@@ -0,0 +1,89 @@
+"""JSON response bodies encoded once, with compressed variants and ETags.
+
+For responses that only change with the model version (``/api/questions``):
+the body is serialised exactly as FastAPI's ``JSONResponse`` would, compressed
+with gzip (and brotli when the ``brotli`` package is installed), and tagged with
+a strong ETag per content coding. Serving it is a header lookup.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from pydantic import BaseModel
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli는 선택 의존성
+    brotli = None
+
+# 같은 q 값이면 앞쪽(더 작은) 인코딩을 고른다.
+_PREFERENCE = ("br", "gzip", "identity")
+
+
+def _accepted(accept_encoding: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[name] = q
+    return accepted
+
+
+def _quality(accepted: Dict[str, float], coding: str) -> float:
+    if coding in accepted:
+        return accepted[coding]
+    if coding == "identity":
+        # 명시적으로 제외(identity;q=0, *;q=0)되지 않으면 항상 가능하되, 나열된 압축보다 뒤로 둔다.
+        return 0.001 if accepted.get("*", 1.0) > 0 else 0.0
+    return accepted.get("*", 0.0)
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """Pre-encoded body per content coding (``identity``, ``gzip``, maybe ``br``)."""
+
+    bodies: Dict[str, bytes]
+    etags: Dict[str, str]
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "EncodedPayload":
+        # Starlette JSONResponse.render 와 같은 직렬화라 기존 응답과 바이트 단위로 같다.
+        body = json.dumps(
+            model.model_dump(mode="json"), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+        bodies = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            bodies["br"] = brotli.compress(body, quality=11)
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        etags = {
+            coding: f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"' for coding in bodies
+        }
+        return cls(bodies=bodies, etags=etags)
+
+    def negotiate(self, accept_encoding: str) -> Tuple[str, bytes, str]:
+        """``(coding, body, etag)`` for the request's ``Accept-Encoding`` header."""
+        accepted = _accepted(accept_encoding)
+        candidates = [c for c in _PREFERENCE if c in self.bodies and _quality(accepted, c) > 0]
+        best = max(candidates, key=lambda c: _quality(accepted, c), default="identity")
+        return best, self.bodies[best], self.etags[best]
+
+    def not_modified(self, if_none_match: str | None) -> bool:
+        """True if ``If-None-Match`` names any variant of this body (weak comparison)."""
+        if not if_none_match:
+            return False
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or not tags.isdisjoint(self.etags.values())
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
 import json
+import time
 from collections import defaultdict
 from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
 
-from .config import MIN_CRONBACH_ALPHA, SIMILARITY_THRESHOLD, TARGET_SHORT_ITEMS
+from .alpha_engine import AlphaEngine
+from .config import (
+    MIN_CRONBACH_ALPHA,
+    SHORT_FORM_OPTIMIZER,
+    SIMILARITY_THRESHOLD,
+    SWAP_SEARCH_BEAM_WIDTH,
+    SWAP_SEARCH_MAX_ITERATIONS,
+    SWAP_SEARCH_TIME_BUDGET,
+    TARGET_SHORT_ITEMS,
+)
 from .data_loader import ItemMeta
+from .embeddings import EmbeddingBackend, build_embedding_backend
+from .model_inputs import builder_config
+from .snapshot import atomic_write_bytes
 
 
 def cronbach_alpha(df: pd.DataFrame) -> float:
@@ -33,10 +46,14 @@ class ItemBuilder:
         all_items: Dict[str, ItemMeta],
         grouped_items: Dict[str, List[ItemMeta]],
         train_sheets: Dict[str, pd.DataFrame],
+        embedding: EmbeddingBackend | None = None,
     ):
         self.all_items = all_items
         self.grouped_items = grouped_items
         self.train_sheets = train_sheets
+        self.embedding = embedding or build_embedding_backend()
+        self._prepared_scales: Set[str] = set()
+        self._alpha_engines: Dict[str, AlphaEngine] = {}
 
     def build(self) -> Dict:
         selected_by_scale: Dict[str, List[ItemMeta]] = {}
@@ -62,8 +79,16 @@ class ItemBuilder:
             selected = self._enforce_target_count(selected, groups, target_total)
             alpha_report[scale] = self._compute_alpha(scale, selected)
             if alpha_report[scale] < MIN_CRONBACH_ALPHA:
-                selected = self._repair_alpha(scale, selected, groups, target_total)
+                if SHORT_FORM_OPTIMIZER == "swap":
+                    selected = self._swap_search(scale, selected)
+                else:
+                    selected = self._repair_alpha(scale, selected, groups, target_total)
                 alpha_report[scale] = self._compute_alpha(scale, selected)
+                final_ids = {q.question_id for q in selected}
+                removed_by_subscale[scale] = {
+                    subscale: [q.question_id for q in sub_items if q.question_id not in final_ids]
+                    for subscale, sub_items in groups.items()
+                }
 
             selected_by_scale[scale] = selected
 
@@ -78,8 +103,14 @@ class ItemBuilder:
         return payload
 
     def save(self, output_path: Path, payload: Dict) -> None:
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        atomic_write_bytes(
+            output_path, json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        )
+
+    @staticmethod
+    def cache_config() -> Dict:
+        """Settings that change build() output; part of the results-cache fingerprint."""
+        return builder_config()
 
     def _group_by_subscale(self, items: List[ItemMeta]) -> Dict[str, List[ItemMeta]]:
         groups: Dict[str, List[ItemMeta]] = defaultdict(list)
@@ -117,31 +148,37 @@ class ItemBuilder:
         if len(items) <= quota:
             return list(items)
 
-        embeddings = self._encode([item.text for item in items])
-        sim = cosine_similarity(embeddings)
+        embeddings = self._encode(items)
+        gram = (embeddings @ embeddings.T).tocsr() if sparse.issparse(embeddings) else None
+        # max_sim[i]: highest similarity of item i to anything picked so far
+        max_sim = np.full(len(items), -np.inf)
         selected_idx: List[int] = []
 
-        for idx in range(len(items)):
-            if len(selected_idx) >= quota:
-                break
+        def pick(idx: int) -> None:
             if not selected_idx:
-                selected_idx.append(idx)
-                continue
-            max_sim = max(sim[idx, j] for j in selected_idx)
-            if max_sim < SIMILARITY_THRESHOLD:
-                selected_idx.append(idx)
+                max_sim[:] = 0.0
+            selected_idx.append(idx)
+            if gram is None:
+                np.maximum(max_sim, embeddings @ embeddings[idx], out=max_sim)
+                return
+            lo, hi = gram.indptr[idx], gram.indptr[idx + 1]
+            cols = gram.indices[lo:hi]
+            max_sim[cols] = np.maximum(max_sim[cols], gram.data[lo:hi])
+
+        idx = 0
+        while idx < len(items) and len(selected_idx) < quota:
+            pick(idx)
+            below = np.flatnonzero(max_sim[idx + 1 :] < SIMILARITY_THRESHOLD)
+            if not len(below):
+                break
+            idx += 1 + int(below[0])
 
         if len(selected_idx) < quota:
-            remaining = [i for i in range(len(items)) if i not in selected_idx]
-            diversity_scores = []
-            for i in remaining:
-                if not selected_idx:
-                    score = 1.0
-                else:
-                    score = min(1 - sim[i, j] for j in selected_idx)
-                diversity_scores.append((score, i))
-            diversity_scores.sort(reverse=True)
-            selected_idx.extend([idx for _, idx in diversity_scores[: quota - len(selected_idx)]])
+            remaining = np.setdiff1d(np.arange(len(items)), selected_idx)
+            scores = 1 - max_sim[remaining]
+            # (score, index) descending, as the previous tuple sort did
+            order = np.lexsort((-remaining, -scores))
+            selected_idx.extend(remaining[order][: quota - len(selected_idx)].tolist())
 
         selected_idx = sorted(selected_idx[:quota])
         return [items[i] for i in selected_idx]
@@ -169,17 +206,15 @@ class ItemBuilder:
         # len(selected) > target
         return selected[:target]
 
+    def _alpha_engine(self, scale: str) -> AlphaEngine:
+        if scale not in self._alpha_engines:
+            self._alpha_engines[scale] = AlphaEngine(
+                self.train_sheets[scale], self.grouped_items[scale]
+            )
+        return self._alpha_engines[scale]
+
     def _compute_alpha(self, scale: str, selected: List[ItemMeta]) -> float:
-        data = self.train_sheets[scale]
-        item_cols = [item.item_number for item in selected if item.item_number in data.columns]
-        if len(item_cols) < 2:
-            return 0.0
-        working = data[item_cols].dropna().copy()
-        reverse_cols = [item.item_number for item in selected if item.reverse_coded]
-        for col in reverse_cols:
-            if col in working.columns:
-                working[col] = 6 - working[col]
-        return cronbach_alpha(working)
+        return self._alpha_engine(scale).alpha(item.item_number for item in selected)
 
     def _repair_alpha(
         self,
@@ -195,27 +230,94 @@ class ItemBuilder:
         candidates.sort(key=lambda x: x.item_number)
 
         best = list(selected)
-        best_alpha = self._compute_alpha(scale, best)
+        state = self._alpha_engine(scale).state(item.item_number for item in best)
+        best_alpha = state.alpha
         for candidate in candidates:
-            trial = list(best)
-            if len(trial) >= target:
-                trial[-1] = candidate
+            if len(best) >= target:
+                move = {"add": candidate.item_number, "remove": best[-1].item_number}
             else:
-                trial.append(candidate)
-            alpha = self._compute_alpha(scale, trial)
+                move = {"add": candidate.item_number}
+            alpha = state.alpha_if(**move)
             if alpha > best_alpha:
-                best = trial
+                state.apply(**move)
+                if len(best) >= target:
+                    best[-1] = candidate
+                else:
+                    best.append(candidate)
                 best_alpha = alpha
             if best_alpha >= MIN_CRONBACH_ALPHA:
                 break
         return best[:target]
 
-    def _encode(self, texts: List[str]) -> np.ndarray:
-        from sklearn.feature_extraction.text import TfidfVectorizer
+    def _swap_search(
+        self,
+        scale: str,
+        selected: List[ItemMeta],
+        beam_width: int = SWAP_SEARCH_BEAM_WIDTH,
+        max_iterations: int = SWAP_SEARCH_MAX_ITERATIONS,
+        time_budget: float = SWAP_SEARCH_TIME_BUDGET,
+    ) -> List[ItemMeta]:
+        """Beam search over within-subscale swaps, scoring all swaps of a state at once.
+
+        Swaps only exchange items of the same subscale, so the per-subscale counts
+        from ``_allocate_quotas`` are kept. ``beam_width=1`` is plain hill climbing.
+        """
+        engine = self._alpha_engine(scale)
+        items_by_idx = {}
+        for item in self.grouped_items[scale]:
+            idx = engine.index.get(item.item_number)
+            if idx is not None:
+                items_by_idx.setdefault(idx, item)
+        sub_codes: Dict[str, int] = {}
+        subscale_of = np.full(engine.size, -1)
+        for idx, item in items_by_idx.items():
+            subscale_of[idx] = sub_codes.setdefault(item.subscale, len(sub_codes))
+
+        start = engine.state(item.item_number for item in selected)
+        best_state, best_alpha = start, start.alpha
+        beam = [(best_alpha, start)]
+        deadline = time.perf_counter() + time_budget
+
+        for _ in range(max_iterations):
+            if time.perf_counter() > deadline:
+                break
+            successors: Dict[bytes, tuple] = {}
+            for _, state in beam:
+                out_idx = np.flatnonzero(state.mask)
+                in_idx = np.flatnonzero(~state.mask)
+                scores = state.swap_alphas(out_idx, in_idx)
+                scores[subscale_of[out_idx][:, None] != subscale_of[in_idx][None, :]] = -np.inf
+                flat = np.argsort(scores, axis=None)[::-1][:beam_width]
+                for pos in flat:
+                    i, j = np.unravel_index(pos, scores.shape)
+                    if not np.isfinite(scores[i, j]):
+                        break
+                    child = state.copy()
+                    child.apply(
+                        add=engine.item_numbers[in_idx[j]], remove=engine.item_numbers[out_idx[i]]
+                    )
+                    successors.setdefault(child.mask.tobytes(), (float(scores[i, j]), child))
+
+            beam = sorted(successors.values(), key=lambda x: x[0], reverse=True)[:beam_width]
+            if not beam or beam[0][0] <= best_alpha + 1e-12:
+                break
+            best_alpha, best_state = beam[0]
+
+        chosen = set(np.flatnonzero(best_state.mask).tolist())
+        original = {engine.index.get(item.item_number) for item in selected}
+        kept = [
+            item
+            for item in selected
+            if engine.index.get(item.item_number) is None or engine.index[item.item_number] in chosen
+        ]
+        return kept + [items_by_idx[idx] for idx in sorted(chosen - original)]
 
-        vectorizer = TfidfVectorizer(ngram_range=(1, 2))
-        matrix = vectorizer.fit_transform(texts)
-        return matrix.toarray()
+    def _encode(self, items: List[ItemMeta]) -> np.ndarray | sparse.csr_matrix:
+        scale = items[0].scale
+        if scale not in self._prepared_scales:
+            self.embedding.prepare(scale, self.grouped_items.get(scale, []))
+            self._prepared_scales.add(scale)
+        return self.embedding.encode(items)
 
     def _to_public_dict(self, item: ItemMeta) -> Dict:
         d = asdict(item)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ItemMeta:
+    scale: str
+    item_number: int
+    subscale: str
+    text: str
+    reverse_coded: bool = False
+
+    @property
+    def question_id(self) -> str:
+        return f"{self.scale}-{self.item_number}"
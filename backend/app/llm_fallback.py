@@ -1,11 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import math
 import os
+import re
 import sys
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import Future
+from functools import cached_property
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from .config import PROJECT_ROOT
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .config import (
+    LLM_BREAKER_FAILURES,
+    LLM_BREAKER_OPEN_SECONDS,
+    LLM_BREAKER_SLOW_CALL,
+    LLM_CACHE_SCORE_BUCKET,
+    LLM_CALL_TIMEOUT,
+    LLM_DECISION_CACHE_PATH,
+    LLM_DECISION_CACHE_SIZE,
+    LLM_DECISION_CACHE_TTL,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_OUTPUT_TOKENS,
+    LLM_PROMPT_TOKEN_BUDGET,
+    LLM_REQUEST_BUDGET,
+    PROJECT_ROOT,
+)
+from .prompt_builder import PROMPT_VERSION, CompactPrompt, build_compact_prompt
+from .result_cache import DecisionCache
 
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
@@ -26,17 +50,107 @@ def _load_api_env() -> None:
             os.environ[key] = val
 
 
-class LLMFallbackRecommender:
+class _ReasonStream:
+    """Pulls the ``reason`` string value out of a JSON answer while it streams in."""
+
+    _START = re.compile(r'"reason"\s*:\s*"')
+
     def __init__(self) -> None:
+        self.text = ""
+        self._start: int | None = None
+        self._emitted = 0
+        self._done = False
+
+    def feed(self, delta: str) -> str:
+        self.text += delta
+        if self._done:
+            return ""
+        if self._start is None:
+            match = self._START.search(self.text)
+            if match is None:
+                return ""
+            self._start = match.end()
+        raw = self.text[self._start :]
+        end, escaped = len(raw), False
+        for i, ch in enumerate(raw):
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                end, self._done = i, True
+                break
+        if escaped and not self._done:
+            end -= 1  # 이스케이프 쌍이 다음 조각에서 완성될 때까지 보류
+        try:
+            value = json.loads(f'"{raw[:end]}"')
+        except ValueError:
+            return ""
+        fresh = value[self._emitted :]
+        self._emitted = len(value)
+        return fresh
+
+
+class LLMFallbackRecommender:
+    def __init__(
+        self,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        call_timeout: float = LLM_CALL_TIMEOUT,
+        cache: DecisionCache | None = None,
+        score_bucket: float = LLM_CACHE_SCORE_BUCKET,
+        request_budget: float = LLM_REQUEST_BUDGET,
+        breaker: CircuitBreaker | None = None,
+        prompt_token_budget: int = LLM_PROMPT_TOKEN_BUDGET,
+    ) -> None:
         _load_api_env()
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
-        self.gpt_api = self._build_client()
+        self.call_timeout = call_timeout
+        self.score_bucket = score_bucket
+        self.request_budget = request_budget
+        self.prompt_token_budget = prompt_token_budget
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=LLM_BREAKER_FAILURES,
+            slow_call_seconds=LLM_BREAKER_SLOW_CALL,
+            open_seconds=LLM_BREAKER_OPEN_SECONDS,
+        )
+        self.cache = cache or DecisionCache(
+            LLM_DECISION_CACHE_PATH, max_size=LLM_DECISION_CACHE_SIZE, ttl=LLM_DECISION_CACHE_TTL
+        )
+        # 동시에 진행 중인 LLM 호출 수 상한 (초과 요청은 마감 시간 안에서 대기)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        # 같은 판정 키로 진행 중인 호출 (동시 요청은 한 번의 호출 결과를 나눠 받는다)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._inflight_sync: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self.upstream_calls = 0
+        self.coalesced_calls = 0
 
-    def _build_client(self):
+    # openai SDK는 import만 0.5초가량 걸리므로 첫 LLM 호출 때 클라이언트를 만든다.
+    @cached_property
+    def gpt_api(self):
         try:
             from API.GptAPI import GptAPI
 
-            return GptAPI(model=self.model, temperature=0.2, max_tokens=300)
+            return GptAPI(
+                model=self.model,
+                temperature=0.2,
+                max_tokens=LLM_MAX_OUTPUT_TOKENS,
+                timeout=self.call_timeout,
+            )
+        except Exception:
+            return None
+
+    @cached_property
+    def async_gpt_api(self):
+        try:
+            from API.GptAPI import AsyncGptAPI
+
+            return AsyncGptAPI(
+                model=self.model,
+                temperature=0.2,
+                max_tokens=LLM_MAX_OUTPUT_TOKENS,
+                timeout=self.call_timeout,
+            )
         except Exception:
             return None
 
@@ -44,53 +158,301 @@ class LLMFallbackRecommender:
         self,
         base_result: Dict,
         user_profile: Optional[Dict[str, str]] = None,
+        deadline: float | None = None,
     ) -> Dict:
-        candidates: List[Dict] = base_result.get("candidates", [])
-        strategy_pool = sorted({c["strategy_subscale"] for c in candidates})
-
+        """``deadline`` is a ``time.monotonic()`` instant bounding the whole decision
+        (default: now + ``request_budget``)."""
+        if deadline is None:
+            deadline = time.monotonic() + self.request_budget
+        key = self._decision_key(base_result, user_profile)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         if not self.gpt_api:
             return self._rule_fallback(base_result, reason_prefix="LLM client unavailable")
+        if self.breaker.rejects():
+            return self._rule_fallback(base_result, reason_prefix="LLM circuit open")
 
         try:
-            system = (
-                "You are an educational strategy recommender. "
-                "Given two candidate strategies and user signal, choose one final strategy. "
-                "Return strict JSON only."
-            )
-            user_prompt = json.dumps(
-                {
-                    "instruction": "Pick one strategy from strategy_pool.",
-                    "strategy_pool": strategy_pool,
-                    "base_result": base_result,
-                    "user_profile": user_profile or {},
-                    "output_schema": {
-                        "recommended_strategy": "string",
-                        "reason": "string",
-                        "confidence": "number between 0 and 1",
-                    },
-                },
-                ensure_ascii=False,
-            )
-            content = self.gpt_api.chat(system=system, user=user_prompt)
-            if not content:
-                return self._rule_fallback(base_result, reason_prefix="LLM returned empty response")
-            content = content.strip()
-            parsed = self._parse_json(content)
-            strategy = parsed.get("recommended_strategy", "")
-            if strategy not in strategy_pool:
-                return self._rule_fallback(base_result, reason_prefix="LLM returned invalid strategy")
-            confidence = float(parsed.get("confidence", 0.5))
-            confidence = max(0.0, min(1.0, confidence))
-            return {
-                "recommended_strategy": strategy,
-                "reason": str(parsed.get("reason", "LLM fallback decision")),
-                "confidence": confidence,
-                "model": self.model,
-                "used_llm": True,
-            }
+            prompt = self._build_prompt(base_result, user_profile)
+            content = self._shared_chat_sync(key, prompt.system, prompt.user, deadline)
+            return self._remember(key, self._interpret(content, base_result, prompt))
+        except CircuitOpenError:
+            return self._rule_fallback(base_result, reason_prefix="LLM circuit open")
+        except TimeoutError:
+            return self._rule_fallback(base_result, reason_prefix="LLM deadline exceeded")
         except Exception:
             return self._rule_fallback(base_result, reason_prefix="LLM request failed")
 
+    async def adecide(
+        self,
+        base_result: Dict,
+        user_profile: Optional[Dict[str, str]] = None,
+        deadline: float | None = None,
+    ) -> Dict:
+        """Non-blocking ``decide``. Queueing for a slot, joining an identical
+        in-flight call and the completion itself must all finish by ``deadline``,
+        otherwise the rule-based choice is returned."""
+        if deadline is None:
+            deadline = time.monotonic() + self.request_budget
+        key = self._decision_key(base_result, user_profile)
+        cached = await self._acached(key)
+        if cached is not None:
+            return cached
+        if not self.async_gpt_api:
+            return self._rule_fallback(base_result, reason_prefix="LLM client unavailable")
+        if self.breaker.rejects():
+            return self._rule_fallback(base_result, reason_prefix="LLM circuit open")
+
+        try:
+            prompt = self._build_prompt(base_result, user_profile)
+            content = await self._shared_chat(key, prompt.system, prompt.user, deadline)
+            return self._remember_nowait(key, self._interpret(content, base_result, prompt))
+        except CircuitOpenError:
+            return self._rule_fallback(base_result, reason_prefix="LLM circuit open")
+        except asyncio.TimeoutError:
+            return self._rule_fallback(base_result, reason_prefix="LLM deadline exceeded")
+        except Exception:
+            return self._rule_fallback(base_result, reason_prefix="LLM request failed")
+
+    async def adecide_stream(
+        self,
+        base_result: Dict,
+        user_profile: Optional[Dict[str, str]] = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[Tuple[str, object]]:
+        """Streaming ``adecide``: yields ``("reasoning", text)`` pieces of the model's
+        reason as they arrive, then exactly one ``("decision", dict)``.
+
+        Shares the decision cache, concurrency cap, breaker and deadline with
+        ``adecide``; streamed calls are not coalesced.
+        """
+        if deadline is None:
+            deadline = time.monotonic() + self.request_budget
+        key = self._decision_key(base_result, user_profile)
+        cached = await self._acached(key)
+        if cached is not None:
+            yield "reasoning", cached["reason"]
+            yield "decision", cached
+            return
+        stream_chat = getattr(self.async_gpt_api, "chat_stream", None)
+        if stream_chat is None:
+            yield "decision", self._rule_fallback(base_result, reason_prefix="LLM client unavailable")
+            return
+        if self.breaker.rejects():
+            yield "decision", self._rule_fallback(base_result, reason_prefix="LLM circuit open")
+            return
+
+        prompt = self._build_prompt(base_result, user_profile)
+        reason = _ReasonStream()
+        slot_taken = allowed = False
+        start = 0.0
+        try:
+            remaining = deadline - time.monotonic()
+            await asyncio.wait_for(self._slots.acquire(), timeout=max(remaining, 0.001))
+            slot_taken = True
+            if not self.breaker.allow():
+                raise CircuitOpenError("LLM circuit open")
+            allowed, start = True, time.monotonic()
+            self.upstream_calls += 1
+            pieces = stream_chat(system=prompt.system, user=prompt.user)
+            try:
+                while True:
+                    remaining = min(deadline, start + self.call_timeout) - time.monotonic()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    try:
+                        delta = await asyncio.wait_for(pieces.__anext__(), timeout=remaining)
+                    except StopAsyncIteration:
+                        break
+                    fresh = reason.feed(delta)
+                    if fresh:
+                        yield "reasoning", fresh
+            finally:
+                await pieces.aclose()
+            result = self._interpret(reason.text, base_result, prompt)
+            self.breaker.record(bool(reason.text), time.monotonic() - start)
+            allowed = False
+            yield "decision", self._remember_nowait(key, result)
+        except CircuitOpenError:
+            yield "decision", self._rule_fallback(base_result, reason_prefix="LLM circuit open")
+        except asyncio.TimeoutError:
+            yield "decision", self._rule_fallback(base_result, reason_prefix="LLM deadline exceeded")
+        except (GeneratorExit, asyncio.CancelledError):
+            # 클라이언트가 먼저 끊은 것은 상류 장애로 세지 않는다. uvicorn에서는 끊김이
+            # 스트림 작업 취소(CancelledError)로, 제너레이터 정리 시에는 GeneratorExit로 온다.
+            if allowed:
+                self.breaker.abandon()
+            allowed = False
+            raise
+        except Exception:
+            yield "decision", self._rule_fallback(base_result, reason_prefix="LLM request failed")
+        finally:
+            if allowed:
+                self.breaker.record(False, time.monotonic() - start)
+            if slot_taken:
+                self._slots.release()
+
+    async def _limited_chat(self, system: str, user: str) -> str | None:
+        async with self._slots:
+            # 슬롯을 얻은 뒤에 차단기를 확인해 반개방 탐침이 실제 호출에만 쓰이게 한다.
+            if not self.breaker.allow():
+                raise CircuitOpenError("LLM circuit open")
+            start = time.monotonic()
+            ok = False
+            try:
+                content = await self.async_gpt_api.chat(system=system, user=user)
+                ok = content is not None
+                return content
+            finally:
+                self.breaker.record(ok, time.monotonic() - start)
+
+    async def _shared_chat(self, key: str, system: str, user: str, deadline: float) -> str | None:
+        """Join the in-flight call for ``key`` or start one; every waiter gets its
+        content or its exception, and stops waiting at its own ``deadline``."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise asyncio.TimeoutError()
+        task = self._inflight.get(key)
+        if task is None:
+            self.upstream_calls += 1
+            task = asyncio.ensure_future(
+                asyncio.wait_for(self._limited_chat(system, user), timeout=self.call_timeout)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_flight(key, done))
+        else:
+            self.coalesced_calls += 1
+        # 한 대기자가 떠나도 공유 호출은 계속되도록 shield로 감싼다.
+        return await asyncio.wait_for(asyncio.shield(task), timeout=remaining)
+
+    def _finish_flight(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 모든 대기자가 떠난 뒤 실패해도 경고가 남지 않게 한다.
+
+    def _shared_chat_sync(self, key: str, system: str, user: str, deadline: float) -> str | None:
+        with self._inflight_lock:
+            flight = self._inflight_sync.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight_sync[key] = Future()
+                self.upstream_calls += 1
+            else:
+                self.coalesced_calls += 1
+        if not leader:
+            return flight.result(timeout=max(0.0, deadline - time.monotonic()))
+        try:
+            if not self.breaker.allow():
+                raise CircuitOpenError("LLM circuit open")
+            start = time.monotonic()
+            content = self.gpt_api.chat(system=system, user=user)
+            self.breaker.record(content is not None, time.monotonic() - start)
+            flight.set_result(content)
+            return content
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight_sync.pop(key, None)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {
+            "single_flight": {
+                "upstream_calls": self.upstream_calls,
+                "coalesced_calls": self.coalesced_calls,
+                "in_flight": len(self._inflight) + len(self._inflight_sync),
+            },
+            "breaker": self.breaker.snapshot(),
+        }
+
+    def _decision_key(self, base_result: Dict, user_profile: Optional[Dict[str, str]]) -> str:
+        """Normalised prompt used as the decision-cache key.
+
+        Only what the LLM is asked to weigh is kept: per candidate the driver,
+        subscales and correlation, with user/final scores bucketed by
+        ``score_bucket`` so near-identical ties share one decision.
+        ``PROMPT_VERSION`` is included so a new prompt or answer format never
+        serves decisions made with the old one.
+        """
+
+        def bucket(value) -> int | None:
+            if value is None or not math.isfinite(float(value)):
+                return None
+            return math.floor(float(value) / self.score_bucket)
+
+        candidates = [
+            [
+                c.get("driver"),
+                c.get("driver_subscale"),
+                c.get("strategy_subscale"),
+                round(float(c.get("correlation", 0.0)), 3),
+                bucket(c.get("user_subscale_score")),
+                bucket(c.get("final_score")),
+            ]
+            for c in base_result.get("candidates", [])
+        ]
+        return json.dumps(
+            {
+                "prompt_version": PROMPT_VERSION,
+                "model": self.model,
+                "bucket": self.score_bucket,
+                "candidates": candidates,
+                "user_profile": sorted((user_profile or {}).items()),
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+
+    def _cached(self, key: str) -> Dict | None:
+        return self._as_cache_hit(self.cache.get(key))
+
+    async def _acached(self, key: str) -> Dict | None:
+        # 메모리 계층만 이벤트 루프에서 보고, SQLite 조회는 작업 스레드에서 한다.
+        return self._as_cache_hit(await self.cache.aget(key))
+
+    @staticmethod
+    def _as_cache_hit(hit: Dict | None) -> Dict | None:
+        if hit is None:
+            return None
+        # 캐시 적중은 model 앞에 "cache:"를 붙여 표시한다 (used_llm은 원래 LLM 판정이므로 유지).
+        return {**hit, "model": f"cache:{hit['model']}"}
+
+    def _remember(self, key: str, result: Dict) -> Dict:
+        if result.get("used_llm"):
+            self.cache.put(key, result)
+        return result
+
+    def _remember_nowait(self, key: str, result: Dict) -> Dict:
+        if result.get("used_llm"):
+            self.cache.put_nowait(key, result)
+        return result
+
+    def _build_prompt(
+        self, base_result: Dict, user_profile: Optional[Dict[str, str]]
+    ) -> CompactPrompt:
+        return build_compact_prompt(base_result, user_profile, self.prompt_token_budget)
+
+    def _interpret(self, content: str | None, base_result: Dict, prompt: CompactPrompt) -> Dict:
+        if not content:
+            return self._rule_fallback(base_result, reason_prefix="LLM returned empty response")
+        content = content.strip()
+        parsed = self._parse_json(content)
+        strategy = prompt.resolve(parsed.get("pick", parsed.get("recommended_strategy", "")))
+        if strategy is None:
+            return self._rule_fallback(base_result, reason_prefix="LLM returned invalid strategy")
+        confidence = float(parsed.get("confidence", 0.5))
+        confidence = max(0.0, min(1.0, confidence))
+        return {
+            "recommended_strategy": strategy,
+            "reason": str(parsed.get("reason", "LLM fallback decision")),
+            "confidence": confidence,
+            "model": self.model,
+            "used_llm": True,
+        }
+
     def _parse_json(self, text: str) -> Dict:
         try:
             return json.loads(text)
@@ -101,6 +463,10 @@ class LLMFallbackRecommender:
                 return json.loads(text[start : end + 1])
             raise
 
+    def provisional(self, base_result: Dict) -> Dict:
+        """Rule-based decision shown while an LLM refinement is still pending."""
+        return self._rule_fallback(base_result, reason_prefix="Rule-based result, LLM refinement pending")
+
     def _rule_fallback(self, base_result: Dict, reason_prefix: str) -> Dict:
         candidates: List[Dict] = base_result.get("candidates", [])
         if not candidates:
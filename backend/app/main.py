@@ -1,17 +1,43 @@
-from fastapi import FastAPI, HTTPException
+import hmac
+import json
+from contextlib import contextmanager
+from typing import AsyncIterator, Iterator, List
+
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.requests import ClientDisconnect
 
-from .config import SURVEY_FILE, TRAIN_FILE
+from .batch import BatchRow, encode_line, iter_body_lines, iter_upload_rows
+from .config import (
+    ADMIN_TOKEN,
+    BATCH_CHUNK_SIZE,
+    MODEL_WATCH_INTERVAL,
+    SERVING_ARTIFACT_DIR,
+    SERVING_ARTIFACT_PATH,
+    SURVEY_FILE,
+    TRAIN_FILE,
+)
 from .models import (
+    AdaptiveRequest,
+    AdaptiveResponse,
     LLMFallbackRequest,
     LLMFallbackResponse,
     QuestionsResponse,
+    RecommendBatchRequest,
     RecommendRequest,
     RecommendResponse,
     RequestionRequest,
     RequestionResponse,
+    SessionAnswerRequest,
+    SessionLLMFallbackRequest,
+    SessionResponse,
 )
 from .service import RecommendationService
+from .serving_model import ServingModel
 
 app = FastAPI(title="Adaptive Learning Strategy API", version="0.1.0")
 app.add_middleware(
@@ -22,7 +48,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-service = RecommendationService(survey_path=SURVEY_FILE, train_path=TRAIN_FILE)
+
+@app.exception_handler(RequestValidationError)
+async def non_finite_answers(request: Request, exc: RequestValidationError) -> Response:
+    """NaN/Infinity answers are bad input like any other invalid answer: 400, not 422."""
+    errors = exc.errors()
+    if errors and all(error["type"] == "finite_number" for error in errors):
+        return JSONResponse(status_code=400, content={"detail": "Answers must be finite numbers."})
+    return await request_validation_exception_handler(request, exc)
+
+
+service = RecommendationService(
+    survey_path=SURVEY_FILE,
+    train_path=TRAIN_FILE,
+    artifact_path=SERVING_ARTIFACT_PATH,
+    prebuilt_dir=SERVING_ARTIFACT_DIR,
+)
+if MODEL_WATCH_INTERVAL:
+    service.watch_inputs(MODEL_WATCH_INTERVAL)
 
 
 @app.get("/api/health")
@@ -30,10 +73,39 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@app.get("/api/metrics")
+def metrics() -> dict:
+    return {"model": service.model_status(), "caches": service.cache_stats(), "llm": service.llm_stats()}
+
+
+def _require_admin(token: str | None) -> None:
+    if ADMIN_TOKEN is None:
+        raise HTTPException(status_code=403, detail="Admin API is disabled; set ADMIN_TOKEN to enable it.")
+    if token is None or not hmac.compare_digest(token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")):
+        raise HTTPException(status_code=401, detail="Missing or invalid X-Admin-Token header.")
+
+
+@app.post("/api/admin/reload", status_code=202)
+def reload_model(x_admin_token: str | None = Header(default=None)) -> dict:
+    """Rebuild in the background if the input files changed; the new model is swapped in when ready.
+
+    Requires the ``X-Admin-Token`` header to match ``ADMIN_TOKEN``.
+    """
+    _require_admin(x_admin_token)
+    return service.reload()
+
+
 @app.get("/api/questions", response_model=QuestionsResponse)
-def questions() -> QuestionsResponse:
-    qs = service.get_short_questions()
-    return QuestionsResponse(total_questions=len(qs), questions=qs)
+async def questions(request: Request) -> Response:
+    """Pre-encoded per model version; repeat clients revalidate with ``If-None-Match`` and get 304."""
+    payload = service.model.questions_payload
+    coding, body, etag = payload.negotiate(request.headers.get("accept-encoding", ""))
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if payload.not_modified(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    if coding != "identity":
+        headers["Content-Encoding"] = coding
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @app.post("/api/recommend", response_model=RecommendResponse)
@@ -45,22 +117,193 @@ def recommend(payload: RecommendRequest) -> RecommendResponse:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+@app.post("/api/adaptive/next", response_model=AdaptiveResponse)
+def adaptive_next(payload: AdaptiveRequest) -> AdaptiveResponse:
+    """Adaptive survey: send the answers so far, get the next item or the final result."""
+    return AdaptiveResponse(**service.adaptive_next(payload.responses))
+
+
+class _UploadStreamingResponse(StreamingResponse):
+    """Streams results while the request body is still being read.
+
+    The default StreamingResponse may poll ``receive()`` for a disconnect, which
+    would steal body chunks from ``request.stream()``; a dropped client still
+    surfaces as a send error here.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+
+
+def _score_chunk(rows: List[BatchRow], model: ServingModel) -> List[bytes]:
+    return [encode_line(row, result) for row, result in zip(rows, service.recommend_batch(rows, model))]
+
+
+@app.post("/api/recommend/batch")
+def recommend_batch(payload: RecommendBatchRequest) -> StreamingResponse:
+    model = service.model
+
+    def lines() -> Iterator[bytes]:
+        for start in range(0, len(payload.items), BATCH_CHUNK_SIZE):
+            rows = [
+                BatchRow(
+                    index=start + offset,
+                    responses=item.responses,
+                    tie_breaker_answers=item.tie_breaker_answers,
+                )
+                for offset, item in enumerate(payload.items[start : start + BATCH_CHUNK_SIZE])
+            ]
+            yield from _score_chunk(rows, model)
+
+    return StreamingResponse(
+        lines(), media_type="application/x-ndjson", headers={"X-Model-Version": model.version}
+    )
+
+
+@app.post("/api/recommend/batch/upload")
+async def recommend_batch_upload(request: Request) -> StreamingResponse:
+    """Raw CSV (question-id header) or NDJSON (one RecommendRequest per line) body."""
+    content_type = request.headers.get("content-type", "")
+    if "csv" in content_type:
+        fmt = "csv"
+    elif "ndjson" in content_type or "jsonl" in content_type or "json-lines" in content_type:
+        fmt = "ndjson"
+    else:
+        raise HTTPException(
+            status_code=415, detail="Use text/csv or application/x-ndjson for batch uploads."
+        )
+    model = service.model
+
+    async def lines() -> AsyncIterator[bytes]:
+        chunk: List[BatchRow] = []
+        async for row in iter_upload_rows(iter_body_lines(request.stream()), fmt):
+            chunk.append(row)
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                for line in await run_in_threadpool(_score_chunk, chunk, model):
+                    yield line
+                chunk = []
+        if chunk:
+            for line in await run_in_threadpool(_score_chunk, chunk, model):
+                yield line
+
+    return _UploadStreamingResponse(
+        lines(), media_type="application/x-ndjson", headers={"X-Model-Version": model.version}
+    )
+
+
 @app.post("/api/requestion", response_model=RequestionResponse)
 def requestion(payload: RequestionRequest) -> RequestionResponse:
+    model = service.model
     questions = service.get_requestion_pair(
         payload.eq_subscale,
         payload.fla_subscale,
         payload.used_question_ids,
+        model,
+    )
+    return RequestionResponse(
+        round_limit=service.round_limit, questions=questions, model_version=model.version
     )
-    return RequestionResponse(round_limit=service.round_limit, questions=questions)
 
 
 @app.post("/api/recommend/llm-fallback", response_model=LLMFallbackResponse)
-def recommend_llm_fallback(payload: LLMFallbackRequest) -> LLMFallbackResponse:
-    result = service.llm_fallback_recommend(
+async def recommend_llm_fallback(payload: LLMFallbackRequest) -> LLMFallbackResponse:
+    result = await service.allm_fallback_recommend(
         responses=payload.responses,
         tie_breaker_answers=payload.tie_breaker_answers,
         user_profile=payload.user_profile,
         force=payload.force,
     )
     return LLMFallbackResponse(**result)
+
+
+@app.post("/api/recommend/llm-fallback/stream")
+async def recommend_llm_fallback_stream(payload: LLMFallbackRequest) -> StreamingResponse:
+    """Server-sent events: ``rule`` at once, ``reasoning`` pieces, then ``decision``."""
+    try:
+        events = service.llm_fallback_events(
+            responses=payload.responses,
+            tie_breaker_answers=payload.tie_breaker_answers,
+            user_profile=payload.user_profile,
+            force=payload.force,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def frames() -> AsyncIterator[bytes]:
+        async for kind, data in events:
+            if kind == "decision":
+                data = LLMFallbackResponse(**data).model_dump()
+            yield f"event: {kind}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@contextmanager
+def _session_errors(session_id: str) -> Iterator[None]:
+    try:
+        yield
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session: {session_id}") from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/api/sessions", response_model=SessionResponse)
+def create_session() -> SessionResponse:
+    return SessionResponse(**service.create_session())
+
+
+@app.get("/api/sessions/{session_id}", response_model=SessionResponse)
+def get_session(session_id: str) -> SessionResponse:
+    with _session_errors(session_id):
+        return SessionResponse(**service.get_session(session_id))
+
+
+@app.delete("/api/sessions/{session_id}")
+def delete_session(session_id: str) -> dict:
+    if not service.delete_session(session_id):
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session: {session_id}")
+    return {"deleted": session_id}
+
+
+@app.post("/api/sessions/{session_id}/answers", response_model=SessionResponse)
+def session_answer(session_id: str, payload: SessionAnswerRequest) -> SessionResponse:
+    """One answer at a time; re-question items go to the session's tie-break answers."""
+    with _session_errors(session_id):
+        return SessionResponse(
+            **service.session_answer(session_id, payload.question_id, payload.value)
+        )
+
+
+@app.get("/api/sessions/{session_id}/recommend", response_model=RecommendResponse)
+def session_recommend(session_id: str) -> RecommendResponse:
+    with _session_errors(session_id):
+        return RecommendResponse(**service.session_recommend(session_id))
+
+
+@app.get("/api/sessions/{session_id}/requestion", response_model=RequestionResponse)
+def session_requestion(session_id: str) -> RequestionResponse:
+    model = service.model
+    with _session_errors(session_id):
+        questions = service.session_requestion(session_id, model)
+    return RequestionResponse(
+        round_limit=service.round_limit, questions=questions, model_version=model.version
+    )
+
+
+@app.post("/api/sessions/{session_id}/llm-fallback", response_model=LLMFallbackResponse)
+async def session_llm_fallback(
+    session_id: str, payload: SessionLLMFallbackRequest
+) -> LLMFallbackResponse:
+    with _session_errors(session_id):
+        result = await service.session_llm_fallback(
+            session_id, user_profile=payload.user_profile, force=payload.force
+        )
+    return LLMFallbackResponse(**result)
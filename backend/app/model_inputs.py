@@ -0,0 +1,56 @@
+"""Inputs that identify a built model, resolvable without pandas/scikit-learn.
+
+The fingerprint covers the three workbooks' contents and the settings that
+change ``ItemBuilder.build()`` output, so a serving worker can tell whether a
+prebuilt artifact is still valid before importing the training stack.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict
+
+from .config import (
+    EMBEDDING_BACKEND,
+    HASHING_N_FEATURES,
+    MIN_CRONBACH_ALPHA,
+    SHORT_FORM_OPTIMIZER,
+    SIMILARITY_THRESHOLD,
+    SUBSCALE_FILE_CANDIDATES,
+    SWAP_SEARCH_BEAM_WIDTH,
+    SWAP_SEARCH_MAX_ITERATIONS,
+    SWAP_SEARCH_TIME_BUDGET,
+    TARGET_SHORT_ITEMS,
+)
+from .result_cache import input_fingerprint
+
+# 선택 로직이 바뀌면 올려서 기존 캐시 항목을 무효화한다.
+BUILDER_VERSION = 1
+
+
+def builder_config() -> Dict:
+    """Settings that change ItemBuilder.build() output; part of the results-cache fingerprint."""
+    return {
+        "builder_version": BUILDER_VERSION,
+        "target_short_items": TARGET_SHORT_ITEMS,
+        "similarity_threshold": SIMILARITY_THRESHOLD,
+        "min_cronbach_alpha": MIN_CRONBACH_ALPHA,
+        "embedding": [EMBEDDING_BACKEND, HASHING_N_FEATURES],
+        "optimizer": SHORT_FORM_OPTIMIZER,
+        "swap_search": [
+            SWAP_SEARCH_BEAM_WIDTH,
+            SWAP_SEARCH_MAX_ITERATIONS,
+            SWAP_SEARCH_TIME_BUDGET,
+        ],
+    }
+
+
+def resolve_subscale_path() -> Path:
+    for candidate in SUBSCALE_FILE_CANDIDATES:
+        if candidate.exists():
+            return candidate
+    names = ", ".join(p.name for p in SUBSCALE_FILE_CANDIDATES)
+    raise FileNotFoundError(f"Could not find subscale file among: {names}")
+
+
+def model_fingerprint(survey_path: Path, train_path: Path) -> str:
+    return input_fingerprint([survey_path, resolve_subscale_path(), train_path], builder_config())
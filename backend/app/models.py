@@ -1,7 +1,10 @@
-from typing import Dict, List, Optional
+from typing import Annotated, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+# 응답 값: NaN/Infinity(또는 1e309처럼 넘치는 수)는 채점 전에 요청 단계에서 거른다.
+Answer = Annotated[float, Field(allow_inf_nan=False)]
+
 
 class SurveyQuestion(BaseModel):
     question_id: str
@@ -17,13 +20,18 @@ class SurveyQuestion(BaseModel):
 class QuestionsResponse(BaseModel):
     total_questions: int
     questions: List[SurveyQuestion]
+    model_version: str
 
 
 class RecommendRequest(BaseModel):
-    responses: Dict[str, float] = Field(
+    responses: Dict[str, Answer] = Field(
         ..., description="Key: question_id (EQ-7), Value: 1~5"
     )
-    tie_breaker_answers: Optional[Dict[str, List[float]]] = None
+    tie_breaker_answers: Optional[Dict[str, List[Answer]]] = None
+
+
+class RecommendBatchRequest(BaseModel):
+    items: List[RecommendRequest]
 
 
 class StrategyCandidate(BaseModel):
@@ -46,6 +54,7 @@ class RecommendResponse(BaseModel):
     eq_scores: Dict[str, float]
     fla_scores: Dict[str, float]
     strategy_ranking: List[Dict[str, float | str]]
+    model_version: str
 
 
 class RequestionRequest(BaseModel):
@@ -57,11 +66,48 @@ class RequestionRequest(BaseModel):
 class RequestionResponse(BaseModel):
     round_limit: int
     questions: List[SurveyQuestion]
+    model_version: str
+
+
+class AdaptiveRequest(BaseModel):
+    responses: Dict[str, Answer] = Field(
+        default_factory=dict, description="Answers so far. Key: question_id (EQ-7), Value: 1~5"
+    )
+
+
+class AdaptiveResponse(BaseModel):
+    done: bool
+    question: Optional[SurveyQuestion] = None
+    answered: int
+    max_items: int
+    predicted_strategy: Optional[str] = None
+    confidence: float
+    model_version: str
+    result: Optional[RecommendResponse] = None
+
+
+class SessionResponse(BaseModel):
+    session_id: str
+    answered: int
+    short_form_items: int
+    tie_breaker_answers: Dict[str, List[float]]
+    used_question_ids: List[str]
+    model_version: str
+
+
+class SessionAnswerRequest(BaseModel):
+    question_id: str
+    value: Answer = Field(..., description="1~5")
+
+
+class SessionLLMFallbackRequest(BaseModel):
+    user_profile: Optional[Dict[str, str]] = None
+    force: bool = False
 
 
 class LLMFallbackRequest(BaseModel):
-    responses: Dict[str, float]
-    tie_breaker_answers: Optional[Dict[str, List[float]]] = None
+    responses: Dict[str, Answer]
+    tie_breaker_answers: Optional[Dict[str, List[Answer]]] = None
     user_profile: Optional[Dict[str, str]] = None
     force: bool = False
 
@@ -74,3 +120,4 @@ class LLMFallbackResponse(BaseModel):
     used_llm: bool
     base_tie_triggered: bool
     base_score_gap: float
+    model_version: str
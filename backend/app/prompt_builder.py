@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .config import LLM_PROMPT_TOKEN_BUDGET
+
+try:
+    import tiktoken
+
+    _ENCODING = tiktoken.get_encoding("o200k_base")
+except Exception:  # pragma: no cover - tiktoken은 선택 의존성 (인코딩 파일이 없어도 동작)
+    _ENCODING = None
+
+TOKENIZER = "tiktoken/o200k_base" if _ENCODING is not None else "heuristic"
+
+# 프롬프트 문구나 응답 형식을 바꾸면 올린다 (LLM 판정 캐시 키에 들어가 이전 판정을 무효화한다).
+# 1: base_result 전체 JSON, 2: 선택지 글자 + {"pick","confidence","reason"}
+PROMPT_VERSION = 2
+
+OPTION_LABELS = "ABCDEFGH"
+# 프로필 값 하나에 허용하는 최대 글자 수
+PROFILE_VALUE_CHARS = 40
+
+SYSTEM_PROMPT = (
+    "Pick the better learning strategy for a student from the options. "
+    'Reply with JSON only: {"pick":"<option letter>","confidence":<0-1>,"reason":"<max 15 words>"}'
+)
+
+_WORD = re.compile(r"[A-Za-z]+|\d+|[^\sA-Za-z\d]")
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken when available, otherwise a conservative estimate.
+
+    The estimate charges one token per non-ASCII character (Hangul syllables are
+    rarely merged by BPE), per punctuation mark and per ~4 letters of a word.
+    """
+    if _ENCODING is not None:
+        return len(_ENCODING.encode(text))
+    tokens = 0
+    for piece in _WORD.findall(text):
+        if piece.isascii() and piece.isalnum():
+            tokens += (len(piece) + 3) // 4
+        else:
+            tokens += len(piece)
+    return tokens
+
+
+@dataclass
+class CompactPrompt:
+    system: str
+    user: str
+    options: List[str]
+    tokens: int
+
+    def resolve(self, pick: str) -> Optional[str]:
+        """Option letter (or the strategy name itself) -> strategy name."""
+        pick = str(pick).strip()
+        label = pick.upper()[:1]
+        if len(pick) == 1 and label in OPTION_LABELS[: len(self.options)]:
+            return self.options[OPTION_LABELS.index(label)]
+        return pick if pick in self.options else None
+
+
+def _option_line(label: str, candidate: Dict) -> str:
+    return (
+        f"{label}={candidate['strategy_subscale']} "
+        f"(via {candidate.get('driver', '')} {candidate.get('driver_subscale', '')} "
+        f"{float(candidate.get('user_subscale_score', 0.0)):.2f}/5, "
+        f"r={float(candidate.get('correlation', 0.0)):.2f}, "
+        f"score={float(candidate.get('final_score', 0.0)):.3f})"
+    )
+
+
+def build_compact_prompt(
+    base_result: Dict,
+    user_profile: Optional[Dict[str, str]] = None,
+    token_budget: int = LLM_PROMPT_TOKEN_BUDGET,
+) -> CompactPrompt:
+    """Minimal, deterministic prompt for one tie decision.
+
+    Only the candidates (one option per distinct strategy, best score first) and
+    the user profile are kept. Profile values are clipped and, if the prompt is
+    still over ``token_budget``, profile fields are dropped from the end; the
+    options are never dropped.
+    """
+    best: Dict[str, Dict] = {}
+    for c in base_result.get("candidates", []):
+        name = c["strategy_subscale"]
+        if name not in best or c.get("final_score", 0.0) > best[name].get("final_score", 0.0):
+            best[name] = c
+    ranked = sorted(best.values(), key=lambda c: (-float(c.get("final_score", 0.0)), c["strategy_subscale"]))
+    ranked = ranked[: len(OPTION_LABELS)]
+    options = [c["strategy_subscale"] for c in ranked]
+    option_lines = [_option_line(OPTION_LABELS[i], c) for i, c in enumerate(ranked)]
+
+    profile = [
+        f"{str(k).strip()}={' '.join(str(v).split())[:PROFILE_VALUE_CHARS]}"
+        for k, v in sorted((user_profile or {}).items())
+        if str(v).strip()
+    ]
+
+    def render(fields: List[str]) -> str:
+        lines = ["options:", *option_lines]
+        if fields:
+            lines.append("profile: " + "; ".join(fields))
+        return "\n".join(lines)
+
+    system_tokens = count_tokens(SYSTEM_PROMPT)
+    user = render(profile)
+    tokens = system_tokens + count_tokens(user)
+    while profile and tokens > token_budget:
+        profile.pop()
+        user = render(profile)
+        tokens = system_tokens + count_tokens(user)
+    return CompactPrompt(system=SYSTEM_PROMPT, user=user, options=options, tokens=tokens)
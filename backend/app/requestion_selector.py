@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from itertools import permutations
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .item_meta import ItemMeta
+from .scoring import RuleJudge
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from .strategy_judge import StrategyJudge
+
+
+class RequestionSelector:
+    """Serves the most informative unused re-question item for a tie.
+
+    In a tie the EQ driver proposes strategy A and the FLA driver strategy B, and
+    re-question answers move each side by ``(answer - 3)``. An EQ item therefore
+    helps when its raw answer tracks ``score(A) - score(B)`` among training
+    respondents, and an FLA item when it tracks ``score(B) - score(A)``. Each
+    removed item is ranked by that Pearson r for every (own, opponent) strategy
+    pair once at start-up, so a request only walks a ranked list past used ids.
+    """
+
+    def __init__(
+        self,
+        judge: StrategyJudge,
+        removed_by_subscale: Dict[str, Dict[str, List[str]]],
+        all_items: Dict[str, ItemMeta],
+    ):
+        from .strategy_judge import pairwise_pearson
+
+        self.judge = judge
+        self.removed_by_subscale = removed_by_subscale
+        strategies = judge.strategy_scores
+        self.strategy_names: List[str] = list(strategies.columns)
+
+        # (scale, own, opponent) -> 해당 척도의 제거 문항 전체 순위
+        self._scale_rank: Dict[Tuple[str, str, str], List[str]] = {}
+        # (scale, subscale, opponent) -> 하위영역 제거 문항 순위
+        self._subscale_rank: Dict[Tuple[str, str, str], List[str]] = {}
+        # 전략 쌍과 무관한 기본 순서 (상관표에 없는 하위영역용)
+        self._default: Dict[str, List[str]] = {}
+        self.discrimination: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+
+        for scale in ("EQ", "FLA"):
+            pools = removed_by_subscale.get(scale, {})
+            removed = [qid for pool in pools.values() for qid in pool if qid in all_items]
+            removed = list(dict.fromkeys(removed))
+            self._default[scale] = removed
+            answers = self._answers(scale, removed, all_items, strategies.index)
+            if answers is None:
+                continue
+            x, qids = answers
+
+            names = self.strategy_names
+            values = strategies.to_numpy(dtype=float)
+            pairs = list(permutations(range(len(names)), 2))
+            if not pairs:
+                continue
+            diffs = np.stack([values[:, i] - values[:, j] for i, j in pairs], axis=1)
+            r, _, _ = pairwise_pearson(x, diffs)
+            scored = np.where(np.isnan(r), -np.inf, r)
+
+            for col, (i, j) in enumerate(pairs):
+                order = np.argsort(-scored[:, col], kind="stable")
+                key = (scale, names[i], names[j])
+                self._scale_rank[key] = [qids[k] for k in order]
+                self.discrimination[key] = {qids[k]: float(r[k, col]) for k in order}
+
+            for subscale, pool in pools.items():
+                own_strategy = self._own(scale, subscale)
+                members = set(pool)
+                for opponent in names:
+                    ranking = self._scale_rank.get((scale, own_strategy, opponent))
+                    if ranking is not None:
+                        self._subscale_rank[(scale, subscale, opponent)] = [
+                            qid for qid in ranking if qid in members
+                        ]
+
+    def state(self) -> Dict:
+        """Rankings as JSON-friendly lists, for the serving artifact."""
+        return {
+            "scale_rank": [[*key, ranking] for key, ranking in self._scale_rank.items()],
+            "subscale_rank": [[*key, ranking] for key, ranking in self._subscale_rank.items()],
+            "default": self._default,
+        }
+
+    @classmethod
+    def from_state(
+        cls, judge: RuleJudge, removed_by_subscale: Dict[str, Dict[str, List[str]]], state: Dict
+    ) -> "RequestionSelector":
+        """Selector over precomputed rankings; no training data needed."""
+        selector = cls.__new__(cls)
+        selector.judge = judge
+        selector.removed_by_subscale = removed_by_subscale
+        selector._scale_rank = {(a, b, c): ranking for a, b, c, ranking in state["scale_rank"]}
+        selector._subscale_rank = {(a, b, c): ranking for a, b, c, ranking in state["subscale_rank"]}
+        selector._default = state["default"]
+        selector.discrimination = {}
+        selector.strategy_names = sorted({key[1] for key in selector._scale_rank})
+        return selector
+
+    def _own(self, scale: str, subscale: str) -> str | None:
+        choice = self.judge.corr_table.get(scale, {}).get(subscale)
+        return choice.strategy_subscale if choice else None
+
+    def _answers(
+        self, scale: str, qids: List[str], all_items: Dict[str, ItemMeta], index: pd.Index
+    ) -> Tuple[np.ndarray, List[str]] | None:
+        source = self.judge.train.get(scale)
+        if source is None or source.empty or not qids:
+            return None
+        if "참여자" in source.columns:
+            source = source.set_index("참여자")
+        kept = [qid for qid in qids if all_items[qid].item_number in source.columns]
+        if not kept:
+            return None
+        frame = source[[all_items[qid].item_number for qid in kept]].reindex(index)
+        return frame.to_numpy(dtype=float), kept
+
+    def pick(self, scale: str, subscale: str, opponent_subscale: str, used: Iterable[str]) -> str | None:
+        """Best unused item from ``subscale``'s pool, else from the whole scale."""
+        used = set(used)
+        other = "FLA" if scale == "EQ" else "EQ"
+        own = self._own(scale, subscale)
+        opponent = self._own(other, opponent_subscale)
+        if own is None or opponent is None or own == opponent:
+            # 두 후보 전략이 같거나 상관표에 없으면 어느 답도 우열을 바꾸지 않는다.
+            rankings = [
+                self.removed_by_subscale.get(scale, {}).get(subscale, []),
+                self._default.get(scale, []),
+            ]
+        else:
+            rankings = [
+                self._subscale_rank.get((scale, subscale, opponent), []),
+                self._scale_rank.get((scale, own, opponent), self._default.get(scale, [])),
+            ]
+        for ranking in rankings:
+            for qid in ranking:
+                if qid not in used:
+                    return qid
+        return None
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterable, Tuple
+
+from .snapshot import atomic_write_bytes, file_sha256
+
+
+def input_fingerprint(paths: Iterable[Path], config: Dict) -> str:
+    """Hash of the input files' contents plus the builder configuration."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(file_sha256(path).encode("ascii"))
+    digest.update(json.dumps(config, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ItemBuilderCache:
+    """Content-addressed store of ``ItemBuilder.build()`` payloads.
+
+    Each fingerprint gets its own file, so several versions live side by side and
+    switching back to an earlier input set does not trigger a rebuild. Writes go
+    through a temp file and ``os.replace`` so readers never see a partial entry.
+    """
+
+    def __init__(self, cache_dir: Path, keep: int = 5):
+        self.cache_dir = cache_dir
+        self.keep = keep
+
+    def path_for(self, fingerprint: str) -> Path:
+        return self.cache_dir / f"item_builder_{fingerprint[:24]}.json"
+
+    def get(self, fingerprint: str) -> Dict | None:
+        path = self.path_for(fingerprint)
+        if not path.exists():
+            return None
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("fingerprint") != fingerprint:
+            return None
+        path.touch()
+        return payload
+
+    def put(self, fingerprint: str, payload: Dict) -> Path:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = {**payload, "fingerprint": fingerprint}
+        path = self.path_for(fingerprint)
+        atomic_write_bytes(
+            path, json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        )
+        self._prune()
+        return path
+
+    def _prune(self) -> None:
+        entries = sorted(
+            self.cache_dir.glob("item_builder_*.json"),
+            key=lambda p: p.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[self.keep :]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU map with hit/miss/eviction counters.
+
+    ``max_size <= 0`` disables caching; every lookup then counts as a miss.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class DecisionCache:
+    """Two-tier TTL cache for LLM decisions: in-process LRU over a SQLite table.
+
+    Keys are strings (a normalised prompt); values are JSON-serialisable dicts.
+    The SQLite file survives restarts and can be shared by several workers.
+    ``db_path=None`` keeps only the memory tier.
+
+    ``get``/``put`` block on SQLite and are meant for threadpool callers. From
+    the event loop use ``aget`` (disk lookup in a worker thread) and
+    ``put_nowait`` (disk write queued on a background writer thread), so a lock
+    held by another worker never stalls the loop.
+    """
+
+    _PURGE_EVERY = 256
+
+    def __init__(self, db_path: Path | None, max_size: int, ttl: float):
+        self.ttl = ttl
+        self.memory = LRUCache(max_size)
+        self.db_path = db_path
+        self._db: sqlite3.Connection | None = None
+        self._write_db: sqlite3.Connection | None = None
+        self._writer: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # 읽기와 쓰기는 연결과 잠금을 따로 써서, WAL에서 쓰기가 잠금을 기다리는 동안에도 조회가 진행된다.
+        self._read_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.write_errors = 0
+        self._writes = 0
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._write_db = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5.0)
+            self._write_db.execute("PRAGMA journal_mode=WAL")
+            self._write_db.execute("PRAGMA synchronous=NORMAL")
+            self._write_db.execute(
+                "CREATE TABLE IF NOT EXISTS decisions "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._write_db.commit()
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5.0)
+            # 쓰기 순서를 지키도록 스레드 하나로 직렬화한다.
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="decision-cache")
+
+    @staticmethod
+    def digest(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Dict | None:
+        digest = self.digest(key)
+        hit, value = self._memory_get(digest)
+        if hit:
+            return value
+        return self._disk_get(digest)
+
+    async def aget(self, key: str) -> Dict | None:
+        digest = self.digest(key)
+        hit, value = self._memory_get(digest)
+        if hit:
+            return value
+        if self._db is None:
+            return self._disk_get(digest)
+        return await asyncio.to_thread(self._disk_get, digest)
+
+    def put(self, key: str, value: Dict) -> None:
+        digest = self.digest(key)
+        expires_at = time.time() + self.ttl
+        self.memory.put(digest, (expires_at, value))
+        if self._db is not None:
+            self._disk_put(digest, value, expires_at)
+
+    def put_nowait(self, key: str, value: Dict) -> None:
+        digest = self.digest(key)
+        expires_at = time.time() + self.ttl
+        self.memory.put(digest, (expires_at, value))
+        if self._writer is not None:
+            self._writer.submit(self._disk_put, digest, value, expires_at)
+
+    def _memory_get(self, digest: str) -> Tuple[bool, Dict | None]:
+        entry = self.memory.get(digest)
+        if entry is not None and entry[0] > time.time():
+            with self._lock:
+                self.memory_hits += 1
+            return True, entry[1]
+        return False, None
+
+    def _disk_get(self, digest: str) -> Dict | None:
+        row = None
+        if self._db is not None:
+            with self._read_lock:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM decisions WHERE key = ? AND expires_at > ?",
+                    (digest, time.time()),
+                ).fetchone()
+        if row is None:
+            with self._lock:
+                self.misses += 1
+            return None
+        value = json.loads(row[0])
+        self.memory.put(digest, (row[1], value))
+        with self._lock:
+            self.disk_hits += 1
+        return value
+
+    def _disk_put(self, digest: str, value: Dict, expires_at: float) -> None:
+        with self._write_lock:
+            try:
+                self._write_db.execute(
+                    "INSERT OR REPLACE INTO decisions (key, value, expires_at) VALUES (?, ?, ?)",
+                    (digest, json.dumps(value, ensure_ascii=False), expires_at),
+                )
+                self._writes += 1
+                if self._writes % self._PURGE_EVERY == 0:
+                    self._write_db.execute("DELETE FROM decisions WHERE expires_at <= ?", (time.time(),))
+                self._write_db.commit()
+            except sqlite3.Error:
+                # 다른 워커가 쓰기 잠금을 오래 쥐고 있으면 디스크 계층만 건너뛴다 (메모리 계층에는 이미 있다).
+                self._write_db.rollback()
+                with self._lock:
+                    self.write_errors += 1
+
+    def stats(self) -> Dict[str, int | float]:
+        memory = self.memory.stats()
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_size": memory["size"],
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": memory["evictions"],
+                "write_errors": self.write_errors,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .config import TIE_GAP_THRESHOLD
+
+
+@dataclass
+class CorrelationChoice:
+    driver: str
+    driver_subscale: str
+    strategy_subscale: str
+    correlation: float
+    p_value: float = float("nan")
+    n: int = 0
+
+
+@dataclass
+class ScoringKernel:
+    """Short form flattened into arrays so a response is scored with a few NumPy calls.
+
+    Columns follow ``selected_questions`` order (EQ first, then FLA); subscale ids
+    are per (scale, subscale) in order of first appearance.
+    """
+
+    column: Dict[str, int]
+    reverse: np.ndarray
+    subscale: np.ndarray
+    subscale_scale: List[str]
+    subscale_name: List[str]
+
+    def __post_init__(self) -> None:
+        size, n_sub = len(self.reverse), len(self.subscale_name)
+        self._onehot = np.zeros((size, n_sub))
+        self._onehot[np.arange(size), self.subscale] = 1.0
+        self._by_subscale = np.argsort(self.subscale, kind="stable")
+        self._starts = np.searchsorted(self.subscale[self._by_subscale], np.arange(n_sub))
+
+    @classmethod
+    def compile(cls, selected: Dict[str, List[Dict]]) -> "ScoringKernel":
+        column: Dict[str, int] = {}
+        reverse: List[bool] = []
+        subscale: List[int] = []
+        sub_id: Dict[Tuple[str, str], int] = {}
+        for scale in ("EQ", "FLA"):
+            for q in selected[scale]:
+                if q["question_id"] in column:
+                    continue
+                column[q["question_id"]] = len(reverse)
+                reverse.append(bool(q.get("reverse_coded", False)))
+                subscale.append(sub_id.setdefault((scale, q["subscale"]), len(sub_id)))
+        keys = list(sub_id)
+        return cls(
+            column=column,
+            reverse=np.array(reverse, dtype=bool),
+            subscale=np.array(subscale, dtype=np.intp),
+            subscale_scale=[scale for scale, _ in keys],
+            subscale_name=[name for _, name in keys],
+        )
+
+    def key(self, responses: Dict[str, float]) -> Tuple[float | None, ...]:
+        """Canonical form of ``responses`` as seen by this kernel.
+
+        One slot per short-form column (None when unanswered); unknown ids and
+        key order are ignored, and ``3 == 3.0`` hash alike, so inputs that score
+        identically share one key.
+        """
+        return tuple(map(responses.get, self.column))
+
+    def score(self, responses: Dict[str, float]) -> Dict[str, Dict[str, float]]:
+        return self.score_batch([responses])[0]
+
+    def accumulate(
+        self,
+        totals: Dict[str, List[float]],
+        question_id: str,
+        value: float,
+        previous: float | None = None,
+    ) -> bool:
+        """Add one answer to running ``subscale -> [count, sum, first column]`` totals.
+
+        O(1) per answer; ``previous`` (an earlier answer to the same item) is taken
+        out first. Returns False for ids outside the short form.
+        """
+        idx = self.column.get(question_id)
+        if idx is None:
+            return False
+        sid = int(self.subscale[idx])
+        key = f"{self.subscale_scale[sid]}/{self.subscale_name[sid]}"
+        entry = totals.setdefault(key, [0, 0.0, idx])
+        if previous is not None:
+            entry[0] -= 1
+            entry[1] -= 6 - previous if self.reverse[idx] else previous
+        entry[0] += 1
+        entry[1] += 6 - value if self.reverse[idx] else value
+        entry[2] = min(entry[2], idx)
+        return True
+
+    def score_totals(self, totals: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
+        """Subscale means from ``accumulate`` totals, ordered exactly as ``score`` orders them."""
+        scores: Dict[str, Dict[str, float]] = {"EQ": {}, "FLA": {}}
+        for key, (count, total, _) in sorted(totals.items(), key=lambda kv: kv[1][2]):
+            if count:
+                scale, name = key.split("/", 1)
+                scores[scale][name] = total / count
+        return scores
+
+    def score_batch(self, batch: Sequence[Dict[str, float]]) -> List[Dict[str, Dict[str, float]]]:
+        size = len(self.reverse)
+        values = np.zeros((len(batch), size))
+        answered = np.zeros((len(batch), size), dtype=bool)
+        for row, responses in enumerate(batch):
+            for qid, raw in responses.items():
+                idx = self.column.get(qid)
+                if idx is not None:
+                    values[row, idx] = float(raw)
+                    answered[row, idx] = True
+        return self._score_matrix(values, answered)
+
+    def _score_matrix(self, values: np.ndarray, answered: np.ndarray) -> List[Dict[str, Dict[str, float]]]:
+        size = len(self.reverse)
+        values = np.where(answered, np.where(self.reverse, 6 - values, values), 0.0)
+        finite = np.isfinite(values)
+
+        # inf·0 = NaN이 다른 하위영역으로 번지지 않도록 유한값만 곱하고, 비유한 응답이 있는
+        # 하위영역만 np.mean과 같게 +inf/-inf (둘 다 있거나 NaN이면 NaN)로 둔다.
+        sums = np.where(finite, values, 0.0) @ self._onehot
+        if not finite.all():
+            pos = (np.isposinf(values) @ self._onehot) > 0
+            neg = (np.isneginf(values) @ self._onehot) > 0
+            sums[pos] = np.inf
+            sums[neg] = -np.inf
+            sums[(pos & neg) | ((np.isnan(values) @ self._onehot) > 0)] = np.nan
+        counts = answered @ self._onehot
+
+        # 기존 dict 삽입 순서(응답된 첫 문항 순)를 그대로 재현한다.
+        positions = np.where(answered, np.arange(size), size)
+        if len(self._starts):
+            first = np.minimum.reduceat(positions[:, self._by_subscale], self._starts, axis=1)
+        else:
+            first = positions[:, :0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        orders = np.argsort(first, axis=1, kind="stable").tolist()
+
+        results: List[Dict[str, Dict[str, float]]] = []
+        for order, row_counts, row_means in zip(orders, counts.tolist(), means.tolist()):
+            scores: Dict[str, Dict[str, float]] = {"EQ": {}, "FLA": {}}
+            for sid in order:
+                if row_counts[sid]:
+                    scores[self.subscale_scale[sid]][self.subscale_name[sid]] = row_means[sid]
+            results.append(scores)
+        return results
+
+
+class RuleJudge:
+    """Rule-based recommendation from a built correlation table and short form.
+
+    Needs only NumPy, so a serving worker can run it from an exported artifact;
+    ``StrategyJudge`` builds the table from the training sheets.
+    """
+
+    def __init__(
+        self,
+        corr_table: Dict[str, Dict[str, CorrelationChoice]],
+        selected_questions: Dict[str, List[Dict]],
+    ):
+        self.corr_table = corr_table
+        self.selected = selected_questions
+        self.kernel = ScoringKernel.compile(self.selected)
+
+    def recommend(
+        self, responses: Dict[str, float], tie_breaker_answers: Dict[str, List[float]] | None = None
+    ) -> Dict:
+        return self._recommend_from_scores(self._user_subscale_scores(responses), tie_breaker_answers)
+
+    def recommend_scores(
+        self,
+        user_scores: Dict[str, Dict[str, float]],
+        tie_breaker_answers: Dict[str, List[float]] | None = None,
+    ) -> Dict:
+        """``recommend`` for subscale means that are already computed (e.g. session totals)."""
+        self._check_scores(user_scores)
+        return self._recommend_from_scores(user_scores, tie_breaker_answers)
+
+    def recommend_batch(
+        self, batch: Sequence[Tuple[Dict[str, float], Dict[str, List[float]] | None]]
+    ) -> List[Dict]:
+        """Score many respondents as one matrix; failed rows come back as ``{"error": ...}``."""
+        all_scores = self.kernel.score_batch([responses for responses, _ in batch])
+        results: List[Dict] = []
+        for user_scores, (_, tie_breaker_answers) in zip(all_scores, batch):
+            try:
+                self._check_scores(user_scores)
+                results.append(self._recommend_from_scores(user_scores, tie_breaker_answers))
+            except ValueError as exc:
+                results.append({"error": str(exc)})
+            except KeyError as exc:
+                results.append({"error": f"No strategy correlation for subscale {exc}"})
+        return results
+
+    def _recommend_from_scores(
+        self,
+        user_scores: Dict[str, Dict[str, float]],
+        tie_breaker_answers: Dict[str, List[float]] | None,
+    ) -> Dict:
+        top_eq = max(user_scores["EQ"].items(), key=lambda x: x[1])[0]
+        top_fla = max(user_scores["FLA"].items(), key=lambda x: x[1])[0]
+
+        eq_choice = self.corr_table["EQ"][top_eq]
+        fla_choice = self.corr_table["FLA"][top_fla]
+
+        eq_bonus, fla_bonus = self._tie_break_bonus(tie_breaker_answers)
+        eq_final = eq_choice.correlation + eq_bonus
+        fla_final = fla_choice.correlation + fla_bonus
+
+        score_gap = abs(eq_final - fla_final)
+        user_score_gap = abs(user_scores["EQ"][top_eq] - user_scores["FLA"][top_fla])
+        winner = eq_choice if eq_final >= fla_final else fla_choice
+        # README의 상관계수 박빙 조건을 우선 적용하고,
+        # 실제 응답이 박빙인 경우도 재질문으로 보내 정밀도를 확보한다.
+        tie_triggered = (score_gap < TIE_GAP_THRESHOLD) or (
+            user_score_gap < TIE_GAP_THRESHOLD
+        )
+
+        candidates = [
+            {
+                "driver": "EQ",
+                "driver_subscale": top_eq,
+                "strategy_subscale": eq_choice.strategy_subscale,
+                "correlation": eq_choice.correlation,
+                "user_subscale_score": user_scores["EQ"][top_eq],
+                "final_score": eq_final,
+            },
+            {
+                "driver": "FLA",
+                "driver_subscale": top_fla,
+                "strategy_subscale": fla_choice.strategy_subscale,
+                "correlation": fla_choice.correlation,
+                "user_subscale_score": user_scores["FLA"][top_fla],
+                "final_score": fla_final,
+            },
+        ]
+        strategy_ranking = sorted(
+            [
+                {"strategy_subscale": c["strategy_subscale"], "score": c["final_score"]}
+                for c in candidates
+            ],
+            key=lambda x: x["score"],
+            reverse=True,
+        )
+
+        return {
+            "recommended_strategy": winner.strategy_subscale,
+            "tie_triggered": tie_triggered,
+            "score_gap": score_gap,
+            "summary": f"{winner.driver_subscale} 기반 추천: {winner.strategy_subscale}",
+            "candidates": candidates,
+            "top_eq_subscale": top_eq,
+            "top_fla_subscale": top_fla,
+            "eq_scores": user_scores["EQ"],
+            "fla_scores": user_scores["FLA"],
+            "strategy_ranking": strategy_ranking,
+        }
+
+    def _user_subscale_scores(self, responses: Dict[str, float]) -> Dict[str, Dict[str, float]]:
+        scores = self.kernel.score(responses)
+        self._check_scores(scores)
+        return scores
+
+    def _check_scores(self, scores: Dict[str, Dict[str, float]]) -> None:
+        if not scores["EQ"] or not scores["FLA"]:
+            raise ValueError("Responses must include both EQ and FLA short-form items.")
+
+    def _tie_break_bonus(self, answers: Dict[str, List[float]] | None) -> Tuple[float, float]:
+        if not answers:
+            return 0.0, 0.0
+
+        def normalize(vals: List[float]) -> float:
+            if not vals:
+                return 0.0
+            v = np.mean(vals)
+            return float((v - 3.0) / 2.0 * 0.05)
+
+        return normalize(answers.get("EQ", [])), normalize(answers.get("FLA", []))
@@ -1,75 +1,297 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import random
+import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import AsyncIterator, Dict, Hashable, List, Tuple
 
-from .config import CACHE_DIR, MAX_REQUESTION_ROUNDS
-from .data_loader import DataLoader, ItemMeta
-from .item_builder import ItemBuilder
+from .adaptive import AdaptiveSurvey
+from .artifact import SERVING_STATE_VERSION, ArtifactCache, ServingArtifact
+from .batch import BatchRow, score_rows
+from .config import (
+    ADAPTIVE_DRAWS,
+    CACHE_DIR,
+    MAX_REQUESTION_ROUNDS,
+    PROJECT_ROOT,
+    RECOMMEND_CACHE_SIZE,
+    REQUESTION_SELECTOR,
+    SERVING_ARTIFACT_KEEP,
+    SESSION_DB_PATH,
+    SESSION_STORE_SIZE,
+    SESSION_TTL,
+)
+from .item_meta import ItemMeta
 from .llm_fallback import LLMFallbackRecommender
+from .model_inputs import model_fingerprint, resolve_subscale_path
 from .models import SurveyQuestion
-from .strategy_judge import StrategyJudge
+from .requestion_selector import RequestionSelector
+from .result_cache import LRUCache
+from .scoring import RuleJudge
+from .serving_model import ServingModel
+from .sessions import SurveySession, open_session_store
 
 
 class RecommendationService:
-    def __init__(self, survey_path: Path, train_path: Path):
-        self.loader = DataLoader(survey_path=survey_path, train_path=train_path)
-        self.all_items: Dict[str, ItemMeta] = {}
-        self.short_questions: Dict[str, List[Dict]] = {}
-        self.removed_by_subscale: Dict[str, Dict[str, List[str]]] = {}
-        self.subscale_map: Dict[str, Dict[str, List[int]]] = {}
-        self.train_sheets = {}
-        self.judge: StrategyJudge | None = None
+    """Serving state plus the API operations on it.
+
+    Built from the workbooks by default (pandas/scikit-learn are imported only
+    then). With ``artifact_path`` the state is attached from an exported serving
+    artifact instead, so the process never loads the training stack. With
+    ``prebuilt_dir`` an artifact matching the current inputs is attached when one
+    exists; otherwise the service is built and the artifact written for the next
+    start.
+
+    The state lives in one immutable ``ServingModel``; ``reload`` replaces it
+    while requests keep running. Operations read ``self.model`` once and use
+    only that snapshot.
+    """
+
+    def __init__(
+        self,
+        survey_path: Path,
+        train_path: Path,
+        artifact_path: Path | None = None,
+        prebuilt_dir: Path | None = None,
+    ):
+        self.survey_path = survey_path
+        self.train_path = train_path
+        self.artifact_path = artifact_path
+        self.prebuilt_dir = prebuilt_dir
         self.llm = LLMFallbackRecommender()
-        self._initialize()
-
-    def _initialize(self) -> None:
-        all_items, grouped_items, subscale_map = self.loader.build_item_bank()
-        self.all_items = all_items
-        self.subscale_map = subscale_map
-        self.train_sheets = self.loader.load_train_sheets()
-
-        cache_file = CACHE_DIR / "item_builder_results.json"
-        if cache_file.exists():
-            with cache_file.open("r", encoding="utf-8") as f:
-                payload = json.load(f)
+        self.recommend_cache = LRUCache(RECOMMEND_CACHE_SIZE)
+        self.sessions = open_session_store(SESSION_DB_PATH, SESSION_STORE_SIZE, SESSION_TTL)
+        self._reload_lock = threading.Lock()
+        self._reload_thread: threading.Thread | None = None
+        self.reloads = 0
+        self.last_reload: Dict | None = None
+        if artifact_path is not None:
+            self.model = ServingModel.attach(artifact_path)
+        elif prebuilt_dir is not None:
+            self.model = self._attach_or_build(prebuilt_dir)
         else:
-            builder = ItemBuilder(all_items, grouped_items, self.train_sheets)
-            payload = builder.build()
-            builder.save(cache_file, payload)
-
-        self.short_questions = payload["selected_questions"]
-        self.removed_by_subscale = payload["removed_by_subscale"]
-        self.judge = StrategyJudge(
-            train_sheets=self.train_sheets,
-            selected_questions=self.short_questions,
-            subscale_map=self.subscale_map,
+            self.model = ServingModel.build(survey_path, train_path)
+
+    def _artifact_cache(self, prebuilt_dir: Path) -> ArtifactCache:
+        return ArtifactCache(
+            prebuilt_dir,
+            keep=SERVING_ARTIFACT_KEEP,
+            serving_config={"adaptive_draws": ADAPTIVE_DRAWS, "state_version": SERVING_STATE_VERSION},
         )
 
-    def get_short_questions(self) -> List[SurveyQuestion]:
-        output: List[SurveyQuestion] = []
-        for scale in ("EQ", "FLA"):
-            for q in self.short_questions[scale]:
-                output.append(
-                    SurveyQuestion(
-                        question_id=q["question_id"],
-                        scale=q["scale"],
-                        item_number=int(q["item_number"]),
-                        subscale=q["subscale"],
-                        text=q["text"],
-                        reverse_coded=bool(q.get("reverse_coded", False)),
-                    )
-                )
-        return sorted(output, key=lambda x: (x.scale, x.subscale, x.item_number))
+    def _attach_or_build(self, prebuilt_dir: Path) -> ServingModel:
+        fingerprint = model_fingerprint(self.survey_path, self.train_path)
+        cache = self._artifact_cache(prebuilt_dir)
+        path = cache.path_for(fingerprint)
+        if path.exists():
+            try:
+                return ServingModel.attach(path)
+            except (OSError, ValueError, KeyError):
+                pass  # 손상되었거나 형식이 다른 파일은 새로 구축해 덮어쓴다.
+        model = ServingModel.build(self.survey_path, self.train_path, fingerprint)
+        model.export(path)
+        cache.prune()
+        return model
+
+    # 이전 코드와 벤치마크가 읽는 속성은 현재 모델로 넘긴다 (요청 처리 중에는 모델을 한 번만 읽을 것).
+    @property
+    def model_version(self) -> str:
+        return self.model.version
+
+    @property
+    def all_items(self) -> Dict[str, ItemMeta]:
+        return self.model.all_items
+
+    @property
+    def short_questions(self) -> Dict[str, List[Dict]]:
+        return self.model.short_questions
+
+    @property
+    def removed_by_subscale(self) -> Dict[str, Dict[str, List[str]]]:
+        return self.model.removed_by_subscale
+
+    @property
+    def subscale_map(self) -> Dict[str, Dict[str, List[int]]]:
+        return self.model.subscale_map
+
+    @property
+    def train_sheets(self) -> Dict:
+        return self.model.train_sheets
+
+    @property
+    def judge(self) -> RuleJudge:
+        return self.model.judge
+
+    @property
+    def requestion(self) -> RequestionSelector:
+        return self.model.requestion
+
+    @property
+    def adaptive(self) -> AdaptiveSurvey:
+        return self.model.adaptive
+
+    @property
+    def artifact(self) -> ServingArtifact | None:
+        return self.model.artifact
+
+    def export_artifact(self, path: Path) -> None:
+        """Write the current serving model to one memory-mappable file (see ``app.artifact``)."""
+        self.model.export(path)
+
+    def reload(self, wait: bool = False) -> Dict:
+        """Rebuild in the background if the inputs changed, then swap the new model in.
+
+        At most one reload runs at a time; ``status`` is ``"started"`` or
+        ``"running"`` (one was already in progress). ``wait`` blocks until it ends.
+        """
+        with self._reload_lock:
+            running = self._reload_thread is not None and self._reload_thread.is_alive()
+            if not running:
+                self._reload_thread = threading.Thread(target=self._reload, name="model-reload", daemon=True)
+                self._reload_thread.start()
+            thread = self._reload_thread
+        if wait:
+            thread.join()
+        return {"status": "running" if running else "started", **self.model_status()}
+
+    def _reload(self) -> None:
+        started = time.monotonic()
+        try:
+            model = self._changed_model()
+        except Exception as exc:
+            outcome = f"failed: {exc}"
+        else:
+            if model is None:
+                outcome = "unchanged"
+            else:
+                # 참조 하나만 바꾸므로 진행 중인 요청은 이전 모델로 끝나고, 이후 요청은 새 모델만 본다.
+                self.model = model
+                self.recommend_cache.clear()
+                self.reloads += 1
+                outcome = "swapped"
+        self.last_reload = {
+            "outcome": outcome,
+            "seconds": time.monotonic() - started,
+            "finished_at": time.time(),
+        }
+
+    def _changed_model(self) -> ServingModel | None:
+        if self.artifact_path is not None:
+            # 운영자가 같은 경로에 다시 내보낸 아티팩트를 붙인다.
+            model = ServingModel.attach(self.artifact_path)
+            return model if model.version != self.model.version else None
+        fingerprint = model_fingerprint(self.survey_path, self.train_path)
+        if fingerprint[:12] == self.model.version:
+            return None
+        cache = self._artifact_cache(self.prebuilt_dir or CACHE_DIR / "serving")
+        path = cache.path_for(fingerprint)
+        if not path.exists():
+            self._build_artifact(path)
+            cache.prune()
+        return ServingModel.attach(path)
+
+    def _build_artifact(self, path: Path) -> None:
+        # 구축(pandas/scikit-learn, 수 초의 CPU)은 낮은 우선순위의 별도 프로세스에서 해서
+        # 서빙 스레드와 GIL/CPU를 다투지 않게 하고, 이 프로세스는 결과 파일만 붙인다.
+        command = [sys.executable, "-m", "app.artifact", "--nice", "10", "-o", str(path.resolve())]
+        for flag, source in (("--survey", self.survey_path), ("--train", self.train_path)):
+            command += [flag, str(Path(source).resolve())]
+        proc = subprocess.run(command, cwd=PROJECT_ROOT / "backend", capture_output=True, text=True)
+        if proc.returncode != 0:
+            lines = proc.stderr.strip().splitlines()
+            raise RuntimeError(lines[-1] if lines else f"artifact build exited with {proc.returncode}")
+
+    def watch_inputs(self, interval: float) -> threading.Thread:
+        """Poll the inputs' size/mtime every ``interval`` seconds and ``reload`` on change.
+
+        A change is acted on once the stats stay the same for one more poll, so a
+        file that is still being written is not fingerprinted half-way.
+        """
+
+        def run() -> None:
+            seen = previous = self._input_stats()
+            while True:
+                time.sleep(interval)
+                current = self._input_stats()
+                # 진행 중인 재구축과 겹치면 다음 주기에 다시 시도한다.
+                if current != seen and current == previous and self.reload()["status"] == "started":
+                    seen = current
+                previous = current
+
+        thread = threading.Thread(target=run, name="model-watch", daemon=True)
+        thread.start()
+        return thread
+
+    def _input_stats(self) -> Tuple:
+        try:
+            if self.artifact_path is not None:
+                paths = [Path(self.artifact_path)]
+            else:
+                paths = [Path(self.survey_path), resolve_subscale_path(), Path(self.train_path)]
+            return tuple((str(p), p.stat().st_size, p.stat().st_mtime_ns) for p in paths)
+        except OSError:
+            return ()
+
+    def model_status(self) -> Dict:
+        model = self.model
+        return {
+            "model_version": model.version,
+            "source": "artifact" if model.artifact is not None else "build",
+            "loaded_at": model.loaded_at,
+            "reloading": self._reload_thread is not None and self._reload_thread.is_alive(),
+            "reloads": self.reloads,
+            "last_reload": self.last_reload,
+        }
+
+    def get_short_questions(self, model: ServingModel | None = None) -> List[SurveyQuestion]:
+        return (model or self.model).short_form()
 
     def recommend(
         self, responses: Dict[str, float], tie_breaker_answers: Dict[str, List[float]] | None
     ) -> Dict:
-        if not self.judge:
-            raise RuntimeError("Service is not initialized.")
-        return self.judge.recommend(responses, tie_breaker_answers)
+        """Rule-based recommendation, memoised per canonical input.
+
+        Cached results are shared between callers and must not be mutated.
+        """
+        model = self.model
+        key = self._recommend_key(model, responses, tie_breaker_answers)
+        result = self.recommend_cache.get(key)
+        if result is None:
+            result = {**model.judge.recommend(responses, tie_breaker_answers), "model_version": model.version}
+            self.recommend_cache.put(key, result)
+        return result
+
+    def _recommend_key(
+        self,
+        model: ServingModel,
+        responses: Dict[str, float],
+        tie_breaker_answers: Dict[str, List[float]] | None,
+    ) -> Hashable:
+        # 재질문 보너스는 EQ/FLA 목록만 사용하므로 그 외 키와 빈 목록은 무시한다.
+        # 교체 직후 이전 모델 요청이 늦게 넣은 결과가 섞이지 않도록 모델 버전도 키에 넣는다.
+        answers = tie_breaker_answers or {}
+        tie = tuple(tuple(answers.get(scale) or ()) for scale in ("EQ", "FLA"))
+        return model.version, model.judge.kernel.key(responses), tie
+
+    def cache_stats(self) -> Dict[str, Dict[str, int | float]]:
+        return {
+            "recommend": self.recommend_cache.stats(),
+            "llm_decision": self.llm.cache.stats(),
+            "sessions": self.sessions.stats(),
+        }
+
+    def llm_stats(self) -> Dict[str, Dict]:
+        return self.llm.stats()
+
+    def recommend_batch(self, rows: List[BatchRow], model: ServingModel | None = None) -> List[Dict | None]:
+        """One result per row; parse-failed rows get None, scoring failures ``{"error": ...}``.
+
+        Pass the same ``model`` for every chunk of one request so it is scored by one version.
+        """
+        return score_rows((model or self.model).judge, rows)
 
     def llm_fallback_recommend(
         self,
@@ -78,39 +300,224 @@ class RecommendationService:
         user_profile: Dict[str, str] | None,
         force: bool = False,
     ) -> Dict:
+        deadline = time.monotonic() + self.llm.request_budget
         base = self.recommend(responses, tie_breaker_answers)
         if not base["tie_triggered"] and not force:
-            return {
-                "recommended_strategy": base["recommended_strategy"],
-                "reason": "Rule-based result was not tied; LLM fallback skipped.",
-                "confidence": 0.9,
-                "model": "rule-based",
-                "used_llm": False,
-                "base_tie_triggered": base["tie_triggered"],
-                "base_score_gap": base["score_gap"],
-            }
-        llm_result = self.llm.decide(base_result=base, user_profile=user_profile)
+            return self._skip_llm(base)
+        llm_result = self.llm.decide(base_result=base, user_profile=user_profile, deadline=deadline)
+        return self._with_base(llm_result, base)
+
+    async def allm_fallback_recommend(
+        self,
+        responses: Dict[str, float],
+        tie_breaker_answers: Dict[str, List[float]] | None,
+        user_profile: Dict[str, str] | None,
+        force: bool = False,
+    ) -> Dict:
+        """Async ``llm_fallback_recommend``; the LLM call never blocks the event loop.
+
+        The whole call, rule-based scoring included, is bounded by the LLM request budget.
+        """
+        deadline = time.monotonic() + self.llm.request_budget
+        base = self.recommend(responses, tie_breaker_answers)
+        return await self._allm_decide(base, user_profile, force, deadline)
+
+    async def _allm_decide(
+        self, base: Dict, user_profile: Dict[str, str] | None, force: bool, deadline: float
+    ) -> Dict:
+        if not base["tie_triggered"] and not force:
+            return self._skip_llm(base)
+        llm_result = await self.llm.adecide(
+            base_result=base, user_profile=user_profile, deadline=deadline
+        )
+        return self._with_base(llm_result, base)
+
+    def llm_fallback_events(
+        self,
+        responses: Dict[str, float],
+        tie_breaker_answers: Dict[str, List[float]] | None,
+        user_profile: Dict[str, str] | None,
+        force: bool = False,
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """Event stream for the SSE fallback: ``rule`` (scored result plus a provisional
+        decision) right away, then ``reasoning`` pieces, then the final ``decision``.
+
+        Scoring runs before the stream starts, so invalid responses raise here.
+        """
+        deadline = time.monotonic() + self.llm.request_budget
+        base = self.recommend(responses, tie_breaker_answers)
+        return self._llm_fallback_events(base, user_profile, force, deadline)
+
+    async def _llm_fallback_events(
+        self, base: Dict, user_profile: Dict[str, str] | None, force: bool, deadline: float
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        if not base["tie_triggered"] and not force:
+            decision = self._skip_llm(base)
+            yield "rule", {"result": base, "decision": decision}
+            yield "decision", decision
+            return
+        yield "rule", {"result": base, "decision": self._with_base(self.llm.provisional(base), base)}
+        async for kind, data in self.llm.adecide_stream(base, user_profile, deadline):
+            if kind == "reasoning":
+                yield "reasoning", {"text": data}
+            else:
+                yield "decision", self._with_base(data, base)
+
+    def _skip_llm(self, base: Dict) -> Dict:
+        return {
+            "recommended_strategy": base["recommended_strategy"],
+            "reason": "Rule-based result was not tied; LLM fallback skipped.",
+            "confidence": 0.9,
+            "model": "rule-based",
+            "used_llm": False,
+            "base_tie_triggered": base["tie_triggered"],
+            "base_score_gap": base["score_gap"],
+            "model_version": base["model_version"],
+        }
+
+    def _with_base(self, llm_result: Dict, base: Dict) -> Dict:
         return {
             **llm_result,
             "base_tie_triggered": base["tie_triggered"],
             "base_score_gap": base["score_gap"],
+            "model_version": base["model_version"],
+        }
+
+    def adaptive_next(self, responses: Dict[str, float]) -> Dict:
+        """Next adaptive item for the answers so far, or the final result once stable."""
+        model = self.model
+        step = model.adaptive.step(model.adaptive.from_responses(responses))
+        qid = step.pop("next_question_id")
+        step["question"] = self._to_question(model, qid) if qid else None
+        step["model_version"] = model.version
+        if step["result"] is not None:
+            step["result"] = {**step["result"], "model_version": model.version}
+        return step
+
+    def create_session(self) -> Dict:
+        return self._session_summary(self.model, self.sessions.create())
+
+    def get_session(self, session_id: str) -> Dict:
+        model = self.model
+        return self._session_summary(model, self._on_model(model, self.sessions.get(session_id)))
+
+    def delete_session(self, session_id: str) -> bool:
+        return self.sessions.delete(session_id)
+
+    def session_answer(self, session_id: str, question_id: str, value: float) -> Dict:
+        """Record one answer: short-form items update the running subscale totals,
+        other bank items count as re-question (tie-break) answers for their scale.
+
+        Raises KeyError for an unknown/expired session, ValueError for an unknown item.
+        """
+        model = self.model
+        kernel = model.judge.kernel
+        item = model.all_items.get(question_id)
+        if question_id not in kernel.column and (item is None or item.scale not in ("EQ", "FLA")):
+            raise ValueError(f"Unknown question id: {question_id}")
+        value = float(value)
+
+        def apply(session: SurveySession) -> None:
+            self._on_model(model, session)
+            if question_id in kernel.column:
+                kernel.accumulate(session.totals, question_id, value, session.responses.get(question_id))
+                session.responses[question_id] = value
+            else:
+                session.tie_breaker[item.scale][question_id] = value
+
+        return self._session_summary(model, self.sessions.update(session_id, apply))
+
+    def session_recommend(self, session_id: str) -> Dict:
+        """Current recommendation from the session's running totals (no rescoring)."""
+        model = self.model
+        return self._session_result(model, self._on_model(model, self.sessions.get(session_id)))
+
+    def _session_result(self, model: ServingModel, session: SurveySession) -> Dict:
+        scores = model.judge.kernel.score_totals(session.totals)
+        result = model.judge.recommend_scores(scores, session.tie_breaker_answers())
+        return {**result, "model_version": model.version}
+
+    def _on_model(self, model: ServingModel, session: SurveySession) -> SurveySession:
+        """Re-classify ``session``'s answers for ``model`` in place (no-op on its own version).
+
+        After a reload the short form can differ: answers to items that left it
+        become tie-break answers for their scale, tie-break answers to items that
+        joined it become short-form responses, and the totals are rebuilt. The
+        stores hand out copies, so reads may call this without persisting.
+        """
+        if session.model_version == model.version:
+            return session
+        kernel = model.judge.kernel
+        responses: Dict[str, float] = {}
+        totals: Dict[str, List[float]] = {}
+        tie_breaker: Dict[str, Dict[str, float]] = {"EQ": {}, "FLA": {}}
+        answers = list(session.responses.items())
+        answers += [(qid, value) for tie in session.tie_breaker.values() for qid, value in tie.items()]
+        for qid, value in answers:
+            if qid in kernel.column:
+                kernel.accumulate(totals, qid, value, responses.get(qid))
+                responses[qid] = value
+                continue
+            item = model.all_items.get(qid)
+            # 새 문항 은행에서 빠진 문항의 응답만 버린다.
+            if item is not None and item.scale in tie_breaker:
+                tie_breaker[item.scale][qid] = value
+        session.responses, session.totals, session.tie_breaker = responses, totals, tie_breaker
+        session.model_version = model.version
+        return session
+
+    def session_requestion(self, session_id: str, model: ServingModel | None = None) -> List[SurveyQuestion]:
+        model = model or self.model
+        session = self._on_model(model, self.sessions.get(session_id))
+        result = self._session_result(model, session)
+        return self.get_requestion_pair(
+            result["top_eq_subscale"], result["top_fla_subscale"], session.used_question_ids(), model
+        )
+
+    async def session_llm_fallback(
+        self, session_id: str, user_profile: Dict[str, str] | None, force: bool = False
+    ) -> Dict:
+        deadline = time.monotonic() + self.llm.request_budget
+        # 세션 조회는 SQLite 저장소일 수 있으므로 이벤트 루프 밖에서 읽는다.
+        base = await asyncio.to_thread(self.session_recommend, session_id)
+        return await self._allm_decide(base, user_profile, force, deadline)
+
+    def _session_summary(self, model: ServingModel, session: SurveySession) -> Dict:
+        return {
+            "session_id": session.session_id,
+            "answered": len(session.responses),
+            "short_form_items": len(model.judge.kernel.column),
+            "tie_breaker_answers": session.tie_breaker_answers(),
+            "used_question_ids": session.used_question_ids(),
+            "model_version": model.version,
         }
 
     def get_requestion_pair(
-        self, eq_subscale: str, fla_subscale: str, used_question_ids: List[str]
+        self,
+        eq_subscale: str,
+        fla_subscale: str,
+        used_question_ids: List[str],
+        model: ServingModel | None = None,
     ) -> List[SurveyQuestion]:
-        eq_candidates = self._candidate_pool("EQ", eq_subscale, used_question_ids)
-        fla_candidates = self._candidate_pool("FLA", fla_subscale, used_question_ids)
-
-        questions = []
-        if eq_candidates:
-            questions.append(self._to_question(random.choice(eq_candidates)))
-        if fla_candidates:
-            questions.append(self._to_question(random.choice(fla_candidates)))
-        return questions
-
-    def _candidate_pool(self, scale: str, subscale: str, used: List[str]) -> List[str]:
-        pools = self.removed_by_subscale.get(scale, {})
+        model = model or self.model
+        if REQUESTION_SELECTOR == "random":
+            picks = [
+                self._random_pick(model, "EQ", eq_subscale, used_question_ids),
+                self._random_pick(model, "FLA", fla_subscale, used_question_ids),
+            ]
+        else:
+            picks = [
+                model.requestion.pick("EQ", eq_subscale, fla_subscale, used_question_ids),
+                model.requestion.pick("FLA", fla_subscale, eq_subscale, used_question_ids),
+            ]
+        return [self._to_question(model, qid) for qid in picks if qid is not None]
+
+    def _random_pick(self, model: ServingModel, scale: str, subscale: str, used: List[str]) -> str | None:
+        candidates = self._candidate_pool(model, scale, subscale, used)
+        return random.choice(candidates) if candidates else None
+
+    def _candidate_pool(self, model: ServingModel, scale: str, subscale: str, used: List[str]) -> List[str]:
+        pools = model.removed_by_subscale.get(scale, {})
         candidates = [qid for qid in pools.get(subscale, []) if qid not in used]
         if candidates:
             return candidates
@@ -121,8 +528,8 @@ class RecommendationService:
             if qid not in used
         ]
 
-    def _to_question(self, question_id: str) -> SurveyQuestion:
-        item = self.all_items[question_id]
+    def _to_question(self, model: ServingModel, question_id: str) -> SurveyQuestion:
+        item = model.all_items[question_id]
         return SurveyQuestion(
             question_id=item.question_id,
             scale=item.scale,
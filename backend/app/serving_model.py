@@ -0,0 +1,170 @@
+"""One immutable version of the serving state.
+
+``RecommendationService`` holds the current ``ServingModel`` in a single
+attribute. A reload builds a complete new model next to it and swaps the
+reference, so a request that already read the old model finishes on it and
+never sees half of each version. Responses that depend only on the model
+(``/api/questions``) are encoded once per version when the model is created.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from .adaptive import AdaptiveSurvey
+from .artifact import ServingArtifact, write_artifact
+from .config import (
+    ADAPTIVE_CONFIDENCE,
+    ADAPTIVE_DRAWS,
+    ADAPTIVE_MIN_ITEMS,
+    CACHE_DIR,
+    ITEM_BUILDER_CACHE_KEEP,
+)
+from .encoded_payload import EncodedPayload
+from .item_meta import ItemMeta
+from .model_inputs import model_fingerprint
+from .models import QuestionsResponse, SurveyQuestion
+from .requestion_selector import RequestionSelector
+from .scoring import CorrelationChoice, RuleJudge
+
+
+@dataclass(frozen=True)
+class ServingModel:
+    """Short form, judge, re-question rankings and adaptive model of one input version.
+
+    Never mutated after construction. ``version`` is the first 12 hex digits of
+    the input fingerprint (see ``app.model_inputs``). ``train_sheets`` is only
+    present when the model was built from the workbooks.
+    """
+
+    version: str
+    all_items: Dict[str, ItemMeta]
+    short_questions: Dict[str, List[Dict]]
+    removed_by_subscale: Dict[str, Dict[str, List[str]]]
+    subscale_map: Dict[str, Dict[str, List[int]]]
+    judge: RuleJudge
+    requestion: RequestionSelector
+    adaptive: AdaptiveSurvey
+    train_sheets: Dict = field(default_factory=dict)
+    artifact: ServingArtifact | None = None
+    loaded_at: float = field(default_factory=time.time)
+    questions_payload: EncodedPayload = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 단축형은 버전마다 고정이므로 /api/questions 응답은 모델을 만들 때 한 번만 인코딩한다.
+        questions = self.short_form()
+        response = QuestionsResponse(
+            total_questions=len(questions), questions=questions, model_version=self.version
+        )
+        object.__setattr__(self, "questions_payload", EncodedPayload.from_model(response))
+
+    def short_form(self) -> List[SurveyQuestion]:
+        output: List[SurveyQuestion] = []
+        for scale in ("EQ", "FLA"):
+            for q in self.short_questions[scale]:
+                output.append(
+                    SurveyQuestion(
+                        question_id=q["question_id"],
+                        scale=q["scale"],
+                        item_number=int(q["item_number"]),
+                        subscale=q["subscale"],
+                        text=q["text"],
+                        reverse_coded=bool(q.get("reverse_coded", False)),
+                    )
+                )
+        return sorted(output, key=lambda x: (x.scale, x.subscale, x.item_number))
+
+    @classmethod
+    def build(cls, survey_path: Path, train_path: Path, fingerprint: str | None = None) -> "ServingModel":
+        """Build from the workbooks (imports pandas/scikit-learn)."""
+        from .data_loader import DataLoader
+        from .item_builder import ItemBuilder
+        from .result_cache import ItemBuilderCache
+        from .strategy_judge import StrategyJudge
+
+        loader = DataLoader(survey_path=survey_path, train_path=train_path)
+        all_items, grouped_items, subscale_map = loader.build_item_bank()
+        train_sheets = loader.load_train_sheets()
+
+        cache = ItemBuilderCache(CACHE_DIR / "item_builder", keep=ITEM_BUILDER_CACHE_KEEP)
+        fingerprint = fingerprint or model_fingerprint(survey_path, train_path)
+        payload = cache.get(fingerprint)
+        if payload is None:
+            builder = ItemBuilder(all_items, grouped_items, train_sheets)
+            payload = builder.build()
+            cache.put(fingerprint, payload)
+
+        short_questions = payload["selected_questions"]
+        removed_by_subscale = payload["removed_by_subscale"]
+        judge = StrategyJudge(
+            train_sheets=train_sheets,
+            selected_questions=short_questions,
+            subscale_map=subscale_map,
+        )
+        return cls(
+            version=fingerprint[:12],
+            all_items=all_items,
+            short_questions=short_questions,
+            removed_by_subscale=removed_by_subscale,
+            subscale_map=subscale_map,
+            judge=judge,
+            requestion=RequestionSelector(judge, removed_by_subscale, all_items),
+            adaptive=AdaptiveSurvey(
+                judge, confidence=ADAPTIVE_CONFIDENCE, min_items=ADAPTIVE_MIN_ITEMS, draws=ADAPTIVE_DRAWS
+            ),
+            train_sheets=train_sheets,
+        )
+
+    @classmethod
+    def attach(cls, path: Path) -> "ServingModel":
+        """Attach an exported serving artifact; needs only the standard library and NumPy."""
+        artifact = ServingArtifact(path)
+        state = artifact.state
+        all_items = {
+            item["question_id"]: ItemMeta(
+                scale=item["scale"],
+                item_number=item["item_number"],
+                subscale=item["subscale"],
+                text=item["text"],
+                reverse_coded=item["reverse_coded"],
+            )
+            for item in state["items"]
+        }
+        corr_table = {
+            scale: {sub: CorrelationChoice(**choice) for sub, choice in table.items()}
+            for scale, table in state["corr_table"].items()
+        }
+        judge = RuleJudge(corr_table, state["short_questions"])
+        return cls(
+            version=state["model_version"],
+            all_items=all_items,
+            short_questions=state["short_questions"],
+            removed_by_subscale=state["removed_by_subscale"],
+            subscale_map=state["subscale_map"],
+            judge=judge,
+            requestion=RequestionSelector.from_state(
+                judge, state["removed_by_subscale"], state["requestion"]
+            ),
+            adaptive=AdaptiveSurvey.from_state(
+                judge, confidence=ADAPTIVE_CONFIDENCE, min_items=ADAPTIVE_MIN_ITEMS, arrays=artifact.arrays
+            ),
+            artifact=artifact,
+        )
+
+    def export(self, path: Path) -> None:
+        """Write this model to one memory-mappable file (see ``app.artifact``)."""
+        state = {
+            "model_version": self.version,
+            "items": [{**asdict(item), "question_id": qid} for qid, item in self.all_items.items()],
+            "short_questions": self.short_questions,
+            "removed_by_subscale": self.removed_by_subscale,
+            "subscale_map": self.subscale_map,
+            "corr_table": {
+                scale: {sub: asdict(choice) for sub, choice in table.items()}
+                for scale, table in self.judge.corr_table.items()
+            },
+            "requestion": self.requestion.state(),
+        }
+        write_artifact(path, state, self.adaptive.state())
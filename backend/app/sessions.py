@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+
+@dataclass
+class SurveySession:
+    """Server-side survey state of one respondent.
+
+    ``totals`` holds running ``[count, sum, first column]`` per subscale (see
+    ``ScoringKernel.accumulate``), so posting an answer never rescans the others.
+    ``tie_breaker`` keeps re-question answers per scale in answer order.
+    ``model_version`` is the serving model the totals were accumulated with.
+    """
+
+    session_id: str
+    responses: Dict[str, float] = field(default_factory=dict)
+    totals: Dict[str, List[float]] = field(default_factory=dict)
+    tie_breaker: Dict[str, Dict[str, float]] = field(default_factory=lambda: {"EQ": {}, "FLA": {}})
+    model_version: str = ""
+
+    def tie_breaker_answers(self) -> Dict[str, List[float]]:
+        return {scale: list(answers.values()) for scale, answers in self.tie_breaker.items()}
+
+    def used_question_ids(self) -> List[str]:
+        return [qid for answers in self.tie_breaker.values() for qid in answers]
+
+    def copy(self) -> "SurveySession":
+        """Independent snapshot (the containers are copied, the values are immutable)."""
+        return SurveySession(
+            session_id=self.session_id,
+            responses=dict(self.responses),
+            totals={sub: list(total) for sub, total in self.totals.items()},
+            tie_breaker={scale: dict(answers) for scale, answers in self.tie_breaker.items()},
+            model_version=self.model_version,
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str) -> "SurveySession":
+        return cls(**json.loads(raw))
+
+
+def new_session_id() -> str:
+    return secrets.token_urlsafe(16)
+
+
+class MemorySessionStore:
+    """In-process session store with sliding TTL and LRU eviction.
+
+    ``update`` runs the mutation under the store lock, so concurrent posts to
+    one session apply one after another. ``get`` and ``update`` return copies
+    taken under the lock, like the SQLite store, so scoring a session never
+    iterates containers that a concurrent ``update`` is changing.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, SurveySession]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.created = 0
+        self.expired = 0
+        self.evictions = 0
+
+    def create(self) -> SurveySession:
+        session = SurveySession(new_session_id())
+        with self._lock:
+            self._data[session.session_id] = (time.time() + self.ttl, session)
+            self.created += 1
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return session
+
+    def _live(self, session_id: str) -> SurveySession:
+        entry = self._data.get(session_id)
+        if entry is None:
+            raise KeyError(session_id)
+        if entry[0] <= time.time():
+            del self._data[session_id]
+            self.expired += 1
+            raise KeyError(session_id)
+        self._data[session_id] = (time.time() + self.ttl, entry[1])
+        self._data.move_to_end(session_id)
+        return entry[1]
+
+    def get(self, session_id: str) -> SurveySession:
+        with self._lock:
+            return self._live(session_id).copy()
+
+    def update(self, session_id: str, mutate: Callable[[SurveySession], None]) -> SurveySession:
+        with self._lock:
+            session = self._live(session_id)
+            mutate(session)
+            return session.copy()
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._data.pop(session_id, None) is not None
+
+    def stats(self) -> Dict[str, int | float]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "created": self.created,
+                "expired": self.expired,
+                "evictions": self.evictions,
+            }
+
+
+class SQLiteSessionStore:
+    """Session store in a SQLite file that several workers can share.
+
+    Each ``update`` is a ``BEGIN IMMEDIATE`` read-modify-write, so writers from
+    different processes are serialised by SQLite's write lock. The least
+    recently used rows beyond ``max_size`` and expired rows are purged
+    periodically.
+    """
+
+    _PURGE_EVERY = 256
+    _TOUCH_INTERVAL = 60.0
+
+    def __init__(self, db_path: Path, max_size: int, ttl: float):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.created = 0
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            str(db_path), check_same_thread=False, timeout=5.0, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions "
+            "(id TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires_at)")
+
+    def create(self) -> SurveySession:
+        session = SurveySession(new_session_id())
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO sessions (id, value, expires_at) VALUES (?, ?, ?)",
+                (session.session_id, session.to_json(), time.time() + self.ttl),
+            )
+            self.created += 1
+            self._after_write()
+        return session
+
+    def get(self, session_id: str) -> SurveySession:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM sessions WHERE id = ? AND expires_at > ?",
+                (session_id, now),
+            ).fetchone()
+            if row is None:
+                raise KeyError(session_id)
+            # 읽기마다 쓰지 않도록 만료 시각은 일정 간격 이상 지났을 때만 늘린다.
+            if row[1] < now + self.ttl - self._TOUCH_INTERVAL:
+                self._db.execute(
+                    "UPDATE sessions SET expires_at = ? WHERE id = ?", (now + self.ttl, session_id)
+                )
+        return SurveySession.from_json(row[0])
+
+    def update(self, session_id: str, mutate: Callable[[SurveySession], None]) -> SurveySession:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._db.execute(
+                    "SELECT value FROM sessions WHERE id = ? AND expires_at > ?",
+                    (session_id, time.time()),
+                ).fetchone()
+                if row is None:
+                    raise KeyError(session_id)
+                session = SurveySession.from_json(row[0])
+                mutate(session)
+                self._db.execute(
+                    "UPDATE sessions SET value = ?, expires_at = ? WHERE id = ?",
+                    (session.to_json(), time.time() + self.ttl, session_id),
+                )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+            self._after_write()
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._db.execute("DELETE FROM sessions WHERE id = ?", (session_id,)).rowcount > 0
+
+    def _after_write(self) -> None:
+        self._writes += 1
+        if self._writes % self._PURGE_EVERY:
+            return
+        # 만료 행을 지우고, 상한을 넘으면 가장 오래 쓰이지 않은(만료가 가장 이른) 행부터 지운다.
+        self._db.execute("DELETE FROM sessions WHERE expires_at <= ?", (time.time(),))
+        self._db.execute(
+            "DELETE FROM sessions WHERE id IN (SELECT id FROM sessions ORDER BY expires_at DESC "
+            "LIMIT -1 OFFSET ?)",
+            (self.max_size,),
+        )
+
+    def stats(self) -> Dict[str, int | float]:
+        with self._lock:
+            size = self._db.execute(
+                "SELECT COUNT(*) FROM sessions WHERE expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+        return {"backend": "sqlite", "size": size, "max_size": self.max_size, "created": self.created}
+
+
+def open_session_store(db_path: Path | None, max_size: int, ttl: float):
+    """SQLite store when ``db_path`` is set (shared by workers), otherwise in memory."""
+    if db_path is not None:
+        return SQLiteSessionStore(db_path, max_size, ttl)
+    return MemorySessionStore(max_size, ttl)
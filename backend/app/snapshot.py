@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class SheetSnapshot:
+    """Binary (.npz + JSON metadata) copy of the normalized sheets of one workbook.
+
+    The snapshot is trusted while the source file's size and mtime match. When the
+    mtime moves but the content hash is unchanged (e.g. a fresh checkout), the
+    metadata is refreshed in place instead of re-reading Excel.
+    """
+
+    def __init__(self, source_path: Path, snapshot_dir: Path):
+        self.source_path = source_path
+        self.snapshot_dir = snapshot_dir
+        self.data_path = snapshot_dir / f"{source_path.stem}.npz"
+        self.meta_path = snapshot_dir / f"{source_path.stem}.json"
+
+    def load(self, read_source: Callable[[], Dict[str, pd.DataFrame]]) -> Dict[str, pd.DataFrame]:
+        meta = self._valid_meta()
+        if meta is not None:
+            try:
+                return self._read(meta)
+            except Exception:
+                pass
+        sheets = read_source()
+        try:
+            self._write(sheets)
+        except Exception as exc:
+            print(f"[SheetSnapshot] could not write snapshot for {self.source_path.name}: {exc}")
+        return sheets
+
+    def _source_stat(self) -> Dict:
+        stat = self.source_path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _valid_meta(self) -> Dict | None:
+        if not self.meta_path.exists() or not self.data_path.exists():
+            return None
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+
+        stat = self._source_stat()
+        if meta.get("size") == stat["size"] and meta.get("mtime_ns") == stat["mtime_ns"]:
+            return meta
+        if meta.get("size") != stat["size"] or meta.get("sha256") != file_sha256(self.source_path):
+            return None
+
+        meta.update(stat)
+        atomic_write_bytes(self.meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+        return meta
+
+    def _read(self, meta: Dict) -> Dict[str, pd.DataFrame]:
+        # pandas는 스냅샷을 실제로 읽고 쓸 때만 불러온다 (file_sha256 등만 쓰는 모듈은 가볍게 유지).
+        import pandas as pd
+
+        sheets: Dict[str, pd.DataFrame] = {}
+        with np.load(self.data_path, allow_pickle=False) as arrays:
+            for sheet_idx, sheet in enumerate(meta["sheets"]):
+                columns = {}
+                for col_idx, col in enumerate(sheet["columns"]):
+                    key = f"s{sheet_idx}_c{col_idx}"
+                    if col["kind"] == "num":
+                        values = arrays[key]
+                    elif col["kind"] == "str":
+                        values = arrays[key].astype(object)
+                        values[arrays[f"{key}_na"]] = np.nan
+                    else:
+                        values = np.array(
+                            [np.nan if v is None else v for v in col["values"]], dtype=object
+                        )
+                    columns[col_idx] = values
+                frame = pd.DataFrame(columns, index=pd.RangeIndex(sheet["rows"]))
+                frame.columns = [col["name"] for col in sheet["columns"]]
+                sheets[sheet["name"]] = frame
+        return sheets
+
+    def _write(self, sheets: Dict[str, pd.DataFrame]) -> None:
+        import pandas as pd
+
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        arrays: Dict[str, np.ndarray] = {}
+        sheet_meta: List[Dict] = []
+        for sheet_idx, (name, df) in enumerate(sheets.items()):
+            columns = []
+            for col_idx, col_name in enumerate(df.columns):
+                key = f"s{sheet_idx}_c{col_idx}"
+                series = df.iloc[:, col_idx]
+                entry = {"name": _json_scalar(col_name)}
+                if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+                    entry["kind"] = "num"
+                    arrays[key] = series.to_numpy()
+                else:
+                    mask = series.isna().to_numpy()
+                    values = series.to_numpy(dtype=object)
+                    if all(isinstance(v, str) for v in values[~mask]):
+                        entry["kind"] = "str"
+                        arrays[key] = np.array(
+                            ["" if m else v for v, m in zip(values, mask)], dtype=str
+                        )
+                        arrays[f"{key}_na"] = mask
+                    else:
+                        entry["kind"] = "json"
+                        entry["values"] = [
+                            None if m else _json_scalar(v) for v, m in zip(values, mask)
+                        ]
+                columns.append(entry)
+            sheet_meta.append({"name": name, "rows": len(df), "columns": columns})
+
+        tmp = self.data_path.with_name(f".{self.data_path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, self.data_path)
+
+        meta = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "source": self.source_path.name,
+            "sha256": file_sha256(self.source_path),
+            **self._source_stat(),
+            "sheets": sheet_meta,
+        }
+        atomic_write_bytes(self.meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+
+def _json_scalar(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (int, float, str, bool)) or value is None:
+        return value
+    return str(value)
@@ -5,20 +5,53 @@ from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.stats import pearsonr
+from scipy.special import betainc
 
-from .config import TIE_GAP_THRESHOLD
+from .scoring import CorrelationChoice, RuleJudge
 
 
 @dataclass
-class CorrelationChoice:
+class CorrelationMatrix:
     driver: str
-    driver_subscale: str
-    strategy_subscale: str
-    correlation: float
-
-
-class StrategyJudge:
+    driver_subscales: List[str]
+    strategy_subscales: List[str]
+    r: np.ndarray
+    p_value: np.ndarray
+    n: np.ndarray
+
+
+def pairwise_pearson(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pearson r, two-sided p-value and sample count for every column pair of x and y.
+
+    Missing values are dropped pairwise, i.e. column i of x and column j of y use
+    only the rows where both are present, as ``pd.concat(...).dropna()`` did per
+    pair. Pairs with fewer than 3 rows or zero variance get NaN.
+    """
+    mx = ~np.isnan(x)
+    my = ~np.isnan(y)
+    with np.errstate(all="ignore"):
+        x0 = np.where(mx, x - np.nanmean(x, axis=0), 0.0)
+        y0 = np.where(my, y - np.nanmean(y, axis=0), 0.0)
+    fx, fy = mx.astype(float), my.astype(float)
+
+    n = fx.T @ fy
+    sx, sy = x0.T @ fy, fx.T @ y0
+    sxx, syy = (x0**2).T @ fy, fx.T @ (y0**2)
+    sxy = x0.T @ y0
+
+    with np.errstate(all="ignore"):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx**2 / n
+        var_y = syy - sy**2 / n
+        r = np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0)
+        invalid = (n < 3) | (var_x <= 1e-12 * sxx) | (var_y <= 1e-12 * syy)
+        r = np.where(invalid, np.nan, r)
+        df = n - 2
+        p = np.where(invalid, np.nan, betainc(df / 2, 0.5, np.clip(1 - r**2, 0.0, 1.0)))
+    return r, p, n.astype(int)
+
+
+class StrategyJudge(RuleJudge):
     def __init__(
         self,
         train_sheets: Dict[str, pd.DataFrame],
@@ -28,33 +61,46 @@ class StrategyJudge:
         self.train = train_sheets
         self.selected = selected_questions
         self.subscale_map = subscale_map
-        self.corr_table = self._build_correlation_table()
+        super().__init__(self._build_correlation_table(), selected_questions)
 
     def _build_correlation_table(self) -> Dict[str, Dict[str, CorrelationChoice]]:
         eq_scores = self._participant_scores("EQ")
         fla_scores = self._participant_scores("FLA")
         strategy_scores = self._strategy_scores()
+        self.strategy_scores = strategy_scores
 
+        self.corr_matrices: Dict[str, CorrelationMatrix] = {}
         corr_table: Dict[str, Dict[str, CorrelationChoice]] = {"EQ": {}, "FLA": {}}
         for driver, df in (("EQ", eq_scores), ("FLA", fla_scores)):
-            for sub in df.columns:
-                best = None
-                for strategy_sub in strategy_scores.columns:
-                    merged = pd.concat([df[sub], strategy_scores[strategy_sub]], axis=1).dropna()
-                    if len(merged) < 3:
-                        continue
-                    corr, _ = pearsonr(merged.iloc[:, 0], merged.iloc[:, 1])
-                    if np.isnan(corr):
-                        continue
-                    if best is None or corr > best.correlation:
-                        best = CorrelationChoice(
-                            driver=driver,
-                            driver_subscale=sub,
-                            strategy_subscale=strategy_sub,
-                            correlation=float(corr),
-                        )
-                if best:
-                    corr_table[driver][sub] = best
+            joined = pd.concat([df, strategy_scores], axis=1)
+            x = joined.iloc[:, : df.shape[1]].to_numpy(dtype=float)
+            y = joined.iloc[:, df.shape[1] :].to_numpy(dtype=float)
+            r, p, n = pairwise_pearson(x, y)
+            self.corr_matrices[driver] = CorrelationMatrix(
+                driver=driver,
+                driver_subscales=list(df.columns),
+                strategy_subscales=list(strategy_scores.columns),
+                r=r,
+                p_value=p,
+                n=n,
+            )
+            if not r.size:
+                continue
+
+            scored = np.where(np.isnan(r), -np.inf, r)
+            best_idx = scored.argmax(axis=1)
+            for i, sub in enumerate(df.columns):
+                j = best_idx[i]
+                if np.isneginf(scored[i, j]):
+                    continue
+                corr_table[driver][sub] = CorrelationChoice(
+                    driver=driver,
+                    driver_subscale=sub,
+                    strategy_subscale=strategy_scores.columns[j],
+                    correlation=float(r[i, j]),
+                    p_value=float(p[i, j]),
+                    n=int(n[i, j]),
+                )
 
         return corr_table
 
@@ -94,97 +140,3 @@ class StrategyJudge:
             if valid:
                 result[subscale] = source[valid].mean(axis=1)
         return pd.DataFrame(result)
-
-    def recommend(
-        self, responses: Dict[str, float], tie_breaker_answers: Dict[str, List[float]] | None = None
-    ) -> Dict:
-        user_scores = self._user_subscale_scores(responses)
-        top_eq = max(user_scores["EQ"].items(), key=lambda x: x[1])[0]
-        top_fla = max(user_scores["FLA"].items(), key=lambda x: x[1])[0]
-
-        eq_choice = self.corr_table["EQ"][top_eq]
-        fla_choice = self.corr_table["FLA"][top_fla]
-
-        eq_bonus, fla_bonus = self._tie_break_bonus(tie_breaker_answers)
-        eq_final = eq_choice.correlation + eq_bonus
-        fla_final = fla_choice.correlation + fla_bonus
-
-        score_gap = abs(eq_final - fla_final)
-        user_score_gap = abs(user_scores["EQ"][top_eq] - user_scores["FLA"][top_fla])
-        winner = eq_choice if eq_final >= fla_final else fla_choice
-        # README의 상관계수 박빙 조건을 우선 적용하고,
-        # 실제 응답이 박빙인 경우도 재질문으로 보내 정밀도를 확보한다.
-        tie_triggered = (score_gap < TIE_GAP_THRESHOLD) or (
-            user_score_gap < TIE_GAP_THRESHOLD
-        )
-
-        candidates = [
-            {
-                "driver": "EQ",
-                "driver_subscale": top_eq,
-                "strategy_subscale": eq_choice.strategy_subscale,
-                "correlation": eq_choice.correlation,
-                "user_subscale_score": user_scores["EQ"][top_eq],
-                "final_score": eq_final,
-            },
-            {
-                "driver": "FLA",
-                "driver_subscale": top_fla,
-                "strategy_subscale": fla_choice.strategy_subscale,
-                "correlation": fla_choice.correlation,
-                "user_subscale_score": user_scores["FLA"][top_fla],
-                "final_score": fla_final,
-            },
-        ]
-        strategy_ranking = sorted(
-            [
-                {"strategy_subscale": c["strategy_subscale"], "score": c["final_score"]}
-                for c in candidates
-            ],
-            key=lambda x: x["score"],
-            reverse=True,
-        )
-
-        return {
-            "recommended_strategy": winner.strategy_subscale,
-            "tie_triggered": tie_triggered,
-            "score_gap": score_gap,
-            "summary": f"{winner.driver_subscale} 기반 추천: {winner.strategy_subscale}",
-            "candidates": candidates,
-            "top_eq_subscale": top_eq,
-            "top_fla_subscale": top_fla,
-            "eq_scores": user_scores["EQ"],
-            "fla_scores": user_scores["FLA"],
-            "strategy_ranking": strategy_ranking,
-        }
-
-    def _user_subscale_scores(self, responses: Dict[str, float]) -> Dict[str, Dict[str, float]]:
-        scores = {"EQ": {}, "FLA": {}}
-        for scale in ("EQ", "FLA"):
-            selected_by_sub = {}
-            for q in self.selected[scale]:
-                sub = q["subscale"]
-                qid = q["question_id"]
-                if qid not in responses:
-                    continue
-                raw = float(responses[qid])
-                score = 6 - raw if q.get("reverse_coded", False) else raw
-                selected_by_sub.setdefault(sub, []).append(score)
-            for subscale, values in selected_by_sub.items():
-                scores[scale][subscale] = float(np.mean(values))
-
-        if not scores["EQ"] or not scores["FLA"]:
-            raise ValueError("Responses must include both EQ and FLA short-form items.")
-        return scores
-
-    def _tie_break_bonus(self, answers: Dict[str, List[float]] | None) -> Tuple[float, float]:
-        if not answers:
-            return 0.0, 0.0
-
-        def normalize(vals: List[float]) -> float:
-            if not vals:
-                return 0.0
-            v = np.mean(vals)
-            return float((v - 3.0) / 2.0 * 0.05)
-
-        return normalize(answers.get("EQ", [])), normalize(answers.get("FLA", []))
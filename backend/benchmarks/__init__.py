@@ -0,0 +1 @@
+"""Offline timing scripts. Run from ``backend/`` with ``python -m benchmarks.<name>``."""
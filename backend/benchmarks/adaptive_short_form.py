@@ -0,0 +1,72 @@
+"""Offline simulation of the adaptive short form over training respondents.
+
+    python -m benchmarks.adaptive_short_form --train ../Data/Train_train_balanced.xlsx
+
+The adaptive model (item means, noise, prior covariance, strategy table) is fitted
+on part of the respondents; held-out respondents then answer whatever the
+survey asks with their real training answers until it stops. Reported per
+confidence level: items asked and agreement with the recommendation the same
+respondent gets from the full fixed short form.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.adaptive import AdaptiveSurvey
+from app.config import ADAPTIVE_CONFIDENCE, ADAPTIVE_DRAWS, ADAPTIVE_MIN_ITEMS, SURVEY_FILE, TRAIN_FILE
+from app.service import RecommendationService
+from app.strategy_judge import StrategyJudge
+from benchmarks.requestion_rounds import answer_lookup, split_sheets
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--holdout", type=float, default=0.3)
+    parser.add_argument("--respondents", type=int, default=200, help="held-out respondents to replay")
+    parser.add_argument("--confidence", type=float, nargs="+", default=[0.8, ADAPTIVE_CONFIDENCE, 0.95])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    service = RecommendationService(survey_path=SURVEY_FILE, train_path=args.train)
+    fit, test = split_sheets(service.train_sheets, args.holdout, args.seed)
+    judge = StrategyJudge(fit, service.short_questions, service.subscale_map)
+    answers = list(answer_lookup(test).values())[: args.respondents]
+
+    survey = AdaptiveSurvey(judge, ADAPTIVE_CONFIDENCE, ADAPTIVE_MIN_ITEMS, draws=ADAPTIVE_DRAWS)
+    full_form = [judge.recommend({q: given[q] for q in survey.qids if q in given}) for given in answers]
+    print(
+        f"fit on {len(fit['EQ'])} respondents, replay {len(answers)} held-out, "
+        f"fixed short form = {len(survey.qids)} items, min {ADAPTIVE_MIN_ITEMS}"
+    )
+
+    for confidence in args.confidence:
+        survey.confidence = confidence
+        asked, agree, steps, elapsed = [], 0, 0, 0.0
+        for given, full in zip(answers, full_form):
+            state = survey.new_state()
+            while True:
+                start = time.perf_counter()
+                out = survey.step(state)
+                elapsed += time.perf_counter() - start
+                steps += 1
+                if out["done"]:
+                    break
+                qid = out["next_question_id"]
+                survey.answer(state, qid, given.get(qid, 3.0))
+            asked.append(out["answered"])
+            agree += out["result"]["recommended_strategy"] == full["recommended_strategy"]
+        asked = np.array(asked)
+        print(
+            f"confidence {confidence:.2f}: items mean={asked.mean():5.1f} median={np.median(asked):4.0f} "
+            f"p90={np.percentile(asked, 90):4.0f} ({asked.mean() / len(survey.qids):5.1%} of the form) | "
+            f"agrees with full form {agree / len(answers):6.1%} | {elapsed / steps * 1000:5.1f} ms/step"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Time the driver x strategy correlation table on synthetic participants.
+
+    python -m benchmarks.correlation_table --participants 100000
+
+The legacy loop below reproduces the previous per-pair concat/dropna/pearsonr
+construction for timing and to check r, p-values and chosen strategies.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import pearsonr
+
+from app.strategy_judge import pairwise_pearson
+
+
+def synthetic_scores(n: int, n_driver: int, n_strategy: int, missing: float, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    latent = rng.normal(size=(n, 3))
+    driver = latent @ rng.normal(size=(3, n_driver)) + rng.normal(size=(n, n_driver))
+    strategy = latent @ rng.normal(size=(3, n_strategy)) + rng.normal(size=(n, n_strategy))
+    driver[rng.random(driver.shape) < missing] = np.nan
+    strategy[rng.random(strategy.shape) < missing] = np.nan
+    index = pd.Index(np.arange(n), name="참여자")
+    return (
+        pd.DataFrame(driver, index=index, columns=[f"d{i}" for i in range(n_driver)]),
+        pd.DataFrame(strategy, index=index, columns=[f"s{j}" for j in range(n_strategy)]),
+    )
+
+
+def legacy_table(df: pd.DataFrame, strategy_scores: pd.DataFrame):
+    r = np.full((df.shape[1], strategy_scores.shape[1]), np.nan)
+    p = np.full_like(r, np.nan)
+    for i, sub in enumerate(df.columns):
+        for j, strategy_sub in enumerate(strategy_scores.columns):
+            merged = pd.concat([df[sub], strategy_scores[strategy_sub]], axis=1).dropna()
+            if len(merged) < 3:
+                continue
+            r[i, j], p[i, j] = pearsonr(merged.iloc[:, 0], merged.iloc[:, 1])
+    return r, p
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--participants", type=int, default=100_000)
+    parser.add_argument("--drivers", type=int, default=16)
+    parser.add_argument("--strategies", type=int, default=6)
+    parser.add_argument("--missing", type=float, default=0.02)
+    args = parser.parse_args()
+
+    driver, strategy = synthetic_scores(args.participants, args.drivers, args.strategies, args.missing)
+
+    start = time.perf_counter()
+    joined = pd.concat([driver, strategy], axis=1)
+    r, p, n = pairwise_pearson(
+        joined.iloc[:, : driver.shape[1]].to_numpy(dtype=float),
+        joined.iloc[:, driver.shape[1] :].to_numpy(dtype=float),
+    )
+    fast = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy_r, legacy_p = legacy_table(driver, strategy)
+    legacy = time.perf_counter() - start
+
+    np.testing.assert_allclose(r, legacy_r, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(p, legacy_p, rtol=1e-6, atol=1e-300)
+    assert (np.nanargmax(r, axis=1) == np.nanargmax(legacy_r, axis=1)).all()
+
+    print(f"participants x pairs : {args.participants} x {args.drivers * args.strategies}")
+    print(f"min pairwise n       : {n.min()}")
+    print(f"legacy pair loop     : {legacy * 1000:9.1f} ms")
+    print(f"masked matrix pass   : {fast * 1000:9.1f} ms")
+    print(f"speedup              : {legacy / fast:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
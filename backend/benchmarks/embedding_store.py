@@ -0,0 +1,66 @@
+"""Cold vs. warm encoding through the hashing backend's on-disk embedding store.
+
+    python -m benchmarks.embedding_store --items 30000 --subscales 30
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from app.embeddings import HashingCharBackend
+from app.item_builder import ItemBuilder
+
+from .select_diverse import synthetic_items
+
+
+def _shorten(items, n_subscales: int, store_dir: Path) -> float:
+    backend = HashingCharBackend(store_dir=store_dir)
+    builder = ItemBuilder({}, {"EQ": items}, {}, embedding=backend)
+    groups = builder._group_by_subscale(items)
+    quotas = builder._allocate_quotas(groups, max(n_subscales, len(items) // 10))
+    start = time.perf_counter()
+    for sub, sub_items in groups.items():
+        builder._select_diverse(sub_items, quotas[sub])
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=30_000)
+    parser.add_argument("--subscales", type=int, default=30)
+    parser.add_argument("--edit-ratio", type=float, default=0.01)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    items = [
+        dataclasses.replace(item, subscale=f"sub{i % args.subscales}")
+        for i, item in enumerate(synthetic_items(args.items))
+    ]
+    edited = [
+        dataclasses.replace(item, text=item.text + " 수정") if rng.random() < args.edit_ratio else item
+        for item in items
+    ]
+
+    store_dir = Path(tempfile.mkdtemp(prefix="embedding-store-"))
+    try:
+        cold = _shorten(items, args.subscales, store_dir)
+        warm = _shorten(items, args.subscales, store_dir)
+        edit = _shorten(edited, args.subscales, store_dir)
+        size = sum(p.stat().st_size for p in store_dir.rglob("*") if p.is_file())
+    finally:
+        shutil.rmtree(store_dir, ignore_errors=True)
+
+    print(f"items / subscales       : {args.items} / {args.subscales}")
+    print(f"cold store (encode all) : {cold:8.2f} s")
+    print(f"warm store              : {warm:8.2f} s")
+    print(f"after {args.edit_ratio:.0%} text edits     : {edit:8.2f} s")
+    print(f"store size              : {size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
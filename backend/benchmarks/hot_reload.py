@@ -0,0 +1,135 @@
+"""Request latency while the model is rebuilt and swapped in.
+
+    python -m benchmarks.hot_reload --train ../Data/Train_train_balanced.xlsx
+
+The survey and training workbooks are copied to a temp directory and the
+service is started on the copies. Client threads keep calling ``recommend``
+(uncached, random answers to every bank item) while the training copy is
+replaced with a subset of its respondents. A rebuild then runs, either through
+``RecommendationService.reload`` (build in a separate process, attach the
+artifact) or, for comparison, through ``ServingModel.build`` in a thread of the
+serving process. Each mode gets its own subset, so neither reuses the
+other's ItemBuilder cache. Reported per phase: throughput and p50/p99/max
+latency. Every result is
+checked against its own model version, to confirm that no request mixed two
+versions.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from app.config import SURVEY_FILE, TRAIN_FILE
+from app.service import RecommendationService
+from app.serving_model import ServingModel
+
+
+def _shrink_train(path: Path, keep: float, seed: int) -> None:
+    sheets = pd.read_excel(path, sheet_name=None)
+    rows = next(iter(sheets.values())).index
+    kept = np.sort(np.random.default_rng(seed).choice(rows, int(len(rows) * keep), replace=False))
+    with pd.ExcelWriter(path) as writer:
+        for name, frame in sheets.items():
+            frame.iloc[kept].to_excel(writer, sheet_name=name, index=False)
+
+
+class Load:
+    def __init__(self, service: RecommendationService, qids: List[str], clients: int):
+        self.service = service
+        self.qids = qids
+        self.samples: List[tuple] = []
+        self.stop = threading.Event()
+        self.threads = [threading.Thread(target=self._run, args=(i,)) for i in range(clients)]
+
+    def _run(self, seed: int) -> None:
+        rng = random.Random(seed)
+        while not self.stop.is_set():
+            responses = {qid: float(rng.randint(1, 5)) for qid in self.qids}
+            start = time.perf_counter()
+            result = self.service.recommend(responses, None)
+            self.samples.append((start, time.perf_counter() - start, responses, result))
+            time.sleep(0.002)
+
+    def __enter__(self) -> "Load":
+        for t in self.threads:
+            t.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop.set()
+        for t in self.threads:
+            t.join()
+
+
+def _phase(samples: List[tuple], start: float, end: float) -> str:
+    ms = np.array([s[1] for s in samples if start <= s[0] < end]) * 1000
+    if not len(ms):
+        return "no requests"
+    return (
+        f"{len(ms) / (end - start):6.0f} req/s | p50 {np.median(ms):5.2f} p99 {np.percentile(ms, 99):6.2f} "
+        f"max {ms.max():7.2f} ms"
+    )
+
+
+def run(args: argparse.Namespace, mode: str, seed: int) -> None:
+    workdir = Path(tempfile.mkdtemp())
+    survey, train = workdir / SURVEY_FILE.name, workdir / "train.xlsx"
+    shutil.copy(SURVEY_FILE, survey)
+    shutil.copy(args.train, train)
+    service = RecommendationService(survey_path=survey, train_path=train, prebuilt_dir=workdir / "serving")
+    models: Dict[str, ServingModel] = {service.model.version: service.model}
+    qids = [qid for qid, item in service.all_items.items() if item.scale in ("EQ", "FLA")]
+    _shrink_train(train, args.keep, seed)
+
+    with Load(service, qids, args.clients) as load:
+        time.sleep(args.idle)
+        reload_start = time.perf_counter()
+        if mode == "subprocess":
+            service.reload(wait=True)
+        else:
+            builder = threading.Thread(target=lambda: models.setdefault("thread", ServingModel.build(survey, train)))
+            builder.start()
+            builder.join()
+        reload_end = time.perf_counter()
+        time.sleep(args.idle)
+        end = time.perf_counter()
+    models.setdefault(service.model.version, service.model)
+
+    mixed = 0
+    for _, _, responses, result in load.samples:
+        model = models.get(result["model_version"])
+        expected = {**model.judge.recommend(responses, None), "model_version": model.version}
+        mixed += expected != result
+    versions = sorted({s[3]["model_version"] for s in load.samples})
+    outcome = service.last_reload["outcome"] if service.last_reload else "not swapped"
+    print(f"{mode}: rebuild {reload_end - reload_start:5.2f} s ({outcome})")
+    print(f"  before  {_phase(load.samples, reload_start - args.idle, reload_start)}")
+    print(f"  during  {_phase(load.samples, reload_start, reload_end)}")
+    print(f"  after   {_phase(load.samples, reload_end, end)}")
+    print(f"  versions served {versions}, results not matching their version: {mixed}")
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--keep", type=float, default=0.9, help="share of respondents in the new training file")
+    parser.add_argument("--idle", type=float, default=2.0, help="seconds of load before and after the rebuild")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    for offset, mode in enumerate(("subprocess", "thread")):
+        run(args, mode, args.seed + offset)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Time DataLoader.build_item_bank on a synthetic item bank.
+
+    python -m benchmarks.item_bank_build --items 10000
+
+The legacy loader below reproduces the previous per-item boolean-mask lookup
+and ``iterrows`` parsing so both paths can be timed and compared for equality.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Set, Tuple
+
+import pandas as pd
+
+from app.data_loader import DataLoader
+
+
+def synthetic_sheets(n_items: int, n_subscales: int, seed: int = 0):
+    rng = random.Random(seed)
+    survey, subscale = {}, {}
+    for scale, sub_col in (("EQ", "하위영역"), ("FLA", "Anxiety")):
+        numbers = list(range(1, n_items + 1))
+        survey[scale] = pd.DataFrame(
+            {"문항": numbers, "내용": [f"{scale} 문항 {n} 내용 {rng.random():.6f}" for n in numbers]}
+        )
+        rng.shuffle(numbers)
+        chunks = [numbers[i::n_subscales] for i in range(n_subscales)]
+        cells = [
+            ", ".join(f"{n}*" if rng.random() < 0.1 else str(n) for n in chunk) for chunk in chunks
+        ]
+        reverse = ", ".join(str(n) for n in rng.sample(numbers, max(1, n_items // 20)))
+        subscale[scale] = pd.DataFrame(
+            {
+                sub_col: [f"{scale}-sub{i}" for i in range(n_subscales)] + ["역코딩 문항(*)"],
+                "해당문항": cells + [reverse],
+            }
+        )
+    subscale["Strategy"] = pd.DataFrame({"Strategy": ["기억전략"], "해당문항": ["1, 2, 3"]})
+    survey["Strategy"] = pd.DataFrame()
+    return survey, subscale
+
+
+class _SyntheticLoader(DataLoader):
+    def __init__(self, survey: Dict[str, pd.DataFrame], subscale: Dict[str, pd.DataFrame]):
+        self._survey = survey
+        self._subscale = subscale
+
+    def load_survey_sheets(self) -> Dict[str, pd.DataFrame]:
+        return self._survey
+
+    def load_subscale_sheets(self) -> Dict[str, pd.DataFrame]:
+        return self._subscale
+
+
+class _LegacyLoader(_SyntheticLoader):
+    def build_item_bank(self):
+        survey = self.load_survey_sheets()
+        subscale = self.load_subscale_sheets()
+        reverse_coded = {s: self._legacy_reverse(subscale[s]) for s in ("EQ", "FLA")}
+        all_items, grouped = {}, {"EQ": [], "FLA": []}
+        subscale_map = {"EQ": {}, "FLA": {}, "Strategy": {}}
+        for scale in ("EQ", "FLA"):
+            survey_df = survey[scale]
+            for sub_name, item_numbers, local_reverse in self._legacy_rows(subscale[scale], scale):
+                if "역코딩" in sub_name:
+                    continue
+                subscale_map[scale].setdefault(sub_name, [])
+                for item_num in item_numbers:
+                    candidates = survey_df[survey_df["문항"] == item_num]
+                    if candidates.empty:
+                        continue
+                    text = str(candidates.iloc[0]["내용"]).strip()
+                    qid = f"{scale}-{item_num}"
+                    if qid not in all_items:
+                        meta = (scale, item_num, sub_name, text,
+                                item_num in reverse_coded[scale] or item_num in local_reverse)
+                        all_items[qid] = meta
+                        grouped[scale].append(meta)
+                    if item_num not in subscale_map[scale][sub_name]:
+                        subscale_map[scale][sub_name].append(item_num)
+        return all_items, grouped, subscale_map
+
+    def _legacy_parse(self, raw: str) -> List[Tuple[int, bool]]:
+        out = []
+        for token in raw.replace("/", ",").split(","):
+            t = token.strip()
+            cleaned = t.replace("*", "").strip()
+            if t and cleaned.isdigit():
+                out.append((int(cleaned), "*" in t))
+        return out
+
+    def _legacy_reverse(self, df: pd.DataFrame) -> Set[int]:
+        out: Set[int] = set()
+        for _, row in df.iterrows():
+            if "역코딩" in " ".join(str(x) for x in row.values if pd.notna(x)):
+                out.update(n for n, _ in self._legacy_parse(str(row.get("해당문항", ""))))
+        return out
+
+    def _legacy_rows(self, df: pd.DataFrame, scale: str):
+        sub_col = "하위영역" if scale == "EQ" else "Anxiety"
+        rows = []
+        for _, row in df.iterrows():
+            parsed = self._legacy_parse(str(row.get("해당문항", "")))
+            rows.append((str(row[sub_col]).strip(), [n for n, _ in parsed], {n for n, f in parsed if f}))
+        return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10_000, help="items per scale")
+    parser.add_argument("--subscales", type=int, default=40)
+    args = parser.parse_args()
+
+    survey, subscale = synthetic_sheets(args.items, args.subscales)
+
+    start = time.perf_counter()
+    items, grouped, smap = _SyntheticLoader(survey, subscale).build_item_bank()
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    legacy_items, legacy_grouped, legacy_smap = _LegacyLoader(survey, subscale).build_item_bank()
+    legacy = time.perf_counter() - start
+
+    as_tuple = lambda m: (m.scale, m.item_number, m.subscale, m.text, m.reverse_coded)
+    assert {k: as_tuple(v) for k, v in items.items()} == legacy_items
+    assert {s: [as_tuple(m) for m in v] for s, v in grouped.items()} == legacy_grouped
+    assert {s: smap[s] for s in ("EQ", "FLA")} == {s: legacy_smap[s] for s in ("EQ", "FLA")}
+
+    print(f"items per scale : {args.items} ({len(items)} in bank)")
+    print(f"legacy loader   : {legacy * 1000:9.1f} ms")
+    print(f"indexed loader  : {indexed * 1000:9.1f} ms")
+    print(f"speedup         : {legacy / indexed:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Burst of identical LLM fallback calls against a stub client that counts requests.
+
+    python -m benchmarks.llm_burst --burst 200
+
+Simulates a class submitting at once: ``--burst`` concurrent ``adecide`` calls
+for the same tie (scores jittered within one bucket). The decision cache is
+disabled so only single-flight coalescing is measured. A second round makes the
+stub fail, and every waiter must still get the rule-based answer. A last round
+opens ``--burst`` streamed calls and cancels them mid-reasoning, as uvicorn does
+when clients disconnect; the breaker must not record a failure for them.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from app.llm_fallback import LLMFallbackRecommender
+from app.result_cache import DecisionCache
+
+
+class CountingStub:
+    def __init__(self, delay: float, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def chat(self, system: str, user: str) -> str | None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("stub upstream failure")
+        return json.dumps({"pick": "A", "confidence": 0.7, "reason": "stub"})
+
+
+class StreamingStub:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    async def chat_stream(self, system: str, user: str):
+        self.calls += 1
+        text = json.dumps({"pick": "A", "confidence": 0.7, "reason": "a slow streamed stub reason"})
+        for i in range(0, len(text), 4):
+            await asyncio.sleep(self.delay / 10)
+            yield text[i : i + 4]
+
+
+def tied_result(rng: random.Random) -> Dict:
+    # 같은 점수 구간 안에서만 흔들어 정규화 키가 같도록 한다.
+    eq_score, fla_score = 3.55 + rng.random() * 0.15, 3.52 + rng.random() * 0.15
+    return {
+        "recommended_strategy": "사회적 전략",
+        "candidates": [
+            {"driver": "EQ", "driver_subscale": "공감", "strategy_subscale": "사회적 전략",
+             "correlation": 0.312, "user_subscale_score": eq_score, "final_score": 0.312},
+            {"driver": "FLA", "driver_subscale": "수업 불안감", "strategy_subscale": "정의적 전략",
+             "correlation": 0.305, "user_subscale_score": fla_score, "final_score": 0.305},
+        ],
+    }
+
+
+async def burst(recommender: LLMFallbackRecommender, n: int, seed: int) -> List[tuple]:
+    rng = random.Random(seed)
+
+    async def one() -> tuple:
+        start = time.perf_counter()
+        result = await recommender.adecide(tied_result(rng))
+        return time.perf_counter() - start, result
+
+    return await asyncio.gather(*(one() for _ in range(n)))
+
+
+async def cancelled_streams(recommender: LLMFallbackRecommender, n: int, seed: int) -> int:
+    """Cancel ``n`` streams after their first reasoning piece; returns how many got that far."""
+    rng = random.Random(seed)
+    reasoning = asyncio.Semaphore(0)
+
+    async def consume() -> None:
+        async for kind, _ in recommender.adecide_stream(tied_result(rng)):
+            if kind == "reasoning":
+                reasoning.release()
+
+    tasks = [asyncio.create_task(consume()) for _ in range(n)]
+    started = 0
+    for _ in range(n):
+        try:
+            await asyncio.wait_for(reasoning.acquire(), timeout=recommender.request_budget)
+        except asyncio.TimeoutError:
+            break
+        started += 1
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.5, help="stub completion latency (s)")
+    args = parser.parse_args()
+
+    for fail in (False, True):
+        recommender = LLMFallbackRecommender(cache=DecisionCache(None, max_size=0, ttl=0))
+        stub = CountingStub(args.delay, fail=fail)
+        recommender.async_gpt_api = stub
+        results = asyncio.run(burst(recommender, args.burst, seed=int(fail)))
+
+        ms = np.array([t for t, _ in results]) * 1000
+        models = sorted({r["model"] for _, r in results})
+        used = sum(1 for _, r in results if r["used_llm"])
+        label = "failing stub" if fail else "healthy stub"
+        print(
+            f"{label}: {args.burst} calls -> {stub.calls} upstream request(s), "
+            f"{used} LLM / {args.burst - used} rule-based answers, models={models}, "
+            f"p50={np.percentile(ms, 50):.0f} ms p99={np.percentile(ms, 99):.0f} ms"
+        )
+
+    recommender = LLMFallbackRecommender(cache=DecisionCache(None, max_size=0, ttl=0))
+    stub = StreamingStub(args.delay)
+    recommender.async_gpt_api = stub
+    started = asyncio.run(cancelled_streams(recommender, args.burst, seed=2))
+    breaker = recommender.breaker.snapshot()
+    print(
+        f"cancelled streams: {args.burst} streams, {started} cancelled mid-reasoning -> "
+        f"breaker {breaker['state']}, {breaker['consecutive_failures']} failure(s) recorded"
+    )
+    assert breaker["state"] == "closed" and breaker["consecutive_failures"] == 0, breaker
+
+
+if __name__ == "__main__":
+    main()
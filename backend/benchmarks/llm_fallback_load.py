@@ -0,0 +1,183 @@
+"""Load the LLM fallback against a slow fake OpenAI server and time rule-based endpoints.
+
+    python -m benchmarks.llm_fallback_load --train ../Data/Train_train_balanced.xlsx
+
+A local fake ``/v1/chat/completions`` answers after ``--llm-delay`` seconds. The
+API runs in-process under uvicorn, pointed at the fake via ``OPENAI_BASE_URL``.
+``/api/questions`` and ``/api/recommend`` latencies are measured once idle and
+once while ``--fallback-clients`` keep ``/api/recommend/llm-fallback`` saturated.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+import numpy as np
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def fake_llm_server(delay: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+            time.sleep(delay)
+            content = json.dumps({"pick": "A", "confidence": 0.7, "reason": "fake"})
+            payload = json.dumps(
+                {
+                    "id": "fake",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": body.get("model", "fake"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(payload)))
+            self.end_headers()
+            try:
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # 마감 시간에 걸려 API 쪽이 먼저 끊은 경우
+
+        def log_message(self, *args) -> None:
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 256
+
+    server = Server(("127.0.0.1", _free_port()), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_api(port: int):
+    import uvicorn
+
+    from app.main import app, service
+    from app.result_cache import DecisionCache
+
+    # 같은 요청이 반복되므로 판정 캐시를 끄고 실제 호출 부하를 건다.
+    service.llm.cache = DecisionCache(None, max_size=0, ttl=0)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+async def _probe(client: httpx.AsyncClient, payload: Dict, seconds: float) -> Dict[str, List[float]]:
+    latencies: Dict[str, List[float]] = {"/api/questions": [], "/api/recommend": []}
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for path in latencies:
+            start = time.perf_counter()
+            if path == "/api/questions":
+                r = await client.get(path)
+            else:
+                r = await client.post(path, json=payload)
+            r.raise_for_status()
+            latencies[path].append(time.perf_counter() - start)
+        await asyncio.sleep(0.01)
+    return latencies
+
+
+async def _fallback_worker(client: httpx.AsyncClient, payload: Dict, stop: asyncio.Event, out: List):
+    while not stop.is_set():
+        start = time.perf_counter()
+        r = await client.post("/api/recommend/llm-fallback", json={**payload, "force": True})
+        out.append((time.perf_counter() - start, r.json().get("used_llm")))
+
+
+def _report(label: str, latencies: Dict[str, List[float]]) -> None:
+    for path, values in latencies.items():
+        ms = np.array(values) * 1000
+        print(
+            f"{label:<10} {path:<16} n={len(ms):4d}  p50={np.percentile(ms, 50):7.1f} ms"
+            f"  p95={np.percentile(ms, 95):7.1f} ms"
+        )
+
+
+async def run(base_url: str, clients: int, seconds: float) -> None:
+    limits = httpx.Limits(max_connections=clients + 10)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60, limits=limits) as client:
+        qs = (await client.get("/api/questions")).json()["questions"]
+        payload = {"responses": {q["question_id"]: 3 for q in qs}}
+
+        _report("idle", await _probe(client, payload, seconds))
+
+        stop = asyncio.Event()
+        fallback: List = []
+        workers = [
+            asyncio.create_task(_fallback_worker(client, payload, stop, fallback))
+            for _ in range(clients)
+        ]
+        await asyncio.sleep(0.5)
+        loaded = await _probe(client, payload, seconds)
+        stop.set()
+        await asyncio.gather(*workers)
+        _report("saturated", loaded)
+
+        used = sum(1 for _, llm in fallback if llm)
+        ms = np.array([t for t, _ in fallback]) * 1000
+        print(
+            f"fallback   {clients} clients: {len(fallback)} calls, {used} answered by LLM, "
+            f"{len(fallback) - used} rule-based after deadline; p50={np.percentile(ms, 50):.0f} ms "
+            f"max={ms.max():.0f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=None)
+    parser.add_argument("--llm-delay", type=float, default=2.0, help="fake completion latency (s)")
+    parser.add_argument("--fallback-clients", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5.0, help="probe duration per phase")
+    args = parser.parse_args()
+
+    fake = fake_llm_server(args.llm_delay)
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{fake.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake-key"
+
+    from app import config
+
+    if args.train is not None:
+        config.TRAIN_FILE = args.train
+    print(
+        f"fake LLM delay {args.llm_delay}s, LLM_MAX_CONCURRENCY={config.LLM_MAX_CONCURRENCY}, "
+        f"LLM_CALL_TIMEOUT={config.LLM_CALL_TIMEOUT}s"
+    )
+
+    port = _free_port()
+    server = start_api(port)
+    try:
+        asyncio.run(run(f"http://127.0.0.1:{port}", args.fallback_clients, args.seconds))
+    finally:
+        server.should_exit = True
+        fake.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Prompt token counts for the LLM fallback: previous full-JSON prompt vs. compact builder.
+
+    python -m benchmarks.prompt_tokens --train ../Data/Train_train_balanced.xlsx
+
+Tied results come from the real StrategyJudge on random responses, paired with
+user profiles of growing size. Tokens are counted with tiktoken when it is
+installed, otherwise with the builder's estimator. A stub model answers each
+compact prompt, and the answer must resolve to one of the offered strategies.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.config import LLM_MAX_OUTPUT_TOKENS, LLM_PROMPT_TOKEN_BUDGET, SURVEY_FILE, TRAIN_FILE
+from app.llm_fallback import LLMFallbackRecommender
+from app.prompt_builder import TOKENIZER, build_compact_prompt, count_tokens
+from app.result_cache import DecisionCache
+from app.service import RecommendationService
+
+PROFILES = [
+    {},
+    {"grade": "2", "goal": "회화 실력 향상"},
+    {
+        "grade": "3",
+        "goal": "수능 영어 1등급",
+        "major": "자연계열",
+        "note": "발표 시간에 긴장을 많이 하고 단어 암기를 어려워함. " * 6,
+    },
+]
+
+
+def legacy_prompt(base_result: Dict, user_profile: Dict[str, str]) -> Tuple[str, str]:
+    """The full-JSON prompt the fallback used to send (max_tokens=300)."""
+    candidates = base_result.get("candidates", [])
+    strategy_pool = sorted({c["strategy_subscale"] for c in candidates})
+    system = (
+        "You are an educational strategy recommender. "
+        "Given two candidate strategies and user signal, choose one final strategy. "
+        "Return strict JSON only."
+    )
+    user = json.dumps(
+        {
+            "instruction": "Pick one strategy from strategy_pool.",
+            "strategy_pool": strategy_pool,
+            "base_result": base_result,
+            "user_profile": user_profile or {},
+            "output_schema": {
+                "recommended_strategy": "string",
+                "reason": "string",
+                "confidence": "number between 0 and 1",
+            },
+        },
+        ensure_ascii=False,
+    )
+    return system, user
+
+
+class StubModel:
+    """Answers like a well-behaved model: picks the first option, short reason."""
+
+    def chat(self, system: str, user: str) -> str:
+        return json.dumps({"pick": "A", "confidence": 0.6, "reason": "higher final score"})
+
+
+def tied_results(service: RecommendationService, n: int, seed: int = 0) -> List[Dict]:
+    ids = [q.question_id for q in service.get_short_questions()]
+    rng = random.Random(seed)
+    results: List[Dict] = []
+    while len(results) < n:
+        base = service.judge.recommend({q: rng.randint(1, 5) for q in ids})
+        if base["tie_triggered"]:
+            results.append(base)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--samples", type=int, default=300)
+    parser.add_argument("--budget", type=int, default=LLM_PROMPT_TOKEN_BUDGET)
+    args = parser.parse_args()
+
+    service = RecommendationService(survey_path=SURVEY_FILE, train_path=args.train)
+    results = tied_results(service, args.samples)
+
+    recommender = LLMFallbackRecommender(cache=DecisionCache(None, max_size=0, ttl=0))
+    recommender.gpt_api = StubModel()
+    recommender.prompt_token_budget = args.budget
+
+    print(f"tokenizer: {TOKENIZER}, prompt budget {args.budget}, samples {len(results)}")
+    for profile in PROFILES:
+        legacy = np.array([sum(map(count_tokens, legacy_prompt(r, profile))) for r in results])
+        prompts = [build_compact_prompt(r, profile, args.budget) for r in results]
+        compact = np.array([p.tokens for p in prompts])
+        assert all(p.tokens == count_tokens(p.system) + count_tokens(p.user) for p in prompts)
+
+        decisions = [recommender.decide(r, profile) for r in results]
+        assert all(d["used_llm"] and d["recommended_strategy"] in p.options for d, p in zip(decisions, prompts))
+        answer = count_tokens(StubModel().chat("", ""))
+
+        print(
+            f"profile fields={len(profile)}: legacy mean={legacy.mean():6.0f} max={legacy.max():5d} | "
+            f"compact mean={compact.mean():5.0f} max={compact.max():4d} "
+            f"({legacy.mean() / compact.mean():4.1f}x smaller) | "
+            f"answer {answer} tokens (max_tokens 300 -> {LLM_MAX_OUTPUT_TOKENS})"
+        )
+    print("\nexample compact prompt:\n" + prompts[0].system + "\n---\n" + prompts[0].user)
+
+
+if __name__ == "__main__":
+    main()
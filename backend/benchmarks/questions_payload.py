@@ -0,0 +1,79 @@
+"""``/api/questions``: per-request model serialisation vs. the pre-encoded payload.
+
+    python -m benchmarks.questions_payload --train ../Data/Train_train_balanced.xlsx
+
+The API runs in-process under uvicorn. A ``/bench/questions-legacy`` route
+rebuilds the ``SurveyQuestion`` models and serialises them through the
+response model on every hit, as ``/api/questions`` did before. The same
+keep-alive client then requests each variant sequentially: legacy, pre-encoded
+identity, pre-encoded gzip, and a revalidation with ``If-None-Match`` (304).
+Reported: latency and bytes on the wire per response body.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict
+
+import httpx
+import numpy as np
+
+from benchmarks.llm_fallback_load import _free_port, start_api
+
+
+def _time(client: httpx.Client, path: str, headers: Dict[str, str], requests: int) -> tuple:
+    latencies, size, status = [], 0, 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        with client.stream("GET", path, headers=headers) as r:
+            raw = b"".join(r.iter_raw())
+        latencies.append(time.perf_counter() - start)
+        size, status = len(raw), r.status_code
+    return np.array(latencies) * 1e6, size, status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=None)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    from app import config
+
+    if args.train is not None:
+        config.TRAIN_FILE = args.train
+    from app.main import app, service
+    from app.models import QuestionsResponse
+
+    @app.get("/bench/questions-legacy", response_model=QuestionsResponse)
+    def legacy_questions() -> QuestionsResponse:
+        model = service.model
+        qs = service.get_short_questions(model)
+        return QuestionsResponse(total_questions=len(qs), questions=qs, model_version=model.version)
+
+    port = _free_port()
+    server = start_api(port)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+            etag = client.get("/api/questions", headers={"accept-encoding": "gzip"}).headers["etag"]
+            variants = [
+                ("legacy", "/bench/questions-legacy", {"accept-encoding": "identity"}),
+                ("identity", "/api/questions", {"accept-encoding": "identity"}),
+                ("gzip", "/api/questions", {"accept-encoding": "gzip"}),
+                ("304", "/api/questions", {"accept-encoding": "gzip", "if-none-match": etag}),
+            ]
+            print(f"{args.requests} sequential keep-alive requests per variant, model {service.model_version}")
+            for name, path, headers in variants:
+                _time(client, path, headers, 50)
+                us, size, status = _time(client, path, headers, args.requests)
+                print(
+                    f"{name:<9} {status} | p50 {np.median(us):6.0f} us p99 {np.percentile(us, 99):6.0f} us | "
+                    f"{size:6d} body bytes"
+                )
+    finally:
+        server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Per-call CPU time of StrategyJudge.recommend with the compiled scoring kernel.
+
+    python -m benchmarks.recommend_kernel --train ../Data/Train_train_balanced.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+from app.config import SURVEY_FILE, TRAIN_FILE
+from app.service import RecommendationService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--survey", type=Path, default=SURVEY_FILE)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--calls", type=int, default=20_000)
+    args = parser.parse_args()
+
+    judge = RecommendationService(survey_path=args.survey, train_path=args.train).judge
+    rng = random.Random(0)
+    qids = list(judge.kernel.column)
+    payloads = [{q: rng.randint(1, 5) for q in qids} for _ in range(256)]
+
+    start = time.perf_counter()
+    for i in range(args.calls):
+        judge._user_subscale_scores(payloads[i % len(payloads)])
+    score_us = (time.perf_counter() - start) / args.calls * 1e6
+
+    start = time.perf_counter()
+    for i in range(args.calls):
+        judge.recommend(payloads[i % len(payloads)])
+    recommend_us = (time.perf_counter() - start) / args.calls * 1e6
+
+    print(f"short-form items      : {len(qids)}")
+    print(f"subscale scoring      : {score_us:7.1f} us/call")
+    print(f"full recommend()      : {recommend_us:7.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
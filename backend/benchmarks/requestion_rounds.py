@@ -0,0 +1,183 @@
+"""Simulate tie-break sessions over training respondents: random vs. information-gain re-questions.
+
+    python -m benchmarks.requestion_rounds --train ../Data/Train_train_balanced.xlsx
+
+Respondents are split; the judge and the selector ranking are fitted on the
+first part and sessions are replayed for the held-out part. Each respondent
+answers the short form and every re-question with their real training answers.
+A session ends when the result is no longer tied or after MAX_REQUESTION_ROUNDS.
+"Agrees" means the final strategy is the one of the two candidates that the
+respondent actually scored higher on in the Strategy sheet, and "held-out r"
+is the mean correlation of each asked item with the candidates' strategy-score
+difference, recomputed on the held-out respondents.
+
+Re-question answers only move the correlation scores, so a tie raised by the
+subscale-score gap alone can never clear; "resolved" is reported over the ties
+that re-questions can clear, agreement over all tied sessions.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from app.config import MAX_REQUESTION_ROUNDS, SURVEY_FILE, TIE_GAP_THRESHOLD, TRAIN_FILE
+from app.requestion_selector import RequestionSelector
+from app.service import RecommendationService
+from app.strategy_judge import StrategyJudge
+
+
+def split_sheets(sheets: Dict[str, pd.DataFrame], holdout: float, seed: int):
+    ids = sheets["EQ"]["참여자"].to_numpy()
+    rng = np.random.default_rng(seed)
+    test_ids = set(rng.choice(ids, size=int(len(ids) * holdout), replace=False).tolist())
+
+    def part(test: bool) -> Dict[str, pd.DataFrame]:
+        return {
+            name: df[df["참여자"].isin(test_ids) == test].reset_index(drop=True)
+            for name, df in sheets.items()
+        }
+
+    return part(False), part(True)
+
+
+def answer_lookup(sheets: Dict[str, pd.DataFrame]) -> Dict[int, Dict[str, float]]:
+    answers: Dict[int, Dict[str, float]] = {}
+    for scale in ("EQ", "FLA"):
+        frame = sheets[scale].set_index("참여자")
+        for pid, row in zip(frame.index, frame.to_dict("records")):
+            answers.setdefault(int(pid), {}).update(
+                {f"{scale}-{num}": float(v) for num, v in row.items() if pd.notna(v)}
+            )
+    return answers
+
+
+def simulate(
+    judge: StrategyJudge,
+    short_ids: List[str],
+    answers: Dict[int, Dict[str, float]],
+    strategy_scores: pd.DataFrame,
+    pick_pair: Callable[[str, str, List[str]], List[str]],
+    held_out_r: Callable[[str, str, str], float | None],
+) -> Dict[str, float]:
+    rounds: List[int] = []
+    asked_r: List[float] = []
+    first_r: List[float] = []
+    resolvable = resolved = agrees = 0
+    for pid, given in answers.items():
+        responses = {q: given[q] for q in short_ids if q in given}
+        try:
+            result = judge.recommend(responses)
+        except (ValueError, KeyError):
+            continue
+        if not result["tie_triggered"]:
+            continue
+        tie: Dict[str, List[float]] = {"EQ": [], "FLA": []}
+        used: List[str] = []
+        n = 0
+        while result["tie_triggered"] and n < MAX_REQUESTION_ROUNDS:
+            picks = pick_pair(result["top_eq_subscale"], result["top_fla_subscale"], used)
+            if not picks:
+                break
+            for qid in picks:
+                used.append(qid)
+                r = held_out_r(qid, result["top_eq_subscale"], result["top_fla_subscale"])
+                if r is not None:
+                    asked_r.append(r)
+                    if n == 0:
+                        first_r.append(r)
+                if qid in given:
+                    tie[qid.split("-")[0]].append(given[qid])
+            n += 1
+            result = judge.recommend(responses, tie)
+        rounds.append(n)
+        c_eq, c_fla = result["candidates"]
+        if abs(c_eq["user_subscale_score"] - c_fla["user_subscale_score"]) >= TIE_GAP_THRESHOLD:
+            resolvable += 1
+            resolved += not result["tie_triggered"]
+        candidates = [c["strategy_subscale"] for c in result["candidates"]]
+        if pid in strategy_scores.index:
+            truth = strategy_scores.loc[pid, candidates].astype(float)
+            agrees += result["recommended_strategy"] == truth.idxmax()
+    tied = len(rounds)
+    return {
+        "tied_sessions": tied,
+        "mean_rounds": float(np.mean(rounds)) if rounds else 0.0,
+        "resolvable": resolvable,
+        "resolved": resolved / resolvable if resolvable else 0.0,
+        "agrees": agrees / tied if tied else 0.0,
+        "asked_r": float(np.mean(asked_r)) if asked_r else 0.0,
+        "first_r": float(np.mean(first_r)) if first_r else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--holdout", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--random-runs", type=int, default=5)
+    args = parser.parse_args()
+
+    service = RecommendationService(survey_path=SURVEY_FILE, train_path=args.train)
+    fit, test = split_sheets(service.train_sheets, args.holdout, args.seed)
+    judge = StrategyJudge(fit, service.short_questions, service.subscale_map)
+    selector = RequestionSelector(judge, service.removed_by_subscale, service.all_items)
+
+    short_ids = [q["question_id"] for s in ("EQ", "FLA") for q in service.short_questions[s]]
+    answers = answer_lookup(test)
+    test_judge = StrategyJudge(test, service.short_questions, service.subscale_map)
+    test_strategy = test_judge.strategy_scores
+    # 평가용 판별력은 재생 집단에서 다시 계산한다 (표본 내 순위가 아닌 표본 밖 r).
+    held_out = RequestionSelector(test_judge, service.removed_by_subscale, service.all_items).discrimination
+    pools = service.removed_by_subscale
+
+    def held_out_r(qid: str, eq_sub: str, fla_sub: str) -> float | None:
+        scale = qid.split("-")[0]
+        own, opp = (eq_sub, fla_sub) if scale == "EQ" else (fla_sub, eq_sub)
+        key = (scale, selector._own(scale, own), selector._own("FLA" if scale == "EQ" else "EQ", opp))
+        r = held_out.get(key, {}).get(qid)
+        return None if r is None or np.isnan(r) else r
+
+    def info_gain(eq_sub: str, fla_sub: str, used: List[str]) -> List[str]:
+        picks = [selector.pick("EQ", eq_sub, fla_sub, used), selector.pick("FLA", fla_sub, eq_sub, used)]
+        return [q for q in picks if q is not None]
+
+    def random_picker(rng: random.Random):
+        def pick(eq_sub: str, fla_sub: str, used: List[str]) -> List[str]:
+            out = []
+            for scale, sub in (("EQ", eq_sub), ("FLA", fla_sub)):
+                pool = [q for q in pools[scale].get(sub, []) if q not in used] or [
+                    q for arr in pools[scale].values() for q in arr if q not in used
+                ]
+                if pool:
+                    out.append(rng.choice(pool))
+            return out
+
+        return pick
+
+    print(
+        f"fit on {len(fit['EQ'])} respondents, replay {len(answers)} held-out, "
+        f"max {MAX_REQUESTION_ROUNDS} rounds"
+    )
+    runs = [
+        simulate(judge, short_ids, answers, test_strategy, random_picker(random.Random(args.seed + k)), held_out_r)
+        for k in range(args.random_runs)
+    ]
+    rows = {
+        f"random (mean of {args.random_runs})": {k: float(np.mean([r[k] for r in runs])) for k in runs[0]},
+        "info_gain": simulate(judge, short_ids, answers, test_strategy, info_gain, held_out_r),
+    }
+    for name, m in rows.items():
+        print(
+            f"{name:<18} tied={m['tied_sessions']:4.0f} (clearable {m['resolvable']:4.0f})  rounds/session={m['mean_rounds']:.2f}  "
+            f"resolved={m['resolved']:6.1%}  agrees={m['agrees']:6.1%}  held-out r round 1={m['first_r']:+.3f} all={m['asked_r']:+.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Time ItemBuilder._select_diverse on a large synthetic subscale.
+
+    python -m benchmarks.select_diverse --items 3000 --quota 300
+
+The legacy selector below reproduces the previous dense TF-IDF / dense cosine /
+generator-loop implementation so both can be timed and checked for equality.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.config import SIMILARITY_THRESHOLD
+from app.data_loader import ItemMeta
+from app.item_builder import ItemBuilder
+
+def synthetic_items(n_items: int, vocab_size: int = 4000, seed: int = 0) -> List[ItemMeta]:
+    rng = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주"
+    vocab = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(vocab_size)]
+    weights = [1 / (rank + 1) for rank in range(vocab_size)]
+    return [
+        ItemMeta(
+            scale="EQ",
+            item_number=i + 1,
+            subscale="synthetic",
+            text=" ".join(rng.choices(vocab, weights=weights, k=rng.randint(5, 12))),
+        )
+        for i in range(n_items)
+    ]
+
+
+def legacy_select(items: List[ItemMeta], quota: int) -> List[ItemMeta]:
+    if len(items) <= quota:
+        return list(items)
+    embeddings = TfidfVectorizer(ngram_range=(1, 2)).fit_transform([i.text for i in items]).toarray()
+    sim = cosine_similarity(embeddings)
+    selected_idx: List[int] = []
+    for idx in range(len(items)):
+        if len(selected_idx) >= quota:
+            break
+        if not selected_idx or max(sim[idx, j] for j in selected_idx) < SIMILARITY_THRESHOLD:
+            selected_idx.append(idx)
+    if len(selected_idx) < quota:
+        remaining = [i for i in range(len(items)) if i not in selected_idx]
+        scores = sorted(((min(1 - sim[i, j] for j in selected_idx), i) for i in remaining), reverse=True)
+        selected_idx.extend(i for _, i in scores[: quota - len(selected_idx)])
+    return [items[i] for i in sorted(selected_idx[:quota])]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=3000)
+    parser.add_argument("--quota", type=int, default=300)
+    args = parser.parse_args()
+
+    items = synthetic_items(args.items)
+    builder = ItemBuilder({i.question_id: i for i in items}, {"EQ": items, "FLA": []}, {})
+
+    start = time.perf_counter()
+    new = builder._select_diverse(items, args.quota)
+    new_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    old = legacy_select(items, args.quota)
+    old_time = time.perf_counter() - start
+
+    assert [i.question_id for i in new] == [i.question_id for i in old]
+    print(f"items / quota       : {args.items} / {args.quota}")
+    print(f"legacy dense select : {old_time * 1000:9.1f} ms")
+    print(f"sparse select       : {new_time * 1000:9.1f} ms")
+    print(f"speedup             : {old_time / new_time:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
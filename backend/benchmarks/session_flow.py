@@ -0,0 +1,123 @@
+"""Survey flow cost: stateless endpoints (full payload every call) vs. server-side sessions.
+
+    python -m benchmarks.session_flow --train ../Data/Train_train_balanced.xlsx
+
+Each simulated respondent answers the short form one item at a time (random
+order) and asks for the current recommendation after every answer, then runs
+the tie-break rounds (requestion + recommend) and one LLM fallback call. The stateless flow resends
+``responses``/``tie_breaker_answers``/``used_question_ids`` and rescores every
+subscale on each call; the session flow posts one answer and reads the running
+totals. Service methods are timed in-process (no HTTP), and request bytes are the
+JSON bodies each flow would send. The LLM call itself is not timed.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from app.config import MAX_REQUESTION_ROUNDS, SESSION_STORE_SIZE, SESSION_TTL, SURVEY_FILE, TRAIN_FILE
+from app.service import RecommendationService
+from app.sessions import MemorySessionStore, SQLiteSessionStore
+
+
+def _size(payload: Dict) -> int:
+    return len(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+
+
+def _current(recommend) -> Dict | None:
+    # 두 척도 문항이 모두 모이기 전에는 추천이 400이므로 그 호출도 그대로 비용에 넣는다.
+    try:
+        return recommend()
+    except ValueError:
+        return None
+
+
+def stateless_flow(service: RecommendationService, short_ids: List[str], rng: random.Random) -> tuple:
+    sent = 0
+    responses: Dict[str, float] = {}
+    start = time.perf_counter()
+    for qid in short_ids:
+        responses[qid] = float(rng.randint(1, 5))
+        sent += _size({"responses": responses})
+        result = _current(lambda: service.judge.recommend(responses))
+    tie: Dict[str, List[float]] = {"EQ": [], "FLA": []}
+    used: List[str] = []
+    for _ in range(MAX_REQUESTION_ROUNDS):
+        payload = {
+            "eq_subscale": result["top_eq_subscale"],
+            "fla_subscale": result["top_fla_subscale"],
+            "used_question_ids": used,
+        }
+        sent += _size(payload)
+        for q in service.get_requestion_pair(payload["eq_subscale"], payload["fla_subscale"], used):
+            used.append(q.question_id)
+            tie[q.scale].append(float(rng.randint(1, 5)))
+        sent += _size({"responses": responses, "tie_breaker_answers": tie})
+        result = service.judge.recommend(responses, tie)
+    sent += _size({"responses": responses, "tie_breaker_answers": tie, "user_profile": {}, "force": True})
+    service.judge.recommend(responses, tie)
+    return time.perf_counter() - start, sent
+
+
+def session_flow(service: RecommendationService, short_ids: List[str], rng: random.Random) -> tuple:
+    sent = 0
+    start = time.perf_counter()
+    session_id = service.create_session()["session_id"]
+    for qid in short_ids:
+        value = float(rng.randint(1, 5))
+        sent += _size({"question_id": qid, "value": value})
+        service.session_answer(session_id, qid, value)
+        _current(lambda: service.session_recommend(session_id))
+    for _ in range(MAX_REQUESTION_ROUNDS):
+        for q in service.session_requestion(session_id):
+            value = float(rng.randint(1, 5))
+            sent += _size({"question_id": q.question_id, "value": value})
+            service.session_answer(session_id, q.question_id, value)
+        service.session_recommend(session_id)
+    sent += _size({"user_profile": {}, "force": True})
+    service.session_recommend(session_id)
+    return time.perf_counter() - start, sent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--respondents", type=int, default=200)
+    args = parser.parse_args()
+
+    service = RecommendationService(survey_path=SURVEY_FILE, train_path=args.train)
+    short_ids = [q.question_id for q in service.get_short_questions()]
+    stores = {
+        "memory": MemorySessionStore(SESSION_STORE_SIZE, SESSION_TTL),
+        "sqlite": SQLiteSessionStore(Path(tempfile.mkdtemp()) / "sessions.sqlite3", SESSION_STORE_SIZE, SESSION_TTL),
+    }
+    calls = len(short_ids) + 2 * MAX_REQUESTION_ROUNDS + 1
+    print(f"{args.respondents} respondents x {len(short_ids)} answers + {MAX_REQUESTION_ROUNDS} tie-break rounds")
+
+    flows = [("stateless", stateless_flow, None)] + [(f"session/{k}", session_flow, v) for k, v in stores.items()]
+    for name, flow, store in flows:
+        if store is not None:
+            service.sessions = store
+        times, sizes = [], []
+        for i in range(args.respondents):
+            rng = random.Random(i)
+            order = rng.sample(short_ids, len(short_ids))
+            elapsed, sent = flow(service, order, rng)
+            times.append(elapsed)
+            sizes.append(sent)
+        ms = np.array(times) * 1000
+        print(
+            f"{name:<15} {ms.mean():7.2f} ms/respondent ({ms.mean() / calls * 1000:6.1f} us/call) | "
+            f"{np.mean(sizes) / 1024:6.1f} KiB sent/respondent"
+        )
+
+
+if __name__ == "__main__":
+    main()
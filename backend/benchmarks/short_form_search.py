@@ -0,0 +1,50 @@
+"""Compare the greedy alpha repair against the batched swap search.
+
+    python -m benchmarks.short_form_search --train ../Data/Train_train_balanced.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from app.config import SURVEY_FILE, TARGET_SHORT_ITEMS, TRAIN_FILE
+from app.data_loader import DataLoader
+from app.item_builder import ItemBuilder
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--survey", type=Path, default=SURVEY_FILE)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--beams", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    loader = DataLoader(args.survey, args.train)
+    all_items, grouped, _ = loader.build_item_bank()
+    train = loader.load_train_sheets()
+
+    for scale in ("EQ", "FLA"):
+        builder = ItemBuilder(all_items, grouped, train)
+        target = TARGET_SHORT_ITEMS[scale]
+        groups = builder._group_by_subscale(grouped[scale])
+        quotas = builder._allocate_quotas(groups, target)
+        start_set = [
+            item for sub, items in groups.items() for item in builder._select_diverse(items, quotas[sub])
+        ]
+        start_set = builder._enforce_target_count(start_set, groups, target)
+
+        print(f"[{scale}] start alpha {builder._compute_alpha(scale, start_set):.4f}")
+        t0 = time.perf_counter()
+        greedy = builder._repair_alpha(scale, start_set, groups, target)
+        elapsed = time.perf_counter() - t0
+        print(f"  greedy repair      alpha {builder._compute_alpha(scale, greedy):.4f}  {elapsed * 1000:8.1f} ms")
+        for beam in args.beams:
+            t0 = time.perf_counter()
+            found = builder._swap_search(scale, start_set, beam_width=beam, time_budget=60.0)
+            elapsed = time.perf_counter() - t0
+            print(f"  swap search beam={beam:<3} alpha {builder._compute_alpha(scale, found):.4f}  {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare Excel (openpyxl) loading against the .npz sheet snapshot.
+
+    python -m benchmarks.snapshot_load --train ../Data/Train_train_balanced.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app import data_loader
+from app.config import SURVEY_FILE, TRAIN_FILE
+from app.data_loader import DataLoader
+
+
+def _load_all(loader: DataLoader) -> dict:
+    return {
+        "survey": loader.load_survey_sheets(),
+        "subscale": loader.load_subscale_sheets(),
+        "train": loader.load_train_sheets(),
+    }
+
+
+def _timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--survey", type=Path, default=SURVEY_FILE)
+    parser.add_argument("--train", type=Path, default=TRAIN_FILE)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="snapshot-bench-"))
+    original_dir = data_loader.SNAPSHOT_DIR
+    data_loader.SNAPSHOT_DIR = tmp_dir
+    try:
+        excel = DataLoader(args.survey, args.train, use_snapshot=False)
+        snap = DataLoader(args.survey, args.train, use_snapshot=True)
+
+        excel_time = _timed(lambda: _load_all(excel), args.repeat)
+        start = time.perf_counter()
+        expected = _load_all(snap)
+        first_time = time.perf_counter() - start
+        snap_time = _timed(lambda: _load_all(snap), args.repeat)
+
+        actual = _load_all(snap)
+        for group, sheets in expected.items():
+            for name, df in sheets.items():
+                pd.testing.assert_frame_equal(df, actual[group][name])
+
+        size = sum(p.stat().st_size for p in tmp_dir.iterdir())
+        print(f"excel (openpyxl)        : {excel_time * 1000:9.1f} ms")
+        print(f"snapshot build (1st run): {first_time * 1000:9.1f} ms")
+        print(f"snapshot load           : {snap_time * 1000:9.1f} ms")
+        print(f"speedup                 : {excel_time / snap_time:9.1f}x")
+        print(f"snapshot size on disk   : {size / 1024:9.1f} KiB")
+    finally:
+        data_loader.SNAPSHOT_DIR = original_dir
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""API worker start-up: import time and time-to-first-request, rebuild vs. prebuilt artifact.
+
+    python -m benchmarks.startup --train ../Data/Train_train_balanced.xlsx
+
+Each run starts a fresh ``uvicorn`` process serving ``app.main`` and polls
+``/api/questions`` until the first 200. Reported per path: time to import
+``app.main`` (which constructs the service), time from process spawn to the
+first answered request, and which heavy modules the worker ended up loading.
+
+- ``no cache``: ``SERVING_ARTIFACT_DIR = None``, the service is built on every start.
+- ``rebuild``: empty artifact directory, so the worker builds and writes the artifact.
+- ``prebuilt``: the artifact written by the previous run matches and is attached.
+
+Warm Excel snapshot and ItemBuilder caches are used by the building paths, as in
+normal restarts.
+"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+HEAVY = ("pandas", "scipy", "sklearn", "openpyxl", "openai")
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def child(train: Path, prebuilt_dir: str, port: int) -> None:
+    start = time.perf_counter()
+    import app.config as config
+
+    config.TRAIN_FILE = train
+    config.SERVING_ARTIFACT_DIR = Path(prebuilt_dir) if prebuilt_dir else None
+    from app.main import app
+
+    imported = time.perf_counter() - start
+    print(json.dumps({"import": imported, "heavy": [m for m in HEAVY if m in sys.modules]}), flush=True)
+
+    import uvicorn
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def run_once(train: Path, prebuilt_dir: Path | None) -> Dict:
+    port = _free_port()
+    start = time.perf_counter()
+    command = [sys.executable, "-m", "benchmarks.startup", "--child", "--train", str(train)]
+    command += ["--prebuilt-dir", str(prebuilt_dir or ""), "--port", str(port)]
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise RuntimeError("API worker exited before serving a request.")
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            try:
+                conn.request("GET", "/api/questions")
+                if conn.getresponse().status == 200:
+                    break
+            except OSError:
+                time.sleep(0.01)
+            finally:
+                conn.close()
+        first_request = time.perf_counter() - start
+        stats = json.loads(proc.stdout.readline())
+    finally:
+        proc.terminate()
+        proc.wait()
+    return {**stats, "first_request": first_request}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, required=True)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--prebuilt-dir", default="", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.train, args.prebuilt_dir, args.port)
+        return
+
+    runs: Dict[str, list] = {"no cache": [], "rebuild": [], "prebuilt": []}
+    for _ in range(args.repeats):
+        prebuilt_dir = Path(tempfile.mkdtemp())
+        runs["no cache"].append(run_once(args.train, None))
+        runs["rebuild"].append(run_once(args.train, prebuilt_dir))
+        runs["prebuilt"].append(run_once(args.train, prebuilt_dir))
+        shutil.rmtree(prebuilt_dir, ignore_errors=True)
+
+    print(f"{args.repeats} fresh uvicorn processes per path")
+    for name, stats in runs.items():
+        imported = np.mean([s["import"] for s in stats])
+        first = np.mean([s["first_request"] for s in stats])
+        print(
+            f"{name:<9} import app.main {imported:5.2f} s | first /api/questions {first:5.2f} s after spawn | "
+            f"heavy modules: {', '.join(stats[0]['heavy']) or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Per-worker startup time and memory: building the service vs. attaching the serving artifact.
+
+    python -m benchmarks.worker_attach --train ../Data/Train_train_balanced.xlsx --workers 4
+
+Starts ``--workers`` fresh processes (spawn, like separate uvicorn workers) for
+each mode. Each one constructs ``RecommendationService`` and reports its start-up
+time and memory from /proc/self/smaps_rollup while all workers are alive; PSS
+splits shared pages between the processes that map them. The artifact is
+exported once beforehand (warm Excel snapshot and ItemBuilder caches are used by
+the build mode as in normal restarts).
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+HEAVY = ("pandas", "scipy", "sklearn", "openpyxl")
+
+
+def _memory() -> Dict[str, float]:
+    values: Dict[str, float] = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                values[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    values["Private"] = values.pop("Private_Clean", 0.0) + values.pop("Private_Dirty", 0.0)
+    return values
+
+
+def _worker(train: str, artifact: str | None, ready, release, results) -> None:
+    start = time.perf_counter()
+    from app.config import SURVEY_FILE
+    from app.service import RecommendationService
+
+    service = RecommendationService(
+        survey_path=SURVEY_FILE, train_path=Path(train), artifact_path=Path(artifact) if artifact else None
+    )
+    service.recommend({q.question_id: 3 for q in service.get_short_questions()}, None)
+    elapsed = time.perf_counter() - start
+    ready.wait()
+    results.put({"seconds": elapsed, **_memory(), "heavy": [m for m in HEAVY if m in sys.modules]})
+    release.wait()
+
+
+def run(train: Path, artifact: Path | None, workers: int) -> list:
+    ctx = mp.get_context("spawn")
+    ready, release, results = ctx.Barrier(workers + 1), ctx.Event(), ctx.Queue()
+    procs = [
+        ctx.Process(target=_worker, args=(str(train), str(artifact) if artifact else None, ready, release, results))
+        for _ in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    ready.wait()
+    stats = [results.get() for _ in procs]
+    release.set()
+    for p in procs:
+        p.join()
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--train", type=Path, required=True)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    from app.config import SURVEY_FILE
+    from app.service import RecommendationService
+
+    artifact = Path(tempfile.mkdtemp()) / "serving.artifact"
+    RecommendationService(survey_path=SURVEY_FILE, train_path=args.train).export_artifact(artifact)
+    print(f"artifact {artifact.stat().st_size / 1024:.0f} KiB, {args.workers} workers")
+
+    for name, path in (("build", None), ("attach", artifact)):
+        stats = run(args.train, path, args.workers)
+
+        def mean(key: str) -> float:
+            return sum(s[key] for s in stats) / len(stats)
+
+        print(
+            f"{name:<7} start-up {mean('seconds'):5.2f} s/worker | RSS {mean('Rss'):6.1f} MiB/worker, "
+            f"private {mean('Private'):6.1f} MiB/worker, total PSS {sum(s['Pss'] for s in stats):7.1f} MiB | "
+            f"heavy modules: {stats[0]['heavy'] or 'none'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,9 @@
 import { useEffect, useMemo, useState } from "react";
 import {
-  fetchLLMFallbackRecommendation,
   fetchQuestions,
   fetchRecommendation,
-  fetchRequestion
+  fetchRequestion,
+  streamLLMFallbackRecommendation
 } from "./api";
 import { LikertQuestion } from "./components/LikertQuestion";
 import { RequestionModal } from "./components/RequestionModal";
@@ -211,15 +211,31 @@ function App() {
         setShowResultPage(false);
         setModalOpen(req.questions.length > 0);
       } else if (rec.tie_triggered && requestionRound >= requestionMax) {
-        const llm = await fetchLLMFallbackRecommendation({
-          responses,
-          tie_breaker_answers: currentTieHistory,
-          user_profile: {
-            name: profile.name,
-            education: profile.education,
-            age: profile.age
+        // 규칙 기반 결과를 먼저 보여주고, LLM 근거가 도착하는 대로 이어 붙인다.
+        let reasoning = "";
+        const llm = await streamLLMFallbackRecommendation(
+          {
+            responses,
+            tie_breaker_answers: currentTieHistory,
+            user_profile: {
+              name: profile.name,
+              education: profile.education,
+              age: profile.age
+            }
+          },
+          {
+            onRule: ({ decision }) => {
+              setLlmResult(decision);
+              setModalOpen(false);
+              setTieNotice(null);
+              setShowResultPage(true);
+            },
+            onReasoning: (text) => {
+              reasoning += text;
+              setLlmResult((prev) => (prev ? { ...prev, reason: reasoning } : prev));
+            }
           }
-        });
+        );
         setLlmResult(llm);
         setResult((prev) =>
           prev
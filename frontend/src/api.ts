@@ -1,8 +1,11 @@
 import type {
+  AdaptiveResponse,
   LLMFallbackResponse,
+  LLMFallbackStreamHandlers,
   QuestionsResponse,
   RecommendResponse,
-  RequestionResponse
+  RequestionResponse,
+  SessionResponse
 } from "./types";
 
 const API_BASE = "http://localhost:8000/api";
@@ -40,6 +43,18 @@ export async function fetchRequestion(payload: {
   return res.json();
 }
 
+export async function fetchAdaptiveNext(payload: {
+  responses: Record<string, number>;
+}): Promise<AdaptiveResponse> {
+  const res = await fetch(`${API_BASE}/adaptive/next`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload)
+  });
+  if (!res.ok) throw new Error("다음 문항을 불러오지 못했습니다.");
+  return res.json();
+}
+
 export async function fetchLLMFallbackRecommendation(payload: {
   responses: Record<string, number>;
   tie_breaker_answers?: Record<string, number[]>;
@@ -54,3 +69,98 @@ export async function fetchLLMFallbackRecommendation(payload: {
   if (!res.ok) throw new Error("LLM 보완 추천을 불러오지 못했습니다.");
   return res.json();
 }
+
+// SSE 스트림: 규칙 기반 결과(rule)가 먼저 오고, LLM 근거(reasoning)가 조각으로 온 뒤 최종 결정(decision)으로 끝난다.
+export async function streamLLMFallbackRecommendation(
+  payload: {
+    responses: Record<string, number>;
+    tie_breaker_answers?: Record<string, number[]>;
+    user_profile?: Record<string, string>;
+    force?: boolean;
+  },
+  handlers: LLMFallbackStreamHandlers = {}
+): Promise<LLMFallbackResponse> {
+  const res = await fetch(`${API_BASE}/recommend/llm-fallback/stream`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json", Accept: "text/event-stream" },
+    body: JSON.stringify(payload)
+  });
+  if (!res.ok || !res.body) throw new Error("LLM 보완 추천을 불러오지 못했습니다.");
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let decision: LLMFallbackResponse | null = null;
+
+  const handleFrame = (frame: string): LLMFallbackResponse | undefined => {
+    let event = "message";
+    const data: string[] = [];
+    for (const line of frame.split("\n")) {
+      if (line.startsWith("event:")) event = line.slice(6).trim();
+      else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+    }
+    if (data.length === 0) return undefined;
+    const parsed = JSON.parse(data.join("\n"));
+    if (event === "rule") handlers.onRule?.(parsed);
+    else if (event === "reasoning") handlers.onReasoning?.(parsed.text);
+    else if (event === "decision") return parsed;
+    return undefined;
+  };
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value, { stream: !done });
+    const frames = buffer.replace(/\r\n/g, "\n").split("\n\n");
+    buffer = done ? "" : frames.pop() ?? "";
+    for (const frame of frames) {
+      if (frame.trim()) decision = handleFrame(frame) ?? decision;
+    }
+    if (done) break;
+  }
+  if (!decision) throw new Error("LLM 보완 추천을 불러오지 못했습니다.");
+  return decision;
+}
+
+export async function createSession(): Promise<SessionResponse> {
+  const res = await fetch(`${API_BASE}/sessions`, { method: "POST" });
+  if (!res.ok) throw new Error("설문 세션을 만들지 못했습니다.");
+  return res.json();
+}
+
+export async function postSessionAnswer(
+  sessionId: string,
+  payload: { question_id: string; value: number }
+): Promise<SessionResponse> {
+  const res = await fetch(`${API_BASE}/sessions/${sessionId}/answers`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload)
+  });
+  if (!res.ok) throw new Error("응답을 저장하지 못했습니다.");
+  return res.json();
+}
+
+export async function fetchSessionRecommendation(sessionId: string): Promise<RecommendResponse> {
+  const res = await fetch(`${API_BASE}/sessions/${sessionId}/recommend`);
+  if (!res.ok) throw new Error("추천 결과를 불러오지 못했습니다.");
+  return res.json();
+}
+
+export async function fetchSessionRequestion(sessionId: string): Promise<RequestionResponse> {
+  const res = await fetch(`${API_BASE}/sessions/${sessionId}/requestion`);
+  if (!res.ok) throw new Error("재질문을 불러오지 못했습니다.");
+  return res.json();
+}
+
+export async function fetchSessionLLMFallback(
+  sessionId: string,
+  payload: { user_profile?: Record<string, string>; force?: boolean }
+): Promise<LLMFallbackResponse> {
+  const res = await fetch(`${API_BASE}/sessions/${sessionId}/llm-fallback`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify(payload)
+  });
+  if (!res.ok) throw new Error("LLM 보완 추천을 불러오지 못했습니다.");
+  return res.json();
+}
@@ -14,6 +14,7 @@ export interface SurveyQuestion {
 export interface QuestionsResponse {
   total_questions: number;
   questions: SurveyQuestion[];
+  model_version: string;
 }
 
 export interface StrategyCandidate {
@@ -36,11 +37,33 @@ export interface RecommendResponse {
   eq_scores: Record<string, number>;
   fla_scores: Record<string, number>;
   strategy_ranking: { strategy_subscale: string; score: number }[];
+  model_version: string;
 }
 
 export interface RequestionResponse {
   round_limit: number;
   questions: SurveyQuestion[];
+  model_version: string;
+}
+
+export interface AdaptiveResponse {
+  done: boolean;
+  question: SurveyQuestion | null;
+  answered: number;
+  max_items: number;
+  predicted_strategy: string | null;
+  confidence: number;
+  model_version: string;
+  result: RecommendResponse | null;
+}
+
+export interface SessionResponse {
+  session_id: string;
+  answered: number;
+  short_form_items: number;
+  tie_breaker_answers: Record<string, number[]>;
+  used_question_ids: string[];
+  model_version: string;
 }
 
 export interface LLMFallbackResponse {
@@ -51,4 +74,15 @@ export interface LLMFallbackResponse {
   used_llm: boolean;
   base_tie_triggered: boolean;
   base_score_gap: number;
+  model_version: string;
+}
+
+export interface LLMFallbackRuleEvent {
+  result: RecommendResponse;
+  decision: LLMFallbackResponse;
+}
+
+export interface LLMFallbackStreamHandlers {
+  onRule?: (event: LLMFallbackRuleEvent) => void;
+  onReasoning?: (text: string) => void;
 }